@@ -0,0 +1,67 @@
+"""cascade_word_and_meaning_deletes
+
+Revision ID: 0d8c4b6f2a15
+Revises: f3a96c1e7b58
+Create Date: 2026-10-17 20:31:56.408273
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0d8c4b6f2a15'
+down_revision: Union[str, None] = 'f3a96c1e7b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The foreign keys of each table that cascade, as (column, referred table).
+CASCADES = {
+    'meanings': [('sanskrit_word_id', 'sanskrit_words')],
+    **{
+        table: [('sanskrit_word_id', 'sanskrit_words'), ('meaning_id', 'meanings')]
+        for table in ['etymologies', 'derivations', 'translations', 'reference_nyaya_texts', 'examples', 'synonyms', 'antonyms']
+    },
+}
+
+# The foreign keys were created unnamed; SQLite reflects them without a name, so batch mode names them by convention.
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def _replace_foreign_keys(ondelete: Union[str, None]) -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    for table, references in CASCADES.items():
+        foreign_keys = inspector.get_foreign_keys(table)
+        with op.batch_alter_table(table, naming_convention=NAMING_CONVENTION) as batch_op:
+            for foreign_key in foreign_keys:
+                name = foreign_key['name'] or NAMING_CONVENTION['fk'] % {
+                    'table_name': table,
+                    'column_0_name': foreign_key['constrained_columns'][0],
+                    'referred_table_name': foreign_key['referred_table'],
+                }
+                batch_op.drop_constraint(name, type_='foreignkey')
+            for column, referred_table in references:
+                batch_op.create_foreign_key(f'fk_{table}_{column}_{referred_table}', referred_table, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    # The cascades look the child rows up by these columns.
+    for table, references in CASCADES.items():
+        for column, _ in references:
+            if table != 'meanings':
+                op.create_index(f'ix_{table}_{column}', table, [column])
+
+    _replace_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _replace_foreign_keys(None)
+
+    for table, references in CASCADES.items():
+        for column, _ in references:
+            if table != 'meanings':
+                op.drop_index(f'ix_{table}_{column}', table_name=table)
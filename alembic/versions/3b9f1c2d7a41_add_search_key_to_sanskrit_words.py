@@ -0,0 +1,60 @@
+"""add_search_key_to_sanskrit_words
+
+Revision ID: 3b9f1c2d7a41
+Revises: e46688df4bb5
+Create Date: 2026-10-17 09:12:40.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.lang import toSearchKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c2d7a41'
+down_revision: Union[str, None] = 'e46688df4bb5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column('sanskrit_words', sa.Column('search_key', sa.String, nullable=True))
+    op.create_index('ix_sanskrit_words_search_key', 'sanskrit_words', ['search_key'])
+
+    sanskrit_words = sa.table(
+        'sanskrit_words',
+        sa.column('id', sa.Integer),
+        sa.column('sanskrit_word', sa.String),
+        sa.column('search_key', sa.String),
+    )
+
+    connection = op.get_bind()
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            sa.select(sanskrit_words.c.id, sanskrit_words.c.sanskrit_word)
+            .where(sanskrit_words.c.id > last_id)
+            .order_by(sanskrit_words.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        connection.execute(
+            sanskrit_words.update().where(sanskrit_words.c.id == sa.bindparam('word_id')).values(search_key=sa.bindparam('key')),
+            [{'word_id': row.id, 'key': toSearchKey(row.sanskrit_word)} for row in rows],
+        )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_index('ix_sanskrit_words_search_key', table_name='sanskrit_words')
+    op.drop_column('sanskrit_words', 'search_key')
@@ -0,0 +1,92 @@
+"""normalize_sanskrit_words
+
+Revision ID: 7c2e5a9d41f8
+Revises: 3b9f1c2d7a41
+Create Date: 2026-10-17 15:40:12.804117
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.lang import normalizeWord, toSearchKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2e5a9d41f8'
+down_revision: Union[str, None] = '3b9f1c2d7a41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+
+def upgrade() -> None:
+    sanskrit_words = sa.table(
+        'sanskrit_words',
+        sa.column('id', sa.Integer),
+        sa.column('sanskrit_word', sa.String),
+        sa.column('english_transliteration', sa.String),
+        sa.column('search_key', sa.String),
+    )
+
+    connection = op.get_bind()
+    last_id = 0
+    duplicates = []
+
+    while True:
+        rows = connection.execute(
+            sa.select(sanskrit_words.c.id, sanskrit_words.c.sanskrit_word, sanskrit_words.c.english_transliteration, sanskrit_words.c.search_key)
+            .where(sanskrit_words.c.id > last_id)
+            .order_by(sanskrit_words.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        changes = {}
+        for row in rows:
+            sanskrit_word = normalizeWord(row.sanskrit_word or '')
+            english_transliteration = normalizeWord(row.english_transliteration or '') or row.english_transliteration
+            change = (sanskrit_word, english_transliteration, toSearchKey(sanskrit_word))
+            if change != (row.sanskrit_word, row.english_transliteration, row.search_key):
+                changes[row.id] = change
+
+        # A row whose normalized headword is already taken by another row is a duplicate entry that has to be merged
+        # by hand; it is left as it is rather than violating the unique index.
+        originals = {row.id: row.sanskrit_word for row in rows}
+        renamed = {word_id: change[0] for word_id, change in changes.items() if change[0] != originals[word_id]}
+        taken = {
+            sanskrit_word: word_id for word_id, sanskrit_word in connection.execute(
+                sa.select(sanskrit_words.c.id, sanskrit_words.c.sanskrit_word).where(sanskrit_words.c.sanskrit_word.in_(set(renamed.values())))
+            )
+        }
+        for word_id, sanskrit_word in renamed.items():
+            if taken.setdefault(sanskrit_word, word_id) != word_id:
+                duplicates.append(word_id)
+                del changes[word_id]
+
+        if changes:
+            connection.execute(
+                sanskrit_words.update().where(sanskrit_words.c.id == sa.bindparam('word_id')).values(
+                    sanskrit_word=sa.bindparam('word'),
+                    english_transliteration=sa.bindparam('transliteration'),
+                    search_key=sa.bindparam('key'),
+                ),
+                [{'word_id': word_id, 'word': word, 'transliteration': transliteration, 'key': key} for word_id, (word, transliteration, key) in changes.items()],
+            )
+        last_id = rows[-1].id
+
+    if duplicates:
+        logger.warning("Left %d sanskrit_words un-normalized because their normalized form already exists: ids %s", len(duplicates), duplicates)
+
+
+def downgrade() -> None:
+    # Normalization is lossy; the original spellings are not kept.
+    pass
@@ -0,0 +1,60 @@
+"""refold_search_keys
+
+Revision ID: 9e4b2d7f1a63
+Revises: 0d8c4b6f2a15
+Create Date: 2026-10-17 21:14:09.532871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.lang import toSearchKey
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2d7f1a63'
+down_revision: Union[str, None] = '0d8c4b6f2a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    # The search keys now fold an anusvara or "m" before a stop into the stop's class nasal.
+    sanskrit_words = sa.table(
+        'sanskrit_words',
+        sa.column('id', sa.Integer),
+        sa.column('sanskrit_word', sa.String),
+        sa.column('search_key', sa.String),
+    )
+
+    connection = op.get_bind()
+    last_id = 0
+
+    while True:
+        rows = connection.execute(
+            sa.select(sanskrit_words.c.id, sanskrit_words.c.sanskrit_word, sanskrit_words.c.search_key)
+            .where(sanskrit_words.c.id > last_id)
+            .order_by(sanskrit_words.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+
+        if not rows:
+            break
+
+        changes = [{'word_id': row.id, 'key': key} for row in rows if (key := toSearchKey(row.sanskrit_word or '')) != row.search_key]
+        if changes:
+            connection.execute(
+                sanskrit_words.update().where(sanskrit_words.c.id == sa.bindparam('word_id')).values(search_key=sa.bindparam('key')),
+                changes,
+            )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    # The old keys are not kept; they only differ for words that the new folding merges.
+    pass
@@ -0,0 +1,25 @@
+"""index_meanings_sanskrit_word_id
+
+Revision ID: a4d8e1f63b27
+Revises: 7c2e5a9d41f8
+Create Date: 2026-10-17 17:05:48.219634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e1f63b27'
+down_revision: Union[str, None] = '7c2e5a9d41f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_meanings_sanskrit_word_id', 'meanings', ['sanskrit_word_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_meanings_sanskrit_word_id', table_name='meanings')
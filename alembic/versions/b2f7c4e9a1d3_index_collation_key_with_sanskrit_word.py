@@ -0,0 +1,29 @@
+"""index_collation_key_with_sanskrit_word
+
+Revision ID: b2f7c4e9a1d3
+Revises: 9e4b2d7f1a63
+Create Date: 2026-10-17 21:52:37.640195
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f7c4e9a1d3'
+down_revision: Union[str, None] = '9e4b2d7f1a63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Browsing orders and seeks on (collation_key, sanskrit_word); the composite index also serves lookups by
+    # collation_key alone, which the single-column index did.
+    op.create_index('ix_sanskrit_words_collation_key_sanskrit_word', 'sanskrit_words', ['collation_key', 'sanskrit_word'])
+    op.drop_index('ix_sanskrit_words_collation_key', table_name='sanskrit_words')
+
+
+def downgrade() -> None:
+    op.create_index('ix_sanskrit_words_collation_key', 'sanskrit_words', ['collation_key'])
+    op.drop_index('ix_sanskrit_words_collation_key_sanskrit_word', table_name='sanskrit_words')
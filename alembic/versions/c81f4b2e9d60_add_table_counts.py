@@ -0,0 +1,42 @@
+"""add_table_counts
+
+Revision ID: c81f4b2e9d60
+Revises: a4d8e1f63b27
+Create Date: 2026-10-17 18:22:31.660418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4b2e9d60'
+down_revision: Union[str, None] = 'a4d8e1f63b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTED_TABLES = [
+    'sanskrit_words', 'meanings', 'etymologies', 'derivations', 'translations',
+    'reference_nyaya_texts', 'examples', 'synonyms', 'antonyms',
+]
+
+
+def upgrade() -> None:
+    table_counts = op.create_table(
+        'table_counts',
+        sa.Column('table_name', sa.String(64), primary_key=True),
+        sa.Column('row_count', sa.Integer, nullable=False, default=0),
+    )
+
+    connection = op.get_bind()
+    op.bulk_insert(table_counts, [
+        {'table_name': table_name, 'row_count': connection.execute(sa.select(sa.func.count()).select_from(sa.table(table_name))).scalar()}
+        for table_name in COUNTED_TABLES
+    ])
+
+
+def downgrade() -> None:
+    op.drop_table('table_counts')
@@ -0,0 +1,29 @@
+"""add_revision_to_sanskrit_words
+
+Revision ID: e5b7a0d2c934
+Revises: c81f4b2e9d60
+Create Date: 2026-10-17 19:05:47.219830
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b7a0d2c934'
+down_revision: Union[str, None] = 'c81f4b2e9d60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('sanskrit_words', sa.Column('revision', sa.Integer(), nullable=False, server_default='1'))
+    op.add_column('sanskrit_words', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.execute(sa.text('UPDATE sanskrit_words SET updated_at = CURRENT_TIMESTAMP'))
+
+
+def downgrade() -> None:
+    op.drop_column('sanskrit_words', 'updated_at')
+    op.drop_column('sanskrit_words', 'revision')
@@ -0,0 +1,91 @@
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Hashable
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    Size-bounded LRU cache of read endpoint payloads.
+
+    Every entry belongs either to one headword (its id) or, with `word_id=None`, to the word listing as a whole.
+    Writes invalidate exactly the entries of the word they touch, plus the listing entries when the write
+    changes what the listing shows. A per-word generation counter keeps a load that raced with a write from
+    being stored.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[Hashable, tuple[int | None, Any]] = OrderedDict()
+        self.keys_by_word: dict[int | None, set[Hashable]] = defaultdict(set)
+        self.generations: dict[int | None, int] = defaultdict(int)
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _discard(self, key: Hashable) -> None:
+        word_id, _ = self.entries.pop(key)
+        self.keys_by_word[word_id].discard(key)
+        if not self.keys_by_word[word_id]:
+            del self.keys_by_word[word_id]
+
+    def get_or_set(self, key: Hashable, load: Callable[[], Any], word_id: int | None = None) -> Any:
+        """
+        Returns the cached payload for `key`, calling `load` to produce (and cache) it on a miss.
+
+        Parameters:
+            key (Hashable): The cache key, e.g. ("synonyms", word_id, meaning_id).
+            load (Callable[[], Any]): Produces the payload. It should not return ORM objects.
+            word_id (int | None): The headword the payload belongs to, or None for listing payloads.
+
+        Returns:
+            Any: The payload.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key][1]
+            generation = self.generations[word_id]
+
+        value = load()
+
+        with self.lock:
+            if self.generations[word_id] != generation:
+                return value
+
+            if key in self.entries:
+                self._discard(key)
+            self.entries[key] = (word_id, value)
+            self.keys_by_word[word_id].add(key)
+
+            while len(self.entries) > self.maxsize:
+                self._discard(next(iter(self.entries)))
+
+        return value
+
+    def invalidate_word(self, word_id: int, listing: bool = False) -> None:
+        """
+        Drops the cached payloads of a headword.
+
+        Parameters:
+            word_id (int): The id of the headword that was written.
+            listing (bool): Also drop the listing payloads (word list, counts), e.g. when a word is created,
+                renamed or deleted, or gains or loses a meaning.
+        """
+        with self.lock:
+            word_ids = [word_id, None] if listing else [word_id]
+            for invalidated_word_id in word_ids:
+                self.generations[invalidated_word_id] += 1
+                for key in list(self.keys_by_word.get(invalidated_word_id, ())):
+                    self._discard(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            for word_id in list(self.generations):
+                self.generations[word_id] += 1
+            self.entries.clear()
+            self.keys_by_word.clear()
+
+
+response_cache = ResponseCache(maxsize=settings.response_cache_size)
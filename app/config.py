@@ -15,6 +15,24 @@ class Settings(BaseSettings):
     main_database_url: str
     test_database_url: str
 
+    # Cache Config
+    response_cache_size: int = 4096
+    word_resolver_cache_size: int = 16384
+
+    # Words Config
+    words_max_page_size: int = 1000
+    words_batch_max_size: int = 500
+    words_max_neighbors: int = 50
+
+    # Search Config
+    search_batch_max_terms: int = 200
+    search_max_page_size: int = 50
+    split_max_length: int = 64
+    split_max_results: int = 20
+
+    # Roots Config
+    roots_max_page_size: int = 1000
+
     model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Maintained row counts of the dictionary tables.
+
+`COUNT(*)` on a large InnoDB table is an index scan, so the counts are kept in the `table_counts` table instead and
+read with a primary-key lookup. The table gets a row per counted table when it is created, by migration c81f4b2e9d60
+or by `create_all`, so reads never compute or store a count. Session events adjust them in the same transaction as the
+write: rows added or deleted through the ORM after every flush, and rows removed by `Query.delete()` after the
+statement. Writes that bypass the session must be accounted for explicitly: bulk `INSERT`s on a connection call
+`recount` afterwards, and deletes that the database cascades (`ON DELETE CASCADE`) call `count_cascade` before the
+delete.
+"""
+from collections import Counter
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.orm import Session
+from app import models
+
+
+COUNTED_MODELS = [
+    models.SanskritWord, models.Meaning, models.Etymology, models.Derivation, models.Translation,
+    models.ReferenceNyayaText, models.Example, models.Synonym, models.Antonym,
+]
+COUNTED_TABLES = {model.__tablename__: model for model in COUNTED_MODELS}
+
+
+@event.listens_for(models.Base.metadata, "after_create")
+def _seed_counts(metadata, connection, tables=(), **_) -> None:
+    table_counts = models.TableCount.__table__
+    if table_counts not in tables:
+        return
+
+    connection.execute(table_counts.insert(), [
+        {"table_name": table_name, "row_count": connection.execute(select(func.count()).select_from(model)).scalar()}
+        for table_name, model in COUNTED_TABLES.items()
+    ])
+
+
+def _adjust(session: Session, deltas: Counter) -> None:
+    for table_name, delta in deltas.items():
+        if delta:
+            session.query(models.TableCount).filter(models.TableCount.table_name == table_name).update(
+                {models.TableCount.row_count: models.TableCount.row_count + delta}, synchronize_session=False,
+            )
+
+
+@event.listens_for(Session, "after_flush")
+def _count_flushed_rows(session: Session, _) -> None:
+    deltas = Counter()
+    for instance in session.new:
+        if instance.__tablename__ in COUNTED_TABLES:
+            deltas[instance.__tablename__] += 1
+    for instance in session.deleted:
+        if instance.__tablename__ in COUNTED_TABLES:
+            deltas[instance.__tablename__] -= 1
+    _adjust(session, deltas)
+
+
+@event.listens_for(Session, "after_bulk_delete")
+def _count_bulk_deleted_rows(delete_context) -> None:
+    table_name = delete_context.mapper.local_table.name
+    if table_name in COUNTED_TABLES and delete_context.result.rowcount:
+        _adjust(delete_context.session, Counter({table_name: -delete_context.result.rowcount}))
+
+
+def count_cascade(db: Session, model, ids: list[int]) -> None:
+    """
+    Decrements the counts of the rows that the database deletes through `ON DELETE CASCADE` when the `model` rows with
+    `ids` are deleted, which the session events never see. The counts of all affected tables are read with one query
+    over the indexed foreign keys. Call it before the delete, in the same transaction; the deleted `model` rows
+    themselves are counted by the events.
+
+    Parameters:
+        db (Session): The database session.
+        model: The model whose rows are about to be deleted, e.g. `models.SanskritWord`.
+        ids (list[int]): The ids of the rows about to be deleted.
+    """
+    # The ids deleted from each table, as subqueries: a row goes when any row it cascades from goes.
+    deleted = {model.__table__: select(model.id).where(model.id.in_(ids))}
+    for table in models.Base.metadata.sorted_tables:
+        conditions = [
+            foreign_key.parent.in_(deleted[foreign_key.column.table])
+            for foreign_key in table.foreign_keys
+            if foreign_key.ondelete == "CASCADE" and foreign_key.column.table in deleted
+        ]
+        if table not in deleted and conditions:
+            deleted[table] = select(table.c.id).where(or_(*conditions))
+
+    cascaded = {table.name: statement for table, statement in deleted.items() if table is not model.__table__ and table.name in COUNTED_TABLES}
+    if not cascaded:
+        return
+
+    row = db.execute(select(*[
+        select(func.count()).select_from(statement.subquery()).scalar_subquery().label(table_name)
+        for table_name, statement in cascaded.items()
+    ])).one()
+    _adjust(db, Counter({table_name: -row_count for table_name, row_count in row._mapping.items()}))
+
+
+def recount(db: Session, table_names: list[str] | None = None) -> None:
+    """
+    Recomputes the maintained counts with `COUNT(*)`, e.g. after a bulk import. The caller commits.
+
+    Parameters:
+        db (Session): The database session.
+        table_names (list[str] | None, optional): The tables to recount. Defaults to every counted table.
+    """
+    for table_name in table_names or COUNTED_TABLES:
+        row_count = db.query(func.count()).select_from(COUNTED_TABLES[table_name]).scalar()
+        db.merge(models.TableCount(table_name=table_name, row_count=row_count))
+
+
+def get_counts(db: Session) -> dict[str, int]:
+    """
+    Returns the row count of every counted table, read from `table_counts` without writing anything.
+
+    Parameters:
+        db (Session): The database session.
+
+    Returns:
+        dict[str, int]: The row counts by table name, in the order of `COUNTED_MODELS`.
+    """
+    counts = dict(db.query(models.TableCount.table_name, models.TableCount.row_count))
+
+    return {table_name: counts.get(table_name, 0) for table_name in COUNTED_TABLES}
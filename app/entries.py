@@ -0,0 +1,129 @@
+"""
+Full dictionary entries: a headword, its meanings, and the child rows of every meaning.
+
+The meanings and child rows are read with one `UNION ALL` over the child tables rather than one query per table (or
+per resource route), both for a set of words (`load_entries`) and for the whole dictionary (`stream_entries`).
+"""
+from collections import defaultdict
+from typing import Iterable, Iterator, Optional
+from sqlalchemy import Select, case, literal, null, select, union_all
+from sqlalchemy.orm import Session
+from app import models, schemas
+
+
+# The child tables of a meaning, by the field they are nested under in `schemas.MeaningEntry`, with their text columns.
+ENTRY_SECTIONS = [
+    ("etymologies", models.Etymology, ("etymology",)),
+    ("derivations", models.Derivation, ("derivation",)),
+    ("translations", models.Translation, ("language", "translation")),
+    ("nyaya_text_references", models.ReferenceNyayaText, ("source", "description")),
+    ("examples", models.Example, ("example_sentence", "applicable_modern_context")),
+    ("synonyms", models.Synonym, ("synonym",)),
+    ("antonyms", models.Antonym, ("antonym",)),
+]
+
+
+def _section_select(section: str, model, word_id, meaning_id, fields: tuple[str, ...]) -> Select:
+    # Every section is read into the same six columns; sections with one text column pad the second with NULL.
+    columns = [getattr(model, field) for field in fields] + [null()] * (2 - len(fields))
+    return select(
+        literal(section).label("section"), model.id.label("id"), word_id.label("sanskrit_word_id"), meaning_id.label("meaning_id"),
+        columns[0].label("first"), columns[1].label("second"),
+    )
+
+
+def _entry_selects(word_ids: Optional[list[int]] = None) -> list[Select]:
+    selects = [_section_select("meanings", models.Meaning, models.Meaning.sanskrit_word_id, models.Meaning.id, ("meaning",))]
+    selects += [_section_select(section, model, model.sanskrit_word_id, model.meaning_id, fields) for section, model, fields in ENTRY_SECTIONS]
+
+    if word_ids is not None:
+        selects = [statement.where(statement.selected_columns.sanskrit_word_id.in_(word_ids)) for statement in selects]
+
+    return selects
+
+
+def _build_entries(rows: Iterable, db_words: list[tuple[int, str, Optional[str]]]) -> dict[int, schemas.WordEntry]:
+    rows = sorted(rows, key=lambda row: row.id)
+
+    meanings = {
+        row.id: {"id": row.id, "sanskrit_word_id": row.sanskrit_word_id, "meaning": row.first, **{section: [] for section, _, _ in ENTRY_SECTIONS}}
+        for row in rows if row.section == "meanings"
+    }
+
+    fields = {section: section_fields for section, _, section_fields in ENTRY_SECTIONS}
+    for row in rows:
+        # Child rows of a deleted meaning, or filed under another word's meaning, are not part of the entry.
+        if row.section == "meanings" or row.meaning_id not in meanings or meanings[row.meaning_id]["sanskrit_word_id"] != row.sanskrit_word_id:
+            continue
+        meanings[row.meaning_id][row.section].append({
+            "id": row.id,
+            "sanskrit_word_id": row.sanskrit_word_id,
+            "meaning_id": row.meaning_id,
+            **dict(zip(fields[row.section], (row.first, row.second))),
+        })
+
+    word_meanings = defaultdict(list)
+    for meaning in meanings.values():
+        word_meanings[meaning["sanskrit_word_id"]].append(meaning)
+
+    return {
+        word_id: schemas.WordEntry(id=word_id, sanskrit_word=sanskrit_word, english_transliteration=english_transliteration, meanings=word_meanings[word_id])
+        for word_id, sanskrit_word, english_transliteration in db_words
+    }
+
+
+def load_entries(db: Session, db_words: list[tuple[int, str, Optional[str]]]) -> dict[int, schemas.WordEntry]:
+    """
+    Loads the full entries of a set of words with one query, each section filtered with an `IN` on the word ids.
+
+    Parameters:
+        db (Session): The database session.
+        db_words (list[tuple[int, str, Optional[str]]]): The (id, sanskrit_word, english_transliteration) of the words.
+
+    Returns:
+        dict[int, schemas.WordEntry]: The entries by word id, with meanings and child rows in id order.
+    """
+    rows = db.execute(union_all(*_entry_selects([word_id for word_id, _, _ in db_words]))).all()
+
+    return _build_entries(rows, db_words)
+
+
+def stream_entries(db: Session, batch_size: int) -> Iterator[schemas.WordEntry]:
+    """
+    Yields the full entry of every word, in id order, from a single query read through a server-side cursor.
+
+    The headwords and all their meanings and child rows come from one `UNION ALL` ordered by word id, fetched
+    `batch_size` rows at a time with `yield_per`, so only the rows of one entry are held at once however large the
+    dictionary is.
+
+    Parameters:
+        db (Session): The database session.
+        batch_size (int): The number of rows fetched from the cursor at a time.
+
+    Returns:
+        Iterator[schemas.WordEntry]: The entries, with meanings and child rows in id order.
+    """
+    words = _section_select("words", models.SanskritWord, models.SanskritWord.id, null(), ("sanskrit_word", "english_transliteration"))
+    rows = union_all(words, *_entry_selects()).subquery()
+
+    # The headword row of each word comes first, then its meanings, then their child rows.
+    statement = select(rows).order_by(
+        rows.c.sanskrit_word_id,
+        case((rows.c.section == "words", 0), (rows.c.section == "meanings", 1), else_=2),
+        rows.c.id,
+    )
+
+    word, word_rows = None, []
+    for row in db.execute(statement, execution_options={"yield_per": batch_size}):
+        if word is not None and row.sanskrit_word_id != word[0]:
+            yield _build_entries(word_rows, [word])[word[0]]
+            word, word_rows = None, []
+
+        if row.section == "words":
+            word = (row.id, row.first, row.second)
+        elif word is not None:
+            # Rows whose word no longer exists have no headword row before them, and are skipped.
+            word_rows.append(row)
+
+    if word is not None:
+        yield _build_entries(word_rows, [word])[word[0]]
@@ -0,0 +1,112 @@
+from collections import deque
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton finding every occurrence of a set of patterns in one pass over a text.
+
+    Patterns can be added and removed at any time. Adding only extends the trie and marks the failure and output
+    links stale; they are recomputed with one breadth-first pass before the next search. Removing a pattern just clears its
+    output, which keeps the existing links valid.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def clear(self) -> None:
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output_link: list[int] = [0]
+        self.depth: list[int] = [0]
+        self.values: list[set[int]] = [set()]
+        self.patterns: dict[str, int] = {}
+        self.stale = False
+
+    def add(self, pattern: str, value: int) -> None:
+        if not pattern:
+            return
+
+        node = self.patterns.get(pattern)
+        if node is None:
+            node = 0
+            for char in pattern:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output_link.append(0)
+                    self.depth.append(self.depth[node] + 1)
+                    self.values.append(set())
+                    self.goto[node][char] = child
+                node = child
+            self.patterns[pattern] = node
+
+        # A node that ends its first pattern, new or not, must become the target of its suffixes' output links.
+        if not self.values[node]:
+            self.stale = True
+        self.values[node].add(value)
+
+    def remove(self, pattern: str, value: int) -> None:
+        node = self.patterns.get(pattern)
+        if node is None:
+            return
+
+        self.values[node].discard(value)
+        if not self.values[node]:
+            del self.patterns[pattern]
+
+    def build(self) -> None:
+        """
+        Recomputes the failure and output links of every node.
+        """
+        queue = deque()
+        for child in self.goto[0].values():
+            self.fail[child] = 0
+            self.output_link[child] = 0
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                if self.fail[child] == child:
+                    self.fail[child] = 0
+
+                # Nearest proper suffix node that is (or was) the end of a pattern.
+                suffix = self.fail[child]
+                self.output_link[child] = suffix if self.values[suffix] else self.output_link[suffix]
+                queue.append(child)
+
+        self.stale = False
+
+    def search(self, text: str):
+        """
+        Yields every occurrence of every pattern in `text`.
+
+        Parameters:
+            text (str): The text to scan.
+
+        Yields:
+            tuple[int, int, set[int]]: (start, end, values) of each occurrence, `end` being exclusive, in order of `end`.
+        """
+        if self.stale:
+            self.build()
+
+        node = 0
+        for end, char in enumerate(text, start=1):
+            while node and char not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(char, 0)
+
+            match = node if self.values[node] else self.output_link[node]
+            while match:
+                if self.values[match]:
+                    yield end - self.depth[match], end, self.values[match]
+                match = self.output_link[match]
@@ -0,0 +1,306 @@
+"""
+Dhatu (verbal root) index over the `Derivation` texts.
+
+Derivations cite the root a headword is formed from, e.g. "`स्वृ शब्दोपतापयोः इत्यस्माद्धातोः ...". The roots are
+extracted from every derivation when the index is loaded, and from each derivation as it is written by
+`app/routers/word_derivations.py`, giving a root -> headword index that is never rebuilt by a scan. Roots cited with
+their anubandhas (markers such as "डुदाञ्") are indexed under the bare root ("दा") as well.
+"""
+import re
+import threading
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from app import models
+from app.indexes.prefix import PrefixIndex
+
+
+DHATU_MARKER = re.compile("धातोः?")
+
+# Quotes, punctuation, brackets and sutra numbers end the clause that names a root.
+CLAUSE_BOUNDARY = re.compile(r"[`'\"‘’“”,;:।॥()\[\]{}+|0-9]")
+TOKEN = re.compile(r"[\u0900-\u0963\u0971-\u097F\u200C\u200D]+")
+
+ITI = ("इत्यस्मात्", "इत्यस्माद्", "इति")
+
+# Words that end the clause before the root, e.g. "सु उपसर्गपूर्वक", "... इत्यस्मिन्नर्थे", "... इति विग्रहे" or an earlier
+# "... धातोः अथवा".
+BOUNDARY_ENDINGS = (
+    "पूर्वक", "पूर्व", "पूर्वपद", "र्थे", "विग्रहे", "उपपदे", "उपसर्ग", "इत्यनेन", "सूत्रेण", "प्रत्यये", "धातोः", "अथवा",
+)
+
+# So does an ablative such as "कपाल शब्दात्", "अन्तर् इति उपपदात्" or "आ समन्ताद्", unless it is the root itself ("ह्राद्").
+ABLATIVE_ENDINGS = ("ात्", "ाद्", "ात")
+
+# The meaning of a root is quoted after it in the locative ("गतौ", "भरणे", "गतिपूजनयोः", "भूषणादिषु", "सेवायाम्").
+GLOSS_ENDINGS = ("े", "ौ", "योः", "षु", "याम्", "यां", "िति")
+
+NOT_ROOTS = {"नुम्", "च"}
+
+# Markers written before a root, sometimes as a separate word ("डु धाञ्").
+INITIAL_ANUBANDHAS = ("डु", "टु", "ञि")
+
+# Markers written after a root, with what is left of them: "ञ्" (डुदाञ्), "ङ्" (शीङ्), "लृ" (गम्लृ) and "इर्" (भिदिर्).
+FINAL_ANUBANDHAS = (("ञ्", ""), ("ङ्", ""), ("्लृ", "्"), ("िर्", "्"), ("िर", "्"))
+
+# A final "उ" (दिवु) or "ऋ" (काशृ) is only a marker after a longer root, as "द्रु" and "स्वृ" are roots themselves.
+FINAL_VOWEL_ANUBANDHAS = ("ु", "ृ")
+
+# A syllable is a consonant without a virama, or an initial vowel.
+SYLLABLE = re.compile("[\u0915-\u0939](?!\u094D)|[\u0904-\u0914]")
+
+_lock = threading.RLock()
+_loaded = False
+
+derivations: dict[int, tuple[int, int, tuple[str, ...]]] = {}
+derivations_by_word: dict[int, set[int]] = defaultdict(set)
+words_by_root: dict[str, dict[int, set[int]]] = defaultdict(dict)
+forms: dict[str, str] = {}
+prefixes = PrefixIndex()
+
+
+def root_key(root: str) -> str:
+    """
+    The lookup key of a root: roots are cited both with and without a final virama ("गम्", "गम").
+    """
+    return root.rstrip("\u094D")
+
+
+def strip_anubandhas(root: str) -> str:
+    """
+    The bare form of a root cited with its anubandhas, e.g. "दा" for "डुदाञ्" and "गम्" for "गम्लृ".
+
+    Parameters:
+        root (str): The root as cited.
+
+    Returns:
+        str: The root without its markers, or `root` itself if it has none.
+    """
+    root = root.replace("ँ", "")
+
+    for anubandha in INITIAL_ANUBANDHAS:
+        if root.startswith(anubandha) and len(root) > len(anubandha) + 1:
+            root = root[len(anubandha):]
+            break
+
+    for anubandha, rest in FINAL_ANUBANDHAS:
+        if root.endswith(anubandha) and len(root) > len(anubandha):
+            return root[:-len(anubandha)] + rest
+
+    if root.endswith(FINAL_VOWEL_ANUBANDHAS) and len(SYLLABLE.findall(root)) > 1:
+        return root[:-1] + "्"
+
+    return root
+
+
+def extract_roots(text: str | None) -> list[str]:
+    """
+    Extracts the roots cited in a derivation text.
+
+    Every "धातोः" ("of the root") is taken to follow a root, either directly ("भू धातोः") or through its dhatupatha
+    entry "<root> <meaning in the locative> इति धातोः". Without a meaning the root is the last word of the clause
+    before "धातोः"; with one it is the first, since a meaning may itself be split into several words
+    ("अन्चु गति पूजनयोः"). Roots fused with their meaning ("राजृदीप्तौ") cannot be split and are skipped.
+
+    Parameters:
+        text (str | None): The derivation text.
+
+    Returns:
+        list[str]: The roots in order of appearance, without duplicates.
+    """
+    if not text:
+        return []
+
+    roots = []
+
+    for match in DHATU_MARKER.finditer(text):
+        tokens = TOKEN.findall(CLAUSE_BOUNDARY.split(text[:match.start()])[-1])
+
+        quoted = False
+        if tokens:
+            for iti in ITI:
+                if tokens[-1].endswith(iti):
+                    quoted = True
+                    tokens[-1] = tokens[-1][:-len(iti)]
+                    if not tokens[-1]:
+                        tokens.pop()
+                    break
+
+        # An "इति" left in the clause closes an earlier quotation ("`अपि इति उपसर्गात् ...").
+        for i in range(len(tokens) - 1, -1, -1):
+            token = tokens[i].rstrip("\u200C\u200D")
+            if token.endswith(BOUNDARY_ENDINGS) or token in ITI or (i < len(tokens) - 1 and token.endswith(ABLATIVE_ENDINGS)):
+                tokens = tokens[i + 1:]
+                break
+
+        for i in range(len(tokens) - 2, -1, -1):
+            if tokens[i] in INITIAL_ANUBANDHAS:
+                tokens[i:i + 2] = [tokens[i] + tokens[i + 1]]
+
+        if not tokens:
+            continue
+
+        if len(tokens) > 1 and (quoted or tokens[-1].endswith(GLOSS_ENDINGS)):
+            root = tokens[0]
+        else:
+            root = tokens[-1]
+
+        if root not in NOT_ROOTS and not root.endswith(GLOSS_ENDINGS):
+            roots.append(root)
+
+    return list(dict.fromkeys(roots))
+
+
+def _add(derivation_id: int, word_id: int, meaning_id: int, text: str | None) -> None:
+    _remove(derivation_id)
+
+    cited = extract_roots(text)
+    cited += [strip_anubandhas(root) for root in cited]
+    roots = tuple(dict.fromkeys(root_key(root) for root in cited))
+    for root in cited:
+        forms.setdefault(root_key(root), root)
+
+    derivations[derivation_id] = (word_id, meaning_id, roots)
+    derivations_by_word[word_id].add(derivation_id)
+
+    for root in roots:
+        if word_id not in words_by_root[root]:
+            words_by_root[root][word_id] = set()
+            prefixes.add(root, word_id)
+        words_by_root[root][word_id].add(derivation_id)
+
+
+def _remove(derivation_id: int) -> None:
+    if derivation_id not in derivations:
+        return
+
+    word_id, _, roots = derivations.pop(derivation_id)
+
+    derivations_by_word[word_id].discard(derivation_id)
+    if not derivations_by_word[word_id]:
+        del derivations_by_word[word_id]
+
+    for root in roots:
+        words = words_by_root[root]
+        words[word_id].discard(derivation_id)
+        if not words[word_id]:
+            del words[word_id]
+            prefixes.remove(root, word_id)
+        if not words:
+            del words_by_root[root]
+            forms.pop(root, None)
+
+
+def ensure_loaded(db: Session) -> None:
+    """
+    Extracts the roots of every derivation in the database if the index has not been built yet.
+
+    Parameters:
+        db (Session): The database session to read the derivations from.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if _loaded:
+            return
+
+        query = db.query(models.Derivation.id, models.Derivation.sanskrit_word_id, models.Derivation.meaning_id, models.Derivation.derivation)
+        for row in query.yield_per(1000):
+            _add(*row)
+
+        _loaded = True
+
+
+def reset() -> None:
+    """
+    Drops the index so that the next `ensure_loaded` call rebuilds it from the database.
+    """
+    global _loaded
+
+    with _lock:
+        derivations.clear()
+        derivations_by_word.clear()
+        words_by_root.clear()
+        forms.clear()
+        prefixes.clear()
+        _loaded = False
+
+
+def add_derivation(derivation_id: int, word_id: int, meaning_id: int, text: str | None) -> None:
+    """
+    Indexes (or re-indexes) the roots cited by one derivation.
+
+    Parameters:
+        derivation_id (int): The id of the derivation.
+        word_id (int): The id of the headword the derivation belongs to.
+        meaning_id (int): The id of the meaning the derivation belongs to.
+        text (str | None): The derivation text.
+    """
+    with _lock:
+        if _loaded:
+            _add(derivation_id, word_id, meaning_id, text)
+
+
+def remove_derivation(derivation_id: int) -> None:
+    with _lock:
+        if _loaded:
+            _remove(derivation_id)
+
+
+def remove_derivations(word_id: int, meaning_id: int | None = None) -> None:
+    """
+    Removes every derivation of a headword, optionally restricted to one meaning.
+
+    Parameters:
+        word_id (int): The id of the headword.
+        meaning_id (int, optional): Only remove the derivations of this meaning.
+    """
+    with _lock:
+        if not _loaded:
+            return
+
+        for derivation_id in list(derivations_by_word.get(word_id, ())):
+            if meaning_id is None or derivations[derivation_id][1] == meaning_id:
+                _remove(derivation_id)
+
+
+def words_for_root(root: str) -> list[tuple[int, list[int]]]:
+    """
+    Finds the headwords whose derivations cite `root`.
+
+    Parameters:
+        root (str): The root in Devanagari, with or without a final virama.
+
+    Returns:
+        list[tuple[int, list[int]]]: (word_id, derivation_ids) pairs ordered by word id.
+    """
+    with _lock:
+        words = words_by_root.get(root_key(root), {})
+        return [(word_id, sorted(derivation_ids)) for word_id, derivation_ids in sorted(words.items())]
+
+
+def search_roots(prefix: str, limit: int) -> list[tuple[str, int]]:
+    """
+    Lists the roots starting with `prefix` in alphabetical order.
+
+    Parameters:
+        prefix (str): The beginning of the root in Devanagari. An empty prefix lists every root.
+        limit (int): The maximum number of roots to return.
+
+    Returns:
+        list[tuple[str, int]]: (root, number of headwords) pairs.
+    """
+    results = []
+
+    with _lock:
+        entries = prefixes.search(root_key(prefix)) if prefix else iter(prefixes.entries)
+        for root, _ in entries:
+            if results and results[-1][0] == root:
+                continue
+            if len(results) >= limit:
+                break
+            results.append((root, len(words_by_root[root])))
+
+        return [(forms.get(root, root), word_count) for root, word_count in results]
@@ -0,0 +1,138 @@
+import math
+import re
+from collections import Counter, defaultdict
+
+
+# Word characters plus the Indic blocks (Devanagari .. Sinhala), whose vowel signs `\w` does not match; dandas split.
+TOKEN_PATTERN = re.compile(r"[\w\u0900-\u0963\u0966-\u0DFF]+")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into", "is", "it", "its", "of",
+    "on", "or", "that", "the", "this", "to", "was", "which", "with",
+}
+
+
+def stem(token: str) -> str:
+    """
+    Light suffix-stripping stemmer for English tokens; tokens in other scripts are returned unchanged.
+
+    Parameters:
+        token (str): A lower-case token.
+
+    Returns:
+        str: The stemmed token.
+    """
+    if not token.isascii() or len(token) <= 3:
+        return token
+
+    for suffix, replacement in (("ies", "y"), ("sses", "ss"), ("ness", ""), ("ing", ""), ("ed", ""), ("ly", ""), ("es", "e"), ("s", "")):
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            if suffix == "s" and token.endswith("ss"):
+                return token
+            return token[: -len(suffix)] + replacement
+
+    return token
+
+
+def tokenize(text: str | None) -> list[str]:
+    """
+    Splits `text` into lower-case, stemmed terms, dropping English stopwords.
+
+    Parameters:
+        text (str | None): The text to tokenize.
+
+    Returns:
+        list[str]: The terms in order of appearance.
+    """
+    if not text:
+        return []
+
+    return [stem(token) for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS and token != "_"]
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 ranking.
+
+    Documents are identified by hashable keys and each term's posting list maps those keys to the term's
+    frequency in the document, so documents can be added, replaced and removed one at a time.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: dict[str, dict] = defaultdict(dict)
+        self.terms: dict = {}
+        self.lengths: dict = {}
+        self.total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.lengths)
+
+    def add(self, doc_key, text: str | None) -> None:
+        """
+        Indexes `text` under `doc_key`, replacing anything previously indexed for it.
+
+        Parameters:
+            doc_key: The key identifying the document.
+            text (str | None): The document text.
+        """
+        self.remove(doc_key)
+
+        terms = Counter(tokenize(text))
+        if not terms:
+            return
+
+        for term, frequency in terms.items():
+            self.postings[term][doc_key] = frequency
+
+        self.terms[doc_key] = tuple(terms)
+        self.lengths[doc_key] = sum(terms.values())
+        self.total_length += self.lengths[doc_key]
+
+    def remove(self, doc_key) -> None:
+        if doc_key not in self.lengths:
+            return
+
+        self.total_length -= self.lengths.pop(doc_key)
+
+        for term in self.terms.pop(doc_key):
+            posting = self.postings[term]
+            posting.pop(doc_key, None)
+            if not posting:
+                del self.postings[term]
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.terms.clear()
+        self.lengths.clear()
+        self.total_length = 0
+
+    def search(self, query: str) -> dict:
+        """
+        Scores every document containing at least one query term.
+
+        Parameters:
+            query (str): The free-text query.
+
+        Returns:
+            dict: A mapping of document key to BM25 score.
+        """
+        if not self.lengths:
+            return {}
+
+        average_length = self.total_length / len(self.lengths)
+        scores = defaultdict(float)
+
+        for term in set(tokenize(query)):
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+
+            idf = math.log(1 + (len(self.lengths) - len(posting) + 0.5) / (len(posting) + 0.5))
+
+            for doc_key, frequency in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_key] / average_length)
+                scores[doc_key] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        return scores
@@ -0,0 +1,142 @@
+from collections import defaultdict
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment (Damerau-Levenshtein with adjacent transpositions) distance between `a` and `b`.
+
+    Parameters:
+        a (str): The first string.
+        b (str): The second string.
+        max_distance (int): The largest distance of interest.
+
+    Returns:
+        int: The distance, or `max_distance + 1` as soon as it is known to exceed `max_distance`.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+
+        if min(current) > max_distance:
+            return max_distance + 1
+
+        previous_previous, previous = previous, current
+
+    return previous[-1]
+
+
+class SymSpellIndex:
+    """
+    Symmetric delete spelling index.
+
+    Every key is stored under each string obtained by deleting up to `max_distance` of its characters. A query
+    generates its own deletes and only the keys sharing one of them are scored, so a lookup costs a handful
+    of dictionary probes instead of a distance computation against every key.
+
+    Only the first `prefix_length` characters of a key and of a query are deleted from. Two strings within
+    `max_distance` edits have prefixes within `max_distance` edits, so no match is lost, but a long key stores a
+    bounded number of deletes instead of a number growing with the square of its length. Most deletes belong to a
+    single key, which is then stored by itself rather than in a set.
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes: dict[str, str | set[str]] = {}
+        self.keys: dict[str, set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _deletes(self, key: str, max_distance: int) -> set[str]:
+        key = key[:self.prefix_length]
+        deletes = {key}
+        frontier = {key}
+
+        for _ in range(max_distance):
+            frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))} - deletes
+            deletes |= frontier
+
+        return deletes
+
+    def add(self, key: str, doc_id: int) -> None:
+        if not key:
+            return
+
+        if key not in self.keys:
+            for delete in self._deletes(key, self.max_distance):
+                keys = self.deletes.setdefault(delete, key)
+                if isinstance(keys, set):
+                    keys.add(key)
+                elif keys != key:
+                    self.deletes[delete] = {keys, key}
+
+        self.keys[key].add(doc_id)
+
+    def remove(self, key: str, doc_id: int) -> None:
+        doc_ids = self.keys.get(key)
+        if doc_ids is None:
+            return
+
+        doc_ids.discard(doc_id)
+        if doc_ids:
+            return
+
+        del self.keys[key]
+        for delete in self._deletes(key, self.max_distance):
+            keys = self.deletes.get(delete)
+            if keys == key:
+                del self.deletes[delete]
+            elif isinstance(keys, set):
+                keys.discard(key)
+                if len(keys) == 1:
+                    self.deletes[delete] = keys.pop()
+
+    def clear(self) -> None:
+        self.deletes.clear()
+        self.keys.clear()
+
+    def lookup(self, query: str, max_distance: int | None = None) -> list[tuple[int, str, set[int]]]:
+        """
+        Finds the indexed keys within `max_distance` edits of `query`.
+
+        Parameters:
+            query (str): The (already normalized) key to look up.
+            max_distance (int, optional): The largest edit distance to accept. Defaults to the index's `max_distance`.
+
+        Returns:
+            list[tuple[int, str, set[int]]]: (distance, key, ids) triples, closest first.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        if not query:
+            return []
+
+        candidates = set()
+        for delete in self._deletes(query, max_distance):
+            keys = self.deletes.get(delete)
+            if isinstance(keys, set):
+                candidates |= keys
+            elif keys is not None:
+                candidates.add(keys)
+
+        matches = []
+        for key in candidates:
+            distance = edit_distance(query, key, max_distance)
+            if distance <= max_distance:
+                matches.append((distance, key, self.keys[key]))
+
+        matches.sort(key=lambda match: (match[0], abs(len(match[1]) - len(query)), match[1]))
+
+        return matches
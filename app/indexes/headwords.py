@@ -0,0 +1,359 @@
+"""
+In-memory indexes over the `SanskritWord` headwords.
+
+The indexes are loaded from the database on first use (or at startup) and are kept up to date by the
+create, update and delete paths in `app/routers/words.py`.
+"""
+import bisect
+import hashlib
+import heapq
+import random
+import threading
+import unicodedata
+from datetime import date
+from itertools import islice
+from sqlalchemy.orm import Session
+from app import models
+from app.indexes.aho_corasick import AhoCorasick
+from app.indexes.fuzzy import SymSpellIndex
+from app.indexes.ngram import NgramIndex
+from app.indexes.prefix import PrefixIndex
+from app.utils.lang import normalizeText, normalizeWord, toSearchKey
+
+
+_lock = threading.RLock()
+_loaded = False
+
+words: dict[int, tuple[str, str]] = {}
+# Every word id, sorted, so that a random or daily pick is one index into a dense array rather than a scan.
+ids: list[int] = []
+# The day of the last `word_of_the_day_id` call, and the id it picked.
+day_pick: dict[date, int] = {}
+search_keys: dict[int, str] = {}
+keys: dict[int, tuple[str, ...]] = {}
+ngrams = NgramIndex(n=3)
+prefixes = PrefixIndex()
+# (search_key, id) pairs in the order of the ranked search within a rank.
+by_search_key = PrefixIndex()
+fuzzy = SymSpellIndex(max_distance=2)
+automaton = AhoCorasick()
+
+# Candrabindu, anusvara and visarga close a syllable; any other combining mark (vowel sign, virama, nukta) changes it.
+SYLLABLE_FINAL_MARKS = {"\u0901", "\u0902", "\u0903"}
+
+
+def _keys(sanskrit_word: str, english_transliteration: str | None, search_key: str) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(key for key in (sanskrit_word, (english_transliteration or "").lower(), search_key) if key))
+
+
+def _queries(text: str) -> list[str]:
+    return [query for query in dict.fromkeys((normalizeWord(text).lower(), toSearchKey(text))) if query]
+
+
+def _matches(queries: list[str]) -> set[int]:
+    word_ids = set()
+    for text in queries:
+        word_ids |= ngrams.search(text)
+    return word_ids
+
+
+def _index(word_id: int, sanskrit_word: str, english_transliteration: str | None, search_key: str | None) -> None:
+    # Everything but the sorted prefix array, which is bulk-built on load and patched by `_add`.
+    words[word_id] = (sanskrit_word, english_transliteration)
+    search_keys[word_id] = search_key or toSearchKey(sanskrit_word)
+    keys[word_id] = _keys(sanskrit_word, english_transliteration, search_keys[word_id])
+    ngrams.add(word_id, *keys[word_id])
+    fuzzy.add(search_keys[word_id], word_id)
+    automaton.add(sanskrit_word, word_id)
+
+
+def _add(word_id: int, sanskrit_word: str, english_transliteration: str | None, search_key: str | None) -> None:
+    _index(word_id, sanskrit_word, english_transliteration, search_key)
+    for key in keys[word_id]:
+        prefixes.add(key, word_id)
+    by_search_key.add(search_keys[word_id], word_id)
+
+
+def _remove(word_id: int) -> None:
+    if word_id not in words:
+        return
+    automaton.remove(words.pop(word_id)[0], word_id)
+    for key in keys.pop(word_id):
+        prefixes.remove(key, word_id)
+    by_search_key.remove(search_keys[word_id], word_id)
+    ngrams.remove(word_id)
+    fuzzy.remove(search_keys.pop(word_id), word_id)
+
+
+def ensure_loaded(db: Session) -> None:
+    """
+    Builds the indexes from the database if they have not been built yet.
+
+    Parameters:
+        db (Session): The database session to load the headwords from.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if _loaded:
+            return
+
+        rows = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration, models.SanskritWord.search_key).all()
+        for row in rows:
+            _index(*row)
+
+        prefixes.build([(key, word_id) for word_id, word_keys in keys.items() for key in word_keys])
+        by_search_key.build([(search_key, word_id) for word_id, search_key in search_keys.items()])
+        automaton.build()
+        ids[:] = sorted(words)
+
+        _loaded = True
+
+
+def reset() -> None:
+    """
+    Drops every index so that the next `ensure_loaded` call rebuilds them from the database.
+    """
+    global _loaded
+
+    with _lock:
+        words.clear()
+        ids.clear()
+        day_pick.clear()
+        search_keys.clear()
+        keys.clear()
+        ngrams.clear()
+        prefixes.clear()
+        by_search_key.clear()
+        fuzzy.clear()
+        automaton.clear()
+        _loaded = False
+
+
+def add_word(word_id: int, sanskrit_word: str, english_transliteration: str | None, search_key: str | None = None) -> None:
+    with _lock:
+        if _loaded:
+            if word_id not in words:
+                # New ids are the largest, so this is an append.
+                bisect.insort(ids, word_id)
+            _add(word_id, sanskrit_word, english_transliteration, search_key)
+
+
+def update_word(word_id: int, sanskrit_word: str, english_transliteration: str | None, search_key: str | None = None) -> None:
+    with _lock:
+        if _loaded:
+            _remove(word_id)
+            _add(word_id, sanskrit_word, english_transliteration, search_key)
+
+
+def remove_word(word_id: int) -> None:
+    with _lock:
+        if _loaded:
+            if word_id in words:
+                del ids[bisect.bisect_left(ids, word_id)]
+            _remove(word_id)
+
+
+def random_word_id() -> int | None:
+    """
+    Picks a headword uniformly at random, in constant time.
+
+    Returns:
+        int | None: The id of the headword, or None if there are no headwords.
+    """
+    with _lock:
+        return random.choice(ids) if ids else None
+
+
+def word_of_the_day_id(day: date) -> int | None:
+    """
+    Picks the headword of a day. The pick is a hash of the date into the sorted ids, so every process with the same
+    headwords picks the same word. It is kept for the rest of the day, even if headwords are added, unless the picked
+    word is deleted.
+
+    Parameters:
+        day (date): The day.
+
+    Returns:
+        int | None: The id of the headword, or None if there are no headwords.
+    """
+    with _lock:
+        if day in day_pick and day_pick[day] in words:
+            return day_pick[day]
+        if not ids:
+            return None
+
+        digest = hashlib.sha256(day.isoformat().encode()).digest()
+        day_pick.clear()
+        day_pick[day] = ids[int.from_bytes(digest[:8], "big") % len(ids)]
+        return day_pick[day]
+
+
+def search_substring_ids(query: str, limit: int) -> list[int]:
+    """
+    Finds headwords whose Devanagari form, (case-insensitive) transliteration or canonical search key contains `query`.
+
+    Parameters:
+        query (str): The substring to search for, in any supported script or transliteration scheme.
+        limit (int): The maximum number of results to return.
+
+    Returns:
+        list[int]: The matching word ids in ascending order.
+    """
+    with _lock:
+        return heapq.nsmallest(limit, _matches(_queries(query)))
+
+
+def _substring_tier(word_ids: set[int], limit: int, after: tuple | None):
+    # The (2, search_key, id) sort keys of the substring matches that are neither exact nor prefix matches, in order.
+    if after is not None and after[0] > 2:
+        return
+
+    # A few matches are cheaper to sort. Many, as for a one-letter query, are cheaper to pick out of the keys in order:
+    # they are spread over the whole order, so about len(by_search_key) / len(word_ids) keys are read per result, and
+    # reading stops when the page is full.
+    if len(word_ids) ** 2 <= limit * len(by_search_key):
+        sort_keys = sorted((2, search_keys[word_id], word_id) for word_id in word_ids)
+        yield from (key for key in sort_keys if after is None or key > after)
+        return
+
+    entries = by_search_key.entries
+    start = bisect.bisect_right(entries, (after[1], after[2])) if after is not None and after[0] == 2 else 0
+    for i in range(start, len(entries)):
+        search_key, word_id = entries[i]
+        if word_id in word_ids:
+            yield 2, search_key, word_id
+
+
+def search_ranked(query: str, limit: int, after: tuple | None = None) -> tuple[list[tuple[tuple[int, str, int], tuple[str, str]]], int]:
+    """
+    Finds headwords matching `query`, ranked exact matches first, then prefix matches, then other substring matches.
+
+    Within a rank headwords are ordered by their canonical search key (then id), so every match has a unique sort key
+    `(rank, search_key, id)` and a page can start right after the last key of the previous one.
+
+    The exact and prefix matches are read from the sorted key array by binary search, and only the substring matches
+    needed to fill the rest of the page are put in order, so a one-letter query matching most of the dictionary does
+    not sort it.
+
+    Parameters:
+        query (str): The text to search for, in any supported script or transliteration scheme.
+        limit (int): The maximum number of results to return.
+        after (tuple, optional): Only return matches whose sort key is greater than this one.
+
+    Returns:
+        tuple[list[tuple[tuple[int, str, int], tuple[str, str]]], int]: The (sort key, (sanskrit_word,
+            english_transliteration)) pairs of the page in order, and the total number of matches.
+    """
+    with _lock:
+        queries = _queries(query)
+        if not queries:
+            return [], 0
+
+        exact, prefix = set(), set()
+        for text in queries:
+            start, exact_end, end = prefixes.bounds(text)
+            exact.update(word_id for _, word_id in prefixes.entries[start:exact_end])
+            prefix.update(word_id for _, word_id in prefixes.entries[exact_end:end])
+        prefix -= exact
+
+        page = []
+        for rank, tier in ((0, exact), (1, prefix)):
+            if len(page) >= limit or (after is not None and after[0] > rank):
+                continue
+            sort_keys = ((rank, search_keys[word_id], word_id) for word_id in tier)
+            if after is not None and after[0] == rank:
+                sort_keys = (key for key in sort_keys if key > after)
+            page += heapq.nsmallest(limit - len(page), sort_keys)
+
+        matches = _matches(queries)
+        if len(page) < limit:
+            page += islice(_substring_tier(matches - exact - prefix, limit - len(page), after), limit - len(page))
+
+        return [(key, words[key[2]]) for key in page], len(matches)
+
+
+def search_prefix(prefix: str, limit: int) -> list[tuple[str, str]]:
+    """
+    Finds headwords whose Devanagari form, (case-insensitive) transliteration or canonical search key starts with `prefix`.
+
+    Parameters:
+        prefix (str): The prefix typed so far, in any supported script or transliteration scheme.
+        limit (int): The maximum number of results to return.
+
+    Returns:
+        list[tuple[str, str]]: (sanskrit_word, english_transliteration) pairs, literal matches first, each group
+            in alphabetical order of the matched key.
+    """
+    word_ids = {}
+
+    with _lock:
+        for text in _queries(prefix):
+            for _, word_id in prefixes.search(text):
+                if len(word_ids) >= limit:
+                    break
+                word_ids.setdefault(word_id)
+
+        return [words[word_id] for word_id in word_ids]
+
+
+def suggest(text: str, limit: int, max_distance: int = 2) -> list[tuple[str, str]]:
+    """
+    Finds the headwords whose canonical search key is within `max_distance` edits of the key of `text`.
+
+    Parameters:
+        text (str): The (possibly misspelt) word, in any supported script or transliteration scheme.
+        limit (int): The maximum number of suggestions to return.
+        max_distance (int, optional): The largest edit distance to accept. Defaults to 2.
+
+    Returns:
+        list[tuple[str, str]]: (sanskrit_word, english_transliteration) pairs, closest first.
+    """
+    suggestions = []
+
+    with _lock:
+        for _, _, word_ids in fuzzy.lookup(toSearchKey(text), max_distance):
+            for word_id in sorted(word_ids):
+                if len(suggestions) >= limit:
+                    return suggestions
+                suggestions.append(words[word_id])
+
+    return suggestions
+
+
+def annotate(text: str) -> list[tuple[int, int, int]]:
+    """
+    Finds the headwords occurring in a Devanagari passage, preferring the longest match.
+
+    The passage is normalized the way headwords are stored ("संकल्पः" is read as "सङ्कल्पः") and every occurrence is
+    found in one pass of the Aho-Corasick automaton over the headwords. Occurrences ending in the middle of a syllable
+    (i.e. followed by a vowel sign, virama or nukta) are dropped, and of the rest the leftmost-longest
+    non-overlapping ones are kept.
+
+    Parameters:
+        text (str): The passage to annotate.
+
+    Returns:
+        list[tuple[int, int, int]]: (start, end, word_id) spans in text order, as offsets into the original passage,
+            `end` being exclusive.
+    """
+    text, origins = normalizeText(text)
+
+    with _lock:
+        matches = [
+            (start, end, min(word_ids))
+            for start, end, word_ids in automaton.search(text)
+            if end == len(text) or text[end] in SYLLABLE_FINAL_MARKS or not unicodedata.category(text[end]).startswith("M")
+        ]
+
+    spans = []
+    covered = 0
+    for start, end, word_id in sorted(matches, key=lambda match: (match[0], -match[1])):
+        if start >= covered:
+            spans.append((origins[start][0], origins[end - 1][1], word_id))
+            covered = end
+
+    return spans
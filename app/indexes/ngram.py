@@ -0,0 +1,124 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+
+class NgramIndex:
+    """
+    Character n-gram inverted index.
+
+    Every n-gram of every indexed text is mapped to the set of ids whose text contains it, so a substring query of at
+    least n characters intersects a few posting lists instead of scanning every row. Shorter grams are mapped to
+    sorted arrays of ids instead: their lists hold most of the ids, and as sets they would hold most of the memory.
+    """
+
+    def __init__(self, n: int = 3):
+        self.n = n
+        self.postings: dict[str, set[int]] = defaultdict(set)
+        self.short_postings: dict[str, array] = {}
+        self.texts: dict[int, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _grams(self, text: str) -> set[str]:
+        return {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+
+    def _short_grams(self, texts: tuple[str, ...]) -> set[str]:
+        return {text[i:i + k] for text in texts for k in range(1, self.n) for i in range(len(text) - k + 1)}
+
+    def add(self, doc_id: int, *texts: str) -> None:
+        """
+        Indexes the given texts under `doc_id`, replacing anything previously indexed for it.
+
+        Parameters:
+            doc_id (int): The id the texts belong to.
+            *texts (str): The texts to index. Empty values are ignored.
+        """
+        if doc_id in self.texts:
+            self.remove(doc_id)
+
+        texts = tuple(text for text in texts if text)
+        self.texts[doc_id] = texts
+
+        for text in texts:
+            for gram in self._grams(text):
+                self.postings[gram].add(doc_id)
+
+        for gram in self._short_grams(texts):
+            posting = self.short_postings.setdefault(gram, array("q"))
+            # Ids mostly arrive in increasing order, so this is usually an append.
+            if not posting or posting[-1] < doc_id:
+                posting.append(doc_id)
+            else:
+                insort(posting, doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """
+        Removes `doc_id` and all of its grams from the index.
+
+        Parameters:
+            doc_id (int): The id to remove.
+        """
+        texts = self.texts.pop(doc_id, ())
+
+        for text in texts:
+            for gram in self._grams(text):
+                posting = self.postings.get(gram)
+                if posting is None:
+                    continue
+                posting.discard(doc_id)
+                if not posting:
+                    del self.postings[gram]
+
+        for gram in self._short_grams(texts):
+            posting = self.short_postings.get(gram)
+            if posting is None:
+                continue
+            i = bisect_left(posting, doc_id)
+            if i < len(posting) and posting[i] == doc_id:
+                del posting[i]
+            if not posting:
+                del self.short_postings[gram]
+
+    def clear(self) -> None:
+        self.postings.clear()
+        self.short_postings.clear()
+        self.texts.clear()
+
+    def search(self, query: str) -> set[int]:
+        """
+        Returns the ids of every indexed text containing `query`.
+
+        Queries of up to `n` characters are answered directly from their own posting list. Longer queries
+        intersect the posting lists of their n-grams, smallest first, and verify the surviving candidates.
+
+        Parameters:
+            query (str): The substring to look for.
+
+        Returns:
+            set[int]: The matching ids.
+        """
+        if not query:
+            return set()
+
+        if len(query) < self.n:
+            return set(self.short_postings.get(query, ()))
+
+        if len(query) == self.n:
+            return set(self.postings.get(query, ()))
+
+        postings = []
+        for gram in self._grams(query):
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        smallest, rest = postings[0], postings[1:]
+
+        return {
+            doc_id for doc_id in smallest
+            if all(doc_id in posting for posting in rest) and any(query in text for text in self.texts[doc_id])
+        }
@@ -0,0 +1,70 @@
+from bisect import bisect_left, insort
+
+
+class PrefixIndex:
+    """
+    Sorted array of (key, id) pairs answering prefix queries with binary search.
+    """
+
+    def __init__(self):
+        self.entries: list[tuple[str, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def build(self, entries: list[tuple[str, int]]) -> None:
+        """
+        Replaces the index contents with `entries`, sorting them once.
+
+        Parameters:
+            entries (list[tuple[str, int]]): (key, id) pairs to index.
+        """
+        self.entries = sorted(entry for entry in entries if entry[0])
+
+    def add(self, key: str, doc_id: int) -> None:
+        if key:
+            insort(self.entries, (key, doc_id))
+
+    def remove(self, key: str, doc_id: int) -> None:
+        i = bisect_left(self.entries, (key, doc_id))
+        if i < len(self.entries) and self.entries[i] == (key, doc_id):
+            del self.entries[i]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def bounds(self, prefix: str) -> tuple[int, int, int]:
+        """
+        Finds the entries whose key is `prefix` or starts with it, with three binary searches.
+
+        Parameters:
+            prefix (str): The prefix to look for.
+
+        Returns:
+            tuple[int, int, int]: `(start, exact_end, end)`, such that `entries[start:exact_end]` are the entries whose
+                key is `prefix` and `entries[exact_end:end]` the others whose key starts with it.
+        """
+        if not prefix:
+            return 0, 0, 0
+
+        return (
+            bisect_left(self.entries, (prefix,)),
+            bisect_left(self.entries, (prefix + "\0",)),
+            bisect_left(self.entries, (prefix + "\U0010ffff",)),
+        )
+
+    def search(self, prefix: str):
+        """
+        Yields the (key, id) pairs whose key starts with `prefix`, in key order.
+
+        Parameters:
+            prefix (str): The prefix to look for.
+        """
+        if not prefix:
+            return
+
+        for i in range(bisect_left(self.entries, (prefix,)), len(self.entries)):
+            key, doc_id = self.entries[i]
+            if not key.startswith(prefix):
+                return
+            yield key, doc_id
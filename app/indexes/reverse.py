@@ -0,0 +1,152 @@
+"""
+BM25 reverse-dictionary index over the descriptive text attached to headwords.
+
+Meanings, translations, example sentences and Nyaya text reference descriptions are indexed as separate
+documents keyed by (table name, row id). The index is loaded from the database on first use and kept up to
+date by the write paths of the corresponding routers.
+"""
+import threading
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from app import models
+from app.indexes.fulltext import BM25Index
+
+
+SOURCES = {
+    "meanings": (models.Meaning, "meaning"),
+    "translations": (models.Translation, "translation"),
+    "examples": (models.Example, "example_sentence"),
+    "reference_nyaya_texts": (models.ReferenceNyayaText, "description"),
+}
+
+_lock = threading.RLock()
+_loaded = False
+
+index = BM25Index()
+documents: dict[tuple[str, int], tuple[int, int]] = {}
+documents_by_word: dict[int, set[tuple[str, int]]] = defaultdict(set)
+
+
+def _add(table: str, row_id: int, word_id: int, meaning_id: int, text: str | None) -> None:
+    _remove((table, row_id))
+
+    documents[(table, row_id)] = (word_id, meaning_id)
+    documents_by_word[word_id].add((table, row_id))
+    index.add((table, row_id), text)
+
+
+def _remove(doc_key: tuple[str, int]) -> None:
+    if doc_key not in documents:
+        return
+
+    word_id, _ = documents.pop(doc_key)
+    documents_by_word[word_id].discard(doc_key)
+    if not documents_by_word[word_id]:
+        del documents_by_word[word_id]
+    index.remove(doc_key)
+
+
+def ensure_loaded(db: Session) -> None:
+    """
+    Builds the index from the database if it has not been built yet.
+
+    Parameters:
+        db (Session): The database session to load the documents from.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if _loaded:
+            return
+
+        for table, (model, column) in SOURCES.items():
+            meaning_id = model.id if model is models.Meaning else model.meaning_id
+            for row_id, word_id, row_meaning_id, text in db.query(model.id, model.sanskrit_word_id, meaning_id, getattr(model, column)):
+                _add(table, row_id, word_id, row_meaning_id, text)
+
+        _loaded = True
+
+
+def reset() -> None:
+    """
+    Drops the index so that the next `ensure_loaded` call rebuilds it from the database.
+    """
+    global _loaded
+
+    with _lock:
+        index.clear()
+        documents.clear()
+        documents_by_word.clear()
+        _loaded = False
+
+
+def add_document(table: str, row_id: int, word_id: int, meaning_id: int, text: str | None) -> None:
+    """
+    Indexes (or re-indexes) the text of one row.
+
+    Parameters:
+        table (str): The table the row belongs to, one of `SOURCES`.
+        row_id (int): The id of the row.
+        word_id (int): The id of the headword the row belongs to.
+        meaning_id (int): The id of the meaning the row belongs to (the row's own id for meanings).
+        text (str | None): The indexed text of the row.
+    """
+    with _lock:
+        if _loaded:
+            _add(table, row_id, word_id, meaning_id, text)
+
+
+def remove_document(table: str, row_id: int) -> None:
+    with _lock:
+        if _loaded:
+            _remove((table, row_id))
+
+
+def remove_documents(word_id: int, table: str | None = None, meaning_id: int | None = None) -> None:
+    """
+    Removes every document of a headword, optionally restricted to one table and/or meaning.
+
+    Parameters:
+        word_id (int): The id of the headword.
+        table (str, optional): Only remove documents from this table.
+        meaning_id (int, optional): Only remove documents attached to this meaning.
+    """
+    with _lock:
+        if not _loaded:
+            return
+
+        for doc_key in list(documents_by_word.get(word_id, ())):
+            if table is not None and doc_key[0] != table:
+                continue
+            if meaning_id is not None and documents[doc_key][1] != meaning_id:
+                continue
+            _remove(doc_key)
+
+
+def search(query: str, limit: int) -> list[tuple[int, float, list[dict]]]:
+    """
+    Ranks headwords by the BM25 score of their best matching document.
+
+    Parameters:
+        query (str): The free-text query, e.g. an English gloss.
+        limit (int): The maximum number of headwords to return.
+
+    Returns:
+        list[tuple[int, float, list[dict]]]: (word_id, score, matches) triples, best first, where each match
+            names the table, row id and meaning id of a matching document.
+    """
+    with _lock:
+        scores = index.search(query)
+
+        words = defaultdict(lambda: [0.0, []])
+        for (table, row_id), score in sorted(scores.items(), key=lambda item: -item[1]):
+            word_id, meaning_id = documents[(table, row_id)]
+            words[word_id][0] = max(words[word_id][0], score)
+            words[word_id][1].append({"source": table, "id": row_id, "meaning_id": meaning_id})
+
+    ranked = sorted(words.items(), key=lambda item: (-item[1][0], item[0]))
+
+    return [(word_id, score, matches) for word_id, (score, matches) in ranked[:limit]]
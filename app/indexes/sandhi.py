@@ -0,0 +1,196 @@
+"""
+Compound and sandhi splitter over the headword lexicon.
+
+The Devanagari headwords are kept in memory as a trie of their SLP1 spellings, so trying a candidate component is a
+walk of a few dictionary lookups rather than a database query. The lexicon is loaded on first use (or at startup) and
+kept up to date by the create, update and delete paths in `app/routers/words.py`.
+"""
+import threading
+from sqlalchemy.orm import Session
+from app import models
+from app.utils.lang import normalizeWord, toSlp1
+
+
+# (surface, end of the left component, start of the right component), in SLP1. A split at a surface form undoes the
+# sandhi, e.g. "devAlaya" -> "deva" + "Alaya" by ("A", "a", "A").
+RULES = [
+    # Savarna dirgha: like vowels merge into the long vowel.
+    *[(long, left, right) for short, long in (("a", "A"), ("i", "I"), ("u", "U")) for left in (short, long) for right in (short, long)],
+    ("F", "f", "f"),
+    # Guna and vrddhi: a/A before another vowel.
+    *[(surface, left, right) for surface, rights in (("e", "iI"), ("o", "uU"), ("E", "eE"), ("O", "oO")) for left in "aA" for right in rights],
+    ("ar", "a", "f"), ("Ar", "A", "f"),
+    # Yan and ayadi: a vowel before a dissimilar vowel becomes a semivowel.
+    ("y", "i", ""), ("y", "I", ""), ("v", "u", ""), ("v", "U", ""), ("r", "f", ""),
+    ("ay", "e", ""), ("Ay", "E", ""), ("av", "o", ""), ("Av", "O", ""),
+    # Jashtva and shcutva: a final stop is voiced before a voiced sound, and t becomes palatal before a palatal.
+    ("g", "k", ""), ("q", "w", ""), ("d", "t", ""), ("b", "p", ""), ("j", "t", ""), ("c", "t", ""),
+    # Final m becomes anusvara before a consonant.
+    ("M", "m", ""),
+    # Final s: "manas" + "raTa" -> "manoraTa", "jyotis" + "vid" -> "jyotirvid", "namas" + "kAra" -> "namaskAra".
+    ("o", "as", ""), ("r", "s", ""), ("H", "s", ""), ("S", "s", ""), ("z", "s", ""),
+]
+
+# A final visarga is the nominative ending of an a-stem ("devaH") or the final s of an s-stem ("manaH"). Reading it
+# off is not counted as a sandhi change.
+ENDINGS = [("H", "", ""), ("H", "s", "")]
+
+_WORD = ""
+
+_lock = threading.RLock()
+_loaded = False
+
+trie: dict = {}
+forms: dict[int, str] = {}
+
+
+def _walk(node: dict | None, text: str) -> dict | None:
+    for char in text:
+        if node is None:
+            return None
+        node = node.get(char)
+    return node
+
+
+def _add(word_id: int, sanskrit_word: str) -> None:
+    form = toSlp1(normalizeWord(sanskrit_word))
+    if not form:
+        return
+
+    node = trie
+    for char in form:
+        node = node.setdefault(char, {})
+    node.setdefault(_WORD, set()).add(word_id)
+    forms[word_id] = form
+
+
+def _remove(word_id: int) -> None:
+    form = forms.pop(word_id, None)
+    if form is None:
+        return
+
+    word_ids = _walk(trie, form)[_WORD]
+    word_ids.discard(word_id)
+    if not word_ids:
+        # Emptied branches are left in place; they only cost a dead end when walked.
+        del _walk(trie, form)[_WORD]
+
+
+def ensure_loaded(db: Session) -> None:
+    """
+    Builds the lexicon from the database if it has not been built yet.
+
+    Parameters:
+        db (Session): The database session to load the headwords from.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if _loaded:
+            return
+
+        for word_id, sanskrit_word in db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word).yield_per(1000):
+            _add(word_id, sanskrit_word)
+
+        _loaded = True
+
+
+def reset() -> None:
+    """
+    Drops the lexicon so that the next `ensure_loaded` call rebuilds it from the database.
+    """
+    global _loaded
+
+    with _lock:
+        trie.clear()
+        forms.clear()
+        _loaded = False
+
+
+def add_word(word_id: int, sanskrit_word: str) -> None:
+    with _lock:
+        if _loaded:
+            _add(word_id, sanskrit_word)
+
+
+def update_word(word_id: int, sanskrit_word: str) -> None:
+    with _lock:
+        if _loaded:
+            _remove(word_id)
+            _add(word_id, sanskrit_word)
+
+
+def remove_word(word_id: int) -> None:
+    with _lock:
+        if _loaded:
+            _remove(word_id)
+
+
+def split(text: str, limit: int) -> list[tuple[list[int], int]]:
+    """
+    Splits a compound or sandhi-joined form into headwords.
+
+    Every position of the text is a candidate split point, either as is or by undoing one of the sandhi `RULES` that
+    matches the text there. The best segmentations of each (position, pending start of the next component) suffix are
+    memoized, so every suffix is solved once and the search is polynomial in the length of the text. Segmentations
+    with fewer components, then fewer sandhi changes, are preferred.
+
+    Parameters:
+        text (str): The form to split, in any supported script or transliteration scheme.
+        limit (int): The maximum number of segmentations to return.
+
+    Returns:
+        list[tuple[list[int], int]]: (word ids of the components, number of sandhi changes undone) pairs, best first.
+    """
+    surface = toSlp1(normalizeWord(text))
+    length = len(surface)
+    if not length:
+        return []
+
+    rules_at = [[(*rule, 1) for rule in RULES if surface.startswith(rule[0], k)] for k in range(length)]
+    if surface.endswith("H"):
+        rules_at[-1] += [(*ending, 0) for ending in ENDINGS]
+    memo = {}
+
+    def best(start: int, pending: str) -> list[tuple[int, int, tuple[int, ...]]]:
+        key = (start, pending)
+        if key in memo:
+            return memo[key]
+        if start == length and not pending:
+            return [(0, 0, ())]
+
+        candidates = {}
+
+        def extend(word_ids: set[int], cost: int, rest: list[tuple[int, int, tuple[int, ...]]]) -> None:
+            word_id = min(word_ids)
+            for components, changes, word_ids_rest in rest:
+                segmentation = (word_id, *word_ids_rest)
+                score = (components + 1, changes + cost)
+                if score < candidates.get(segmentation, (length + 1, length + 1)):
+                    candidates[segmentation] = score
+
+        node = _walk(trie, pending)
+        k = start
+        while node is not None:
+            if _WORD in node and (k > start or pending):
+                extend(node[_WORD], 0, best(k, ""))
+
+            if k == length:
+                break
+
+            for surface_form, left, right, changes in rules_at[k]:
+                end = _walk(node, left)
+                if end is not None and _WORD in end and (end is not node or k > start or pending):
+                    extend(end[_WORD], changes, best(k + len(surface_form), right))
+
+            node = node.get(surface[k])
+            k += 1
+
+        memo[key] = sorted((components, changes, segmentation) for segmentation, (components, changes) in candidates.items())[:limit]
+        return memo[key]
+
+    with _lock:
+        return [(list(segmentation), changes) for _, changes, segmentation in best(0, "")]
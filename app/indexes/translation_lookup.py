@@ -0,0 +1,199 @@
+"""
+Per-language lookup indexes over `Translation` rows.
+
+A hash index keyed by (language, normalized translation) answers exact lookups and one sorted prefix index
+per language answers typeahead lookups, so neither has to scan the translations table. The indexes are
+loaded from the database on first use and kept up to date by the write paths in `app/routers/word_translations.py`.
+"""
+import threading
+import unicodedata
+from collections import defaultdict
+from sqlalchemy.orm import Session
+from app import models
+from app.indexes.prefix import PrefixIndex
+
+
+LANGUAGE_ALIASES = {
+    "en": ("en", "eng", "english"),
+    "kn": ("kn", "kan", "kannada"),
+    "hi": ("hi", "hin", "hindi"),
+    "sa": ("sa", "san", "sanskrit"),
+    "mr": ("mr", "mar", "marathi"),
+    "ta": ("ta", "tam", "tamil"),
+    "te": ("te", "tel", "telugu"),
+    "ml": ("ml", "mal", "malayalam"),
+}
+
+_LANGUAGE_CODES = {alias: code for code, aliases in LANGUAGE_ALIASES.items() for alias in aliases}
+
+_lock = threading.RLock()
+_loaded = False
+
+rows: dict[int, tuple[str, str, int, int, str, str]] = {}
+rows_by_word: dict[int, set[int]] = defaultdict(set)
+exact: dict[tuple[str, str], set[int]] = defaultdict(set)
+prefixes: dict[str, PrefixIndex] = defaultdict(PrefixIndex)
+
+
+def normalize_language(language: str) -> str:
+    """
+    Maps a language name or code ("Kannada", "kn", "kan") to its two-letter code, or to its lower-cased
+    form when the language is not known.
+    """
+    language = language.strip().lower()
+    return _LANGUAGE_CODES.get(language, language)
+
+
+def normalize_translation(translation: str) -> str:
+    """
+    Normalizes a translation for lookups: NFC, case-folded, whitespace collapsed and surrounding punctuation
+    stripped.
+    """
+    translation = " ".join(unicodedata.normalize("NFC", translation).casefold().split())
+    return translation.strip(".,;:!?'\"()[]-।॥ ")
+
+
+def _add(translation_id: int, word_id: int, meaning_id: int, language: str, translation: str) -> None:
+    _remove(translation_id)
+
+    language_code = normalize_language(language)
+    key = normalize_translation(translation)
+
+    rows[translation_id] = (language_code, key, word_id, meaning_id, language, translation)
+    rows_by_word[word_id].add(translation_id)
+    exact[(language_code, key)].add(translation_id)
+    prefixes[language_code].add(key, translation_id)
+
+
+def _remove(translation_id: int) -> None:
+    if translation_id not in rows:
+        return
+
+    language_code, key, word_id, _, _, _ = rows.pop(translation_id)
+
+    rows_by_word[word_id].discard(translation_id)
+    if not rows_by_word[word_id]:
+        del rows_by_word[word_id]
+
+    exact[(language_code, key)].discard(translation_id)
+    if not exact[(language_code, key)]:
+        del exact[(language_code, key)]
+
+    prefixes[language_code].remove(key, translation_id)
+
+
+def ensure_loaded(db: Session) -> None:
+    """
+    Builds the indexes from the database if they have not been built yet.
+
+    Parameters:
+        db (Session): The database session to load the translations from.
+    """
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if _loaded:
+            return
+
+        query = db.query(models.Translation.id, models.Translation.sanskrit_word_id, models.Translation.meaning_id, models.Translation.language, models.Translation.translation)
+        for translation_id, word_id, meaning_id, language, translation in query:
+            language_code = normalize_language(language)
+            key = normalize_translation(translation)
+            rows[translation_id] = (language_code, key, word_id, meaning_id, language, translation)
+            rows_by_word[word_id].add(translation_id)
+            exact[(language_code, key)].add(translation_id)
+
+        entries = defaultdict(list)
+        for translation_id, (language_code, key, *_) in rows.items():
+            entries[language_code].append((key, translation_id))
+        for language_code, language_entries in entries.items():
+            prefixes[language_code].build(language_entries)
+
+        _loaded = True
+
+
+def reset() -> None:
+    """
+    Drops the indexes so that the next `ensure_loaded` call rebuilds them from the database.
+    """
+    global _loaded
+
+    with _lock:
+        rows.clear()
+        rows_by_word.clear()
+        exact.clear()
+        prefixes.clear()
+        _loaded = False
+
+
+def add_translation(translation_id: int, word_id: int, meaning_id: int, language: str, translation: str) -> None:
+    with _lock:
+        if _loaded:
+            _add(translation_id, word_id, meaning_id, language, translation)
+
+
+def remove_translation(translation_id: int) -> None:
+    with _lock:
+        if _loaded:
+            _remove(translation_id)
+
+
+def remove_translations(word_id: int, meaning_id: int | None = None) -> None:
+    """
+    Removes every translation of a headword, optionally restricted to one meaning.
+
+    Parameters:
+        word_id (int): The id of the headword.
+        meaning_id (int, optional): Only remove translations attached to this meaning.
+    """
+    with _lock:
+        if not _loaded:
+            return
+
+        for translation_id in list(rows_by_word.get(word_id, ())):
+            if meaning_id is None or rows[translation_id][3] == meaning_id:
+                _remove(translation_id)
+
+
+def lookup(language: str, query: str, limit: int) -> list[dict]:
+    """
+    Finds the translations in `language` equal to, then starting with, `query`.
+
+    Parameters:
+        language (str): The language name or code.
+        query (str): The translation text (or its beginning) to look up.
+        limit (int): The maximum number of translations to return.
+
+    Returns:
+        list[dict]: Matching translations as `schemas.TranslationOut`-shaped dicts, exact matches first.
+    """
+    language_code = normalize_language(language)
+    key = normalize_translation(query)
+
+    if not key:
+        return []
+
+    with _lock:
+        translation_ids = dict.fromkeys(sorted(exact.get((language_code, key), ())))
+
+        if language_code in prefixes:
+            for _, translation_id in prefixes[language_code].search(key):
+                if len(translation_ids) >= limit:
+                    break
+                translation_ids.setdefault(translation_id)
+
+        matches = []
+        for translation_id in list(translation_ids)[:limit]:
+            _, _, word_id, meaning_id, row_language, translation = rows[translation_id]
+            matches.append({
+                "id": translation_id,
+                "sanskrit_word_id": word_id,
+                "meaning_id": meaning_id,
+                "language": row_language,
+                "translation": translation,
+            })
+
+        return matches
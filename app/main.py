@@ -1,7 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app import models
-from app.database import engine
-from app.routers import db_managers, search, upload, auth, word_nyaya_text_references, words, word_antonyms, word_derivations, word_etymologies, word_synonyms, word_translations, word_examples, word_meaning, logs
+from app.database import engine, SessionLocal
+from app.indexes import dhatus, headwords, reverse, sandhi, translation_lookup
+from app.routers import db_managers, search, upload, auth, word_nyaya_text_references, words, word_antonyms, word_derivations, word_etymologies, word_synonyms, word_translations, word_examples, word_meaning, logs, translations, annotate, roots, split, export
 from fastapi.middleware.cors import CORSMiddleware
 
 models.Base.metadata.create_all(bind=engine)
@@ -9,9 +11,26 @@ models.Base.metadata.create_all(bind=engine)
 with open("app/DESCRIPTION.md", "r") as f:
     description = f.read()
 
+def load_search_indexes():
+    db = SessionLocal()
+    try:
+        headwords.ensure_loaded(db)
+        reverse.ensure_loaded(db)
+        translation_lookup.ensure_loaded(db)
+        dhatus.ensure_loaded(db)
+        sandhi.ensure_loaded(db)
+    finally:
+        db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    load_search_indexes()
+    yield
+
 app = FastAPI(
     title="Nyaya Khosha",
     description=description,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -33,8 +52,13 @@ def health_check():
 app.include_router(auth.router)
 app.include_router(db_managers.router)
 app.include_router(search.router)
+app.include_router(translations.router)
+app.include_router(annotate.router)
+app.include_router(roots.router)
+app.include_router(split.router)
 app.include_router(upload.router)
 app.include_router(logs.router)
+app.include_router(export.router)
 app.include_router(words.router)
 app.include_router(word_meaning.router)
 app.include_router(word_etymologies.router)
@@ -0,0 +1,238 @@
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import NamedTuple
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.orm import Session
+from app import models
+from app.cache import response_cache
+from app.config import settings
+from app.database import get_db
+from app.utils.lang import isDevanagariWord, normalizeWord, toSearchKey
+
+
+class ResolvedWord(NamedTuple):
+    id: int
+    sanskrit_word: str
+    english_transliteration: str | None
+    meaning_ids: frozenset[int]
+
+
+class WordResolver:
+    """
+    Size-bounded LRU cache from the `{word}` segment of a URL to the headword it names and the ids of its meanings.
+
+    A segment in Devanagari names the headword with that `sanskrit_word`, any other segment the one with that
+    `english_transliteration`; failing that, a segment in any other scheme names the first headword with its canonical
+    search key. Misses are not cached. Creating, renaming or deleting a word, and adding or deleting one of its
+    meanings, must call `invalidate_word`; a generation counter keeps a lookup that raced with such a write from being
+    stored.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.entries: OrderedDict[str, ResolvedWord] = OrderedDict()
+        self.keys_by_word: dict[int, set[str]] = defaultdict(set)
+        # The segments resolved through the search key, which a new or renamed word may take over.
+        self.search_key_hits: set[str] = set()
+        self.generation = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _discard(self, key: str) -> None:
+        word_id = self.entries.pop(key).id
+        self.search_key_hits.discard(key)
+        self.keys_by_word[word_id].discard(key)
+        if not self.keys_by_word[word_id]:
+            del self.keys_by_word[word_id]
+
+    @staticmethod
+    def _query(db: Session, criterion) -> list:
+        return (
+            db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration, models.Meaning.id)
+            .outerjoin(models.Meaning, models.Meaning.sanskrit_word_id == models.SanskritWord.id)
+            .filter(criterion)
+            .order_by(models.SanskritWord.id)
+            .all()
+        )
+
+    def resolve(self, db: Session, word: str) -> ResolvedWord | None:
+        """
+        Resolves a `{word}` URL segment, querying the headword and its meaning ids together on a cache miss.
+
+        Parameters:
+            db (Session): The database session.
+            word (str): The headword in Devanagari, its stored transliteration, or any other scheme supported by
+                `toSearchKey`.
+
+        Returns:
+            ResolvedWord | None: The headword, or None if there is none by that spelling.
+        """
+        key = normalizeWord(word)
+
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            generation = self.generation
+
+        column = models.SanskritWord.sanskrit_word if isDevanagariWord(key) else models.SanskritWord.english_transliteration
+        rows = self._query(db, column == key)
+        by_search_key = not rows
+        if by_search_key:
+            rows = self._query(db, models.SanskritWord.search_key == toSearchKey(key))
+        if not rows:
+            return None
+
+        word_id, sanskrit_word, english_transliteration, _ = rows[0]
+        resolved = ResolvedWord(word_id, sanskrit_word, english_transliteration, frozenset(
+            meaning_id for row_word_id, _, _, meaning_id in rows if row_word_id == word_id and meaning_id is not None
+        ))
+
+        with self.lock:
+            if self.generation != generation:
+                return resolved
+
+            if key in self.entries:
+                self._discard(key)
+            self.entries[key] = resolved
+            self.keys_by_word[word_id].add(key)
+            if by_search_key:
+                self.search_key_hits.add(key)
+
+            while len(self.entries) > self.maxsize:
+                self._discard(next(iter(self.entries)))
+
+        return resolved
+
+    def invalidate_word(self, word_id: int) -> None:
+        """
+        Drops every cached spelling of a headword, after it was created, renamed or deleted, or gained or lost a meaning.
+
+        Parameters:
+            word_id (int): The id of the headword.
+        """
+        with self.lock:
+            for key in list(self.keys_by_word.get(word_id, ())) + list(self.search_key_hits):
+                if key in self.entries:
+                    self._discard(key)
+            self.generation += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.keys_by_word.clear()
+            self.search_key_hits.clear()
+            self.generation += 1
+
+
+word_resolver = WordResolver(settings.word_resolver_cache_size)
+
+
+def get_word(db: Session, word: str, meaning_id: int | None = None) -> ResolvedWord:
+    """
+    Resolves a `{word}` URL segment, and checks that `meaning_id` is one of the word's meanings, in one cached lookup.
+
+    Parameters:
+        db (Session): The database session.
+        word (str): The headword in Devanagari, its stored transliteration, or any other scheme supported by `toSearchKey`.
+        meaning_id (int | None, optional): A meaning id from the same URL. Defaults to None (not checked).
+
+    Returns:
+        ResolvedWord: The headword.
+
+    Raises:
+        HTTPException: If the word does not exist, or the meaning is not one of its meanings.
+    """
+    db_word = word_resolver.resolve(db, word)
+
+    if not db_word:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {normalizeWord(word)} not found")
+
+    if meaning_id is not None and meaning_id not in db_word.meaning_ids:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")
+
+    return db_word
+
+
+def touch_word(db: Session, word_id: int) -> None:
+    """
+    Bumps the revision and modification time of a headword, in the transaction of a write to the word or to one of its
+    child rows. Call it before `db.commit()`; the validators cached by `check_revision` are dropped together with the
+    word's other cached payloads by `response_cache.invalidate_word`.
+
+    Parameters:
+        db (Session): The database session.
+        word_id (int): The id of the headword that was written.
+    """
+    db.query(models.SanskritWord).filter(models.SanskritWord.id == word_id).update({
+        models.SanskritWord.revision: models.SanskritWord.revision + 1,
+        models.SanskritWord.updated_at: datetime.now(UTC),
+    }, synchronize_session=False)
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    # If-None-Match takes precedence over If-Modified-Since, and is compared weakly (RFC 9110, section 13.1.2).
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def check_revision(request: Request, response: Response, db: Session, word_id: int) -> None:
+    """
+    Sets the `ETag` and `Last-Modified` validators of a headword's revision on a read response, and answers a matching
+    conditional request with 304 Not Modified before the payload is loaded or serialized.
+
+    The validators are cached with the word's payloads in `response_cache`, so a repeated request queries at most the
+    `sanskrit_words` row and never the child tables.
+
+    Parameters:
+        request (Request): The incoming request.
+        response (Response): The response whose headers are set.
+        db (Session): The database session.
+        word_id (int): The id of the headword the response belongs to.
+
+    Raises:
+        HTTPException: 304 Not Modified, if the client's copy is current.
+    """
+    def load():
+        revision, updated_at = db.query(models.SanskritWord.revision, models.SanskritWord.updated_at).filter(models.SanskritWord.id == word_id).one()
+        return f'"{word_id}-{revision}"', updated_at.replace(tzinfo=UTC) if updated_at else None
+
+    etag, last_modified = response_cache.get_or_set(("revision", word_id), load, word_id=word_id)
+
+    headers = {"ETag": etag}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+
+    if _is_not_modified(request, etag, last_modified):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+
+
+def resolve_word(word: str, request: Request, response: Response, db: Session = Depends(get_db)) -> ResolvedWord:
+    db_word = get_word(db, word)
+    check_revision(request, response, db, db_word.id)
+    return db_word
+
+
+def resolve_word_meaning(word: str, meaning_id: int, request: Request, response: Response, db: Session = Depends(get_db)) -> ResolvedWord:
+    db_word = get_word(db, word, meaning_id)
+    check_revision(request, response, db, db_word.id)
+    return db_word
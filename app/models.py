@@ -1,4 +1,4 @@
-from sqlalchemy import Column,Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column,Integer, String, DateTime, ForeignKey, Enum, Index
 from .database import Base
 from datetime import datetime, UTC
 
@@ -8,13 +8,23 @@ class SanskritWord(Base):
     id = Column(Integer, primary_key=True, index=True)
     sanskrit_word = Column(String, index=True, unique=True)
     english_transliteration = Column(String, index=True)
+    search_key = Column(String, index=True)
+    collation_key = Column(String)
+    # Bumped by every write to the word or to any of its child rows; see `word_middleware.touch_word`.
+    revision = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    # Browsing and neighbors order and seek on (collation_key, sanskrit_word), so a page is one index range scan.
+    __table_args__ = (
+        Index("ix_sanskrit_words_collation_key_sanskrit_word", "collation_key", "sanskrit_word"),
+    )
 
 
 class Meaning(Base):
     __tablename__ = "meanings"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
     meaning = Column(String, nullable=False)
 
 
@@ -22,8 +32,8 @@ class Etymology(Base):
     __tablename__ = "etymologies"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     etymology = Column(String)
 
 
@@ -31,8 +41,8 @@ class Derivation(Base):
     __tablename__ = "derivations"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     derivation = Column(String)
 
 
@@ -40,8 +50,8 @@ class Translation(Base):
     __tablename__ = "translations"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     translation = Column(String, nullable=False)
     language = Column(String, nullable=False)
 
@@ -50,8 +60,8 @@ class Example(Base):
     __tablename__ = "examples"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     example_sentence = Column(String)
     applicable_modern_context = Column(String)
 
@@ -60,8 +70,8 @@ class ReferenceNyayaText(Base):
     __tablename__ = "reference_nyaya_texts"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     source = Column(String)
     description = Column(String)
 
@@ -70,8 +80,8 @@ class Synonym(Base):
     __tablename__ = "synonyms"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     synonym = Column(String)
 
 
@@ -79,11 +89,17 @@ class Antonym(Base):
     __tablename__ = "antonyms"
 
     id = Column(Integer, primary_key=True, index=True)
-    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id"))
-    meaning_id = Column(Integer, ForeignKey("meanings.id"))
+    sanskrit_word_id = Column(Integer, ForeignKey("sanskrit_words.id", ondelete="CASCADE"), index=True)
+    meaning_id = Column(Integer, ForeignKey("meanings.id", ondelete="CASCADE"), index=True)
     antonym = Column(String)
 
 
+class TableCount(Base):
+    __tablename__ = "table_counts"
+
+    table_name = Column(String(64), primary_key=True)
+    row_count = Column(Integer, nullable=False, default=0)
+
 
 class DBManager(Base):
     __tablename__ = "db_managers"
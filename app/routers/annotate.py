@@ -0,0 +1,49 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+from app import schemas
+from app.database import get_db
+from app.indexes import headwords
+
+
+router = APIRouter(
+    prefix="/annotate",
+    tags=["Annotate"],
+)
+
+
+@router.post("/", response_model=List[schemas.Annotation])
+def annotate(passage: schemas.AnnotateIn, db: Session = Depends(get_db)):
+    """
+    Marks the dictionary headwords occurring in a Devanagari passage.
+
+    The passage is scanned once by an Aho-Corasick automaton built over every headword, so the cost is linear in
+    the length of the passage rather than one search per substring. Overlapping matches are resolved in favour
+    of the leftmost, then longest, headword. The passage is matched in its normalized spelling, but the offsets
+    point into the passage as it was sent.
+
+    Args:
+        passage (schemas.AnnotateIn): The passage to annotate.
+        db (Session, optional): The database session, used only to build the index on first use.
+
+    Returns:
+        List[schemas.Annotation]: The matched spans in text order, with character offsets (`end` exclusive) and
+            the headword each span matched.
+    """
+    headwords.ensure_loaded(db)
+
+    annotations = []
+    for start, end, word_id in headwords.annotate(passage.text):
+        if word_id not in headwords.words:
+            continue
+        sanskrit_word, english_transliteration = headwords.words[word_id]
+        annotations.append({
+            "start": start,
+            "end": end,
+            "text": passage.text[start:end],
+            "id": word_id,
+            "sanskrit_word": sanskrit_word,
+            "english_transliteration": english_transliteration,
+        })
+
+    return annotations
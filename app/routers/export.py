@@ -0,0 +1,40 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from app import entries
+from app.database import get_db
+
+
+router = APIRouter(
+    prefix="/export",
+    tags=["Export"],
+)
+
+
+EXPORT_BATCH_SIZE = 1000
+
+
+def _stream_ndjson(db: Session):
+    try:
+        for entry in entries.stream_entries(db, EXPORT_BATCH_SIZE):
+            yield entry.model_dump_json() + "\n"
+    finally:
+        db.close()
+
+
+@router.get("/words.ndjson")
+def export_words(db: Session = Depends(get_db)):
+    """
+    Exports the whole dictionary as newline-delimited JSON: one line per word, in id order, holding its full entry as
+    returned by `GET /words/{word}/entry`.
+
+    The entries are read with a single query through a server-side cursor, `EXPORT_BATCH_SIZE` rows at a time, and
+    written out as they are built, so memory use does not grow with the size of the dictionary.
+
+    Parameters:
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        StreamingResponse: The `application/x-ndjson` stream of `schemas.WordEntry` objects.
+    """
+    return StreamingResponse(_stream_ndjson(db), media_type="application/x-ndjson")
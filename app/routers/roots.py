@@ -0,0 +1,76 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from app import schemas
+from app.config import settings
+from app.database import get_db
+from app.indexes import dhatus, headwords
+from app.utils.lang import toDevanagari
+
+
+router = APIRouter(
+    prefix="/roots",
+    tags=["Roots"],
+)
+
+
+@router.get("/", response_model=List[schemas.RootOut])
+def get_roots(prefix: str = "", limit: int = 20, db: Session = Depends(get_db)):
+    """
+    Lists the dhatus (verbal roots) cited in the derivations, in alphabetical order.
+
+    Args:
+        prefix (str, optional): Only list the roots starting with this text, in Devanagari or any supported
+            transliteration. Defaults to listing every root.
+        limit (int, optional): The maximum number of roots to return, at most `settings.roots_max_page_size`. Defaults
+            to 20.
+        db (Session, optional): The database session, used only to build the index on first use.
+
+    Returns:
+        List[schemas.RootOut]: The roots with the number of headwords derived from each.
+    """
+    limit = max(1, min(limit, settings.roots_max_page_size))
+
+    dhatus.ensure_loaded(db)
+
+    return [{"root": root, "word_count": word_count} for root, word_count in dhatus.search_roots(toDevanagari(prefix), limit)]
+
+
+@router.get("/{dhatu}/words", response_model=List[schemas.RootWord])
+def get_root_words(dhatu: str, db: Session = Depends(get_db)):
+    """
+    Lists the headwords whose derivations cite the given dhatu (verbal root).
+
+    The roots are extracted from the derivation texts when the index is built and whenever a derivation is written,
+    so the lookup does not scan the derivations table.
+
+    Args:
+        dhatu (str): The root, in Devanagari or any supported transliteration, with or without a final virama and
+            with or without its anubandhas ("दा" or "डुदाञ्").
+        db (Session, optional): The database session, used only to build the indexes on first use.
+
+    Returns:
+        List[schemas.RootWord]: The headwords, ordered by id, with the ids of the derivations citing the root.
+
+    Raises:
+        HTTPException: If no derivation cites the root.
+    """
+    dhatus.ensure_loaded(db)
+    headwords.ensure_loaded(db)
+
+    words = []
+    for word_id, derivation_ids in dhatus.words_for_root(toDevanagari(dhatu)):
+        if word_id not in headwords.words:
+            continue
+        sanskrit_word, english_transliteration = headwords.words[word_id]
+        words.append({
+            "id": word_id,
+            "sanskrit_word": sanskrit_word,
+            "english_transliteration": english_transliteration,
+            "derivation_ids": derivation_ids,
+        })
+
+    if not words:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Root - {dhatu} not found")
+
+    return words
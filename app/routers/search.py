@@ -1,38 +1,240 @@
-from fastapi import APIRouter, Depends, status, HTTPException
+from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
-from app import models
-from app.utils.lang import isDevanagariWord
+from typing import List, Optional
+from app import models, schemas
+from app.config import settings
 from app.database import get_db
+from app.indexes import headwords, reverse
+from app.utils.cursor import decodeCursor, encodeCursor
+from app.utils.lang import isDevanagariWord, normalizeWord, toSearchKey
 
 router = APIRouter(
     prefix="/search",
     tags=["Search"],
 )
 
-@router.get("/{word}")
-def search(word: str, limit: int = 5, db: Session = Depends(get_db)):
+@router.get("/prefix/{text}")
+def search_prefix(text: str, limit: int = 10, db: Session = Depends(get_db)):
     """
-    Searches for a word in the database and returns a list of matching sanskrit words and their english transliterations.
-    
+    Typeahead lookup of the headwords starting with the given text.
+
+    The lookup is a binary search over the in-memory sorted headword index and does not touch the database
+    once the index has been built.
+
+    Args:
+        text (str): The prefix typed so far, in Devanagari or transliteration.
+        limit (int, optional): The maximum number of suggestions to return, at most `settings.search_max_page_size`. Defaults to 10.
+        db (Session, optional): The database session, used only to build the index on first use.
+
+    Returns:
+        List[List[str]]: A list of [sanskrit_word, english_transliteration] pairs, empty if nothing matches.
+    """
+    limit = max(1, min(limit, settings.search_max_page_size))
+
+    headwords.ensure_loaded(db)
+    matches = headwords.search_prefix(text, limit)
+
+    return [[sanskrit_word, english_transliteration] for sanskrit_word, english_transliteration in matches]
+
+
+@router.get("/fuzzy/{text}")
+def search_fuzzy(text: str, limit: int = 5, max_distance: int = 2, db: Session = Depends(get_db)):
+    """
+    "Did you mean" lookup of the headwords spelt closest to the given text.
+
+    Candidates come from the in-memory symmetric-delete index over canonical search keys, so only headwords
+    sharing a deletion variant with the query are scored.
+
+    Args:
+        text (str): The (possibly misspelt) word, in Devanagari or any supported transliteration.
+        limit (int, optional): The maximum number of suggestions to return, at most `settings.search_max_page_size`. Defaults to 5.
+        max_distance (int, optional): The largest edit distance to accept, between 0 and 2. Defaults to 2.
+        db (Session, optional): The database session, used only to build the index on first use.
+
+    Returns:
+        List[List[str]]: A list of [sanskrit_word, english_transliteration] pairs, closest first.
+    """
+    limit = max(1, min(limit, settings.search_max_page_size))
+    max_distance = max(0, min(max_distance, headwords.fuzzy.max_distance))
+
+    headwords.ensure_loaded(db)
+    matches = headwords.suggest(text, limit, max_distance)
+
+    return [[sanskrit_word, english_transliteration] for sanskrit_word, english_transliteration in matches]
+
+
+@router.get("/reverse", response_model=List[schemas.ReverseSearchResult])
+def search_reverse(q: str, limit: int = 10, db: Session = Depends(get_db)):
+    """
+    Reverse (e.g. English to Sanskrit) lookup over meanings, translations, example sentences and Nyaya text
+    reference descriptions.
+
+    Documents are ranked with BM25 over an in-memory inverted index and grouped by headword, each headword
+    scoring as its best matching document.
+
+    Args:
+        q (str): The free-text query, e.g. "inference".
+        limit (int, optional): The maximum number of headwords to return, at most `settings.search_max_page_size`. Defaults to 10.
+        db (Session, optional): The database session, used only to build the indexes on first use.
+
+    Returns:
+        List[schemas.ReverseSearchResult]: The matching headwords, best first, with the documents that matched.
+    """
+    limit = max(1, min(limit, settings.search_max_page_size))
+
+    headwords.ensure_loaded(db)
+    reverse.ensure_loaded(db)
+
+    results = []
+    for word_id, score, matches in reverse.search(q, limit):
+        if word_id not in headwords.words:
+            continue
+        sanskrit_word, english_transliteration = headwords.words[word_id]
+        results.append({
+            "id": word_id,
+            "sanskrit_word": sanskrit_word,
+            "english_transliteration": english_transliteration,
+            "score": score,
+            "matches": matches,
+        })
+
+    return results
+
+
+@router.post("/batch", response_model=List[schemas.BatchSearchResult])
+def search_batch(batch: schemas.BatchSearchIn, db: Session = Depends(get_db)):
+    """
+    Resolves many terms at once, e.g. every word of a passage that is being glossed.
+
+    Every term is first matched exactly, the way `GET /words/{word}` does: Devanagari terms against the headword,
+    other terms against the stored transliteration, and all terms against the canonical search key. All terms are
+    resolved together with one query of `IN` predicates, and the meaning ids of every matched headword are fetched
+    with one more. Terms without an exact match fall back to the in-memory substring index used by `GET /search/{word}`.
+
+    Args:
+        batch (schemas.BatchSearchIn): The terms to resolve, in Devanagari or any supported transliteration, and the
+            maximum number of matches to return per term, at most `settings.search_max_page_size`.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        List[schemas.BatchSearchResult]: One result per term, in input order, with the term as sent, the normalized
+            form it was matched by, the matching headwords and whether they matched exactly.
+
+    Raises:
+        HTTPException: If more than `settings.search_batch_max_terms` terms are sent.
+    """
+    if len(batch.terms) > settings.search_batch_max_terms:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {settings.search_batch_max_terms} terms can be searched at once")
+
+    limit = max(1, min(batch.limit, settings.search_max_page_size))
+    terms = [normalizeWord(term) for term in batch.terms]
+    search_keys = {term: toSearchKey(term) for term in terms if term}
+
+    devanagari_terms = {term for term in search_keys if isDevanagariWord(term)}
+    transliterated_terms = set(search_keys) - devanagari_terms
+
+    words = {}
+    by_column = defaultdict(list)
+    by_search_key = defaultdict(list)
+
+    if search_keys:
+        rows = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration, models.SanskritWord.search_key).filter(or_(
+            models.SanskritWord.sanskrit_word.in_(devanagari_terms),
+            models.SanskritWord.english_transliteration.in_(transliterated_terms),
+            models.SanskritWord.search_key.in_(set(search_keys.values())),
+        )).order_by(models.SanskritWord.id).all()
+
+        for word_id, sanskrit_word, english_transliteration, search_key in rows:
+            words[word_id] = (sanskrit_word, english_transliteration)
+            by_column[sanskrit_word].append(word_id)
+            if english_transliteration:
+                by_column[english_transliteration].append(word_id)
+            by_search_key[search_key].append(word_id)
+
+    results = []
+    for term in terms:
+        word_ids = []
+        if term:
+            word_ids = list(dict.fromkeys(by_column[term] + by_search_key[search_keys[term]]))[:limit]
+        results.append((term, bool(word_ids), word_ids))
+
+    if any(term and not exact for term, exact, _ in results):
+        headwords.ensure_loaded(db)
+        for i, (term, exact, word_ids) in enumerate(results):
+            if term and not exact:
+                word_ids = headwords.search_substring_ids(term, limit)
+                words.update((word_id, headwords.words[word_id]) for word_id in word_ids)
+                results[i] = (term, False, word_ids)
+
+    meaning_ids = defaultdict(list)
+    if words:
+        for meaning_id, word_id in db.query(models.Meaning.id, models.Meaning.sanskrit_word_id).filter(models.Meaning.sanskrit_word_id.in_(words)).order_by(models.Meaning.id):
+            meaning_ids[word_id].append(meaning_id)
+
+    return [
+        {
+            "term": input_term,
+            "normalized_term": term,
+            "exact": exact,
+            "matches": [
+                {
+                    "id": word_id,
+                    "sanskrit_word": words[word_id][0],
+                    "english_transliteration": words[word_id][1],
+                    "meaning_ids": meaning_ids[word_id],
+                }
+                for word_id in word_ids
+            ],
+        }
+        for input_term, (term, exact, word_ids) in zip(batch.terms, results)
+    ]
+
+
+@router.get("/{word}", response_model=schemas.SearchPage)
+def search(word: str, limit: int = 5, cursor: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Searches for a word in the database and returns a page of matching sanskrit words and their english transliterations.
+
+    Matches are looked up in the in-memory trigram index over the headword columns rather than with a `LIKE` scan and are
+    ranked exact matches first, then prefix matches, then other substring matches. Pages are keyset-paginated: the cursor
+    encodes the sort key of the last result, so fetching a deep page costs the same as fetching the first one.
+
     Args:
         word (str): The word to search for.
-        limit (int, optional): The maximum number of results to return. Defaults to 5.
+        limit (int, optional): The page size, at most `settings.search_max_page_size`. Defaults to 5.
+        cursor (str, optional): The `next_cursor` of the previous page.
         db (Session, optional): The database session. Defaults to the result of the `get_db` function.
-    
+
     Returns:
-        List[List[str]]: A list of lists, where each inner list contains a sanskrit word and its english transliteration.
-    
+        schemas.SearchPage: The page of [sanskrit_word, english_transliteration] pairs, the cursor of the next page (None on
+            the last page) and the total number of hits. When nothing matches, the results are empty and spelling
+            suggestions are included instead.
+
     Raises:
-        HTTPException: If no match is found for the given word.
+        HTTPException: If the cursor is malformed.
     """
-    if isDevanagariWord(word):
-        matches = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word.contains(word)).limit(limit).all()
-    else:
-        matches = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration.icontains(word)).limit(limit).all()
+    limit = max(1, min(limit, settings.search_max_page_size))
+
+    after = None
+    if cursor is not None:
+        after = decodeCursor(cursor)
+        if after is None or [type(value) for value in after] != [int, str, int]:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+    headwords.ensure_loaded(db)
+    page, total_hits = headwords.search_ranked(word, limit + 1, after)
+
+    next_cursor = encodeCursor(page[limit - 1][0]) if len(page) > limit else None
 
-    if not matches:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No match found")
-    
-    res = [[match.sanskrit_word, match.english_transliteration] for match in matches]
+    suggestions = []
+    if not total_hits:
+        suggestions = [[sanskrit_word, english_transliteration] for sanskrit_word, english_transliteration in headwords.suggest(word, limit)]
 
-    return res
\ No newline at end of file
+    return {
+        "results": [[sanskrit_word, english_transliteration] for _, (sanskrit_word, english_transliteration) in page[:limit]],
+        "next_cursor": next_cursor,
+        "total_hits": total_hits,
+        "suggestions": suggestions,
+    }
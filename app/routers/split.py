@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from app import schemas
+from app.config import settings
+from app.database import get_db
+from app.indexes import headwords, sandhi
+
+
+router = APIRouter(
+    prefix="/split",
+    tags=["Split"],
+)
+
+
+@router.get("/{text}", response_model=List[schemas.SplitResult])
+def split_compound(text: str, limit: int = 5, db: Session = Depends(get_db)):
+    """
+    Splits a compound or a sandhi-joined form into dictionary headwords, e.g. "देवालय" into "देव" + "आलय".
+
+    The split runs against an in-memory lexicon of the headwords, so trying the candidate components does not query
+    the database.
+
+    Args:
+        text (str): The form to split, in Devanagari or any supported transliteration.
+        limit (int, optional): The maximum number of segmentations to return. Defaults to 5.
+        db (Session, optional): The database session, used only to build the indexes on first use.
+
+    Returns:
+        List[schemas.SplitResult]: The segmentations, fewest components and then fewest sandhi changes first, with
+            the headword each component resolved to. Empty if the form cannot be split into headwords.
+
+    Raises:
+        HTTPException: If the text is longer than the configured maximum.
+    """
+    if len(text) > settings.split_max_length:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Text must be at most {settings.split_max_length} characters")
+
+    sandhi.ensure_loaded(db)
+    headwords.ensure_loaded(db)
+
+    limit = max(1, min(limit, settings.split_max_results))
+
+    results = []
+    for word_ids, sandhi_count in sandhi.split(text, limit):
+        if not all(word_id in headwords.words for word_id in word_ids):
+            continue
+        results.append({
+            "components": [
+                {"id": word_id, "sanskrit_word": headwords.words[word_id][0], "english_transliteration": headwords.words[word_id][1]}
+                for word_id in word_ids
+            ],
+            "sandhi_count": sandhi_count,
+        })
+
+    return results
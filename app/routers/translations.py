@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+from app import schemas
+from app.config import settings
+from app.database import get_db
+from app.indexes import headwords, translation_lookup
+
+
+router = APIRouter(
+    prefix="/translations",
+    tags=["Translations"],
+)
+
+
+@router.get("/lookup", response_model=List[schemas.TranslationLookupResult])
+def lookup_translations(lang: str, q: str, limit: int = 10, db: Session = Depends(get_db)):
+    """
+    Reverse lookup of headwords by their translation in a given language.
+
+    Translations equal to the query come first, followed by translations starting with it. Both are answered
+    from in-memory indexes keyed by (language, normalized translation), without scanning the translations table.
+
+    Parameters:
+        lang (str): The language name or code, e.g. "kn", "Kannada", "hi".
+        q (str): The translation (or its beginning) to look up.
+        limit (int, optional): The maximum number of translations to match, at most `settings.search_max_page_size`. Defaults to 10.
+        db (Session): The database session, used only to build the indexes on first use.
+
+    Returns:
+        List[schemas.TranslationLookupResult]: The matching headwords with their matching translations.
+    """
+    limit = max(1, min(limit, settings.search_max_page_size))
+
+    headwords.ensure_loaded(db)
+    translation_lookup.ensure_loaded(db)
+
+    results = {}
+    for match in translation_lookup.lookup(lang, q, limit):
+        word_id = match["sanskrit_word_id"]
+        if word_id not in headwords.words:
+            continue
+
+        if word_id not in results:
+            sanskrit_word, english_transliteration = headwords.words[word_id]
+            results[word_id] = {
+                "id": word_id,
+                "sanskrit_word": sanskrit_word,
+                "english_transliteration": english_transliteration,
+                "translations": [],
+            }
+        results[word_id]["translations"].append(match)
+
+    return list(results.values())
@@ -5,8 +5,8 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from typing import List
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -16,7 +16,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/antonyms", response_model=List[schemas.AntonymOut])
-def get_word_antonyms(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_antonyms(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieve the antonyms for a given word and meaning ID.
     
@@ -28,21 +28,16 @@ def get_word_antonyms(word: str, meaning_id: int, db: Session = Depends(get_db))
     Returns:
     - List of AntonymOut schemas representing the antonyms of the word
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
+    def load():
+        db_antonyms = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id).all()
 
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_antonyms = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id).all()
+        return [schemas.AntonymOut.model_validate(row, from_attributes=True) for row in db_antonyms]
 
-    return db_antonyms
+    return response_cache.get_or_set(("antonyms", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/antonyms/{antonym_id}")
-def get_word_anyonym(word: str, meaning_id: int, antonym_id: int, db: Session = Depends(get_db)):
+def get_word_anyonym(word: str, meaning_id: int, antonym_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieve the specific antonym for a given word, meaning ID, and antonym ID.
 
@@ -55,20 +50,15 @@ def get_word_anyonym(word: str, meaning_id: int, antonym_id: int, db: Session =
     Returns:
     - The specific Antonym model representing the requested antonym
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_antonym = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id, models.Antonym.id == antonym_id).first()
+    def load():
+        db_antonym = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id, models.Antonym.id == antonym_id).first()
 
-    if not db_antonym:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Antonym - {antonym_id} not found")
+        if not db_antonym:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Antonym - {antonym_id} not found")
+
+        return schemas.AntonymOut.model_validate(db_antonym, from_attributes=True)
 
-    return db_antonym
+    return response_cache.get_or_set(("antonyms", db_word.id, meaning_id, antonym_id), load, word_id=db_word.id)
 
 @router.post("/{word}/{meaning_id}/antonyms", status_code=status.HTTP_201_CREATED)
 async def create_word_antonym(word: str, meaning_id: int, antonym: schemas.Antonym, db: Session = Depends(get_db), current_db_manager: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
@@ -87,21 +77,18 @@ async def create_word_antonym(word: str, meaning_id: int, antonym: schemas.Anton
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     new_antonym = models.Antonym(meaning_id=meaning_id, sanskrit_word_id=db_word.id, antonym=antonym.antonym)
 
     db.add(new_antonym)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_antonym)
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("antonyms", new_antonym.id, "CREATE", current_db_manager.email, antonym.antonym)
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Successfully created antonym"})
@@ -124,14 +111,8 @@ async def update_word_antonym(word: str, meaning_id: int, antonym_id: int, anton
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_antonym = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id, models.Antonym.id == antonym_id).first()
     
@@ -139,9 +120,12 @@ async def update_word_antonym(word: str, meaning_id: int, antonym_id: int, anton
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Antonym - {antonym} not found")
     
     db_antonym.antonym = antonym.antonym
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_antonym)
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("antonyms", antonym_id, "UPDATE", current_db_manager.email, antonym.antonym)
 
 
@@ -161,14 +145,8 @@ async def delete_word_antonym(word: str, meaning_id: int, antonym_id: int, db: S
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     antonym = db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id, models.Antonym.id == antonym_id).first()
     
@@ -176,8 +154,11 @@ async def delete_word_antonym(word: str, meaning_id: int, antonym_id: int, db: S
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Antonym - {antonym} not found")
     
     db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id, models.Antonym.id == antonym_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("antonyms", antonym_id, "DELETE", current_db_manager.email, antonym.antonym)
 
 
@@ -196,16 +177,13 @@ async def delete_word_antonyms(word: str, meaning_id: int, db: Session = Depends
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id, models.Antonym.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("antonyms", meaning_id, "DELETE_ALL", current_db_manager.email)
\ No newline at end of file
@@ -5,8 +5,9 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from typing import List
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
+from app.indexes import dhatus
 
 
 router = APIRouter(
@@ -16,7 +17,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/derivations", response_model=List[schemas.DerivationOut])
-def get_word_derivations(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_derivations(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves the derivations of a word based on the provided word and meaning ID.
     
@@ -28,21 +29,16 @@ def get_word_derivations(word: str, meaning_id: int, db: Session = Depends(get_d
     Returns:
     - List of DerivationOut objects representing the derivations of the word
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_derivations = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id).all()
+    def load():
+        db_derivations = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id).all()
 
-    return db_derivations
+        return [schemas.DerivationOut.model_validate(row, from_attributes=True) for row in db_derivations]
+
+    return response_cache.get_or_set(("derivations", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/derivations/{derivation_id}", response_model=schemas.DerivationOut)
-def get_word_derivation(word: str, meaning_id: int, derivation_id: int, db: Session = Depends(get_db)):
+def get_word_derivation(word: str, meaning_id: int, derivation_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves a specific derivation of a word based on the provided word, meaning ID, and derivation ID.
 
@@ -55,20 +51,15 @@ def get_word_derivation(word: str, meaning_id: int, derivation_id: int, db: Sess
     Returns:
     - DerivationOut object representing the specific derivation of the word
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_derivation = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id, models.Derivation.id == derivation_id).first()
+    def load():
+        db_derivation = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id, models.Derivation.id == derivation_id).first()
 
-    if not db_derivation:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Derivation - {derivation_id} not found")
-    
-    return db_derivation
+        if not db_derivation:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Derivation - {derivation_id} not found")
+
+        return schemas.DerivationOut.model_validate(db_derivation, from_attributes=True)
+
+    return response_cache.get_or_set(("derivations", db_word.id, meaning_id, derivation_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/{meaning_id}/derivations")
@@ -88,21 +79,19 @@ async def create_word_derivation(word: str, meaning_id: int, derivation: schemas
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_derivation = models.Derivation(sanskrit_word_id=db_word.id, meaning_id=meaning_id, derivation=derivation.derivation)
 
     db.add(db_derivation)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_derivation)
 
+    dhatus.add_derivation(db_derivation.id, db_word.id, meaning_id, db_derivation.derivation)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("derivations", db_derivation.id, "CREATE", current_user.email, db_derivation.derivation)
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Derivation added successfully"})
@@ -126,20 +115,18 @@ async def update_word_derivation(word: str, meaning_id: int, derivation_id: int,
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     updated_derivation = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id, models.Derivation.id == derivation_id).first()
     updated_derivation.derivation = derivation.derivation
     
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    dhatus.add_derivation(derivation_id, db_word.id, meaning_id, derivation.derivation)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("derivations", derivation_id, "UPDATE", current_user.email, derivation.derivation)
 
     return JSONResponse(status_code=status.HTTP_204_NO_CONTENT, content={"message": "Derivation updated successfully"})
@@ -158,19 +145,18 @@ async def delete_word_derivations(word: str, meaning_id: int, db: Session = Depe
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
     
     
     db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    dhatus.remove_derivations(db_word.id, meaning_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("derivations", meaning_id, "DELETE_ALL", current_user.email)
 
 
@@ -194,14 +180,8 @@ async def delete_word_derivation(word: str, meaning_id: int, derivation_id: int,
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_derivation = db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id, models.Derivation.id == derivation_id).first()
 
@@ -209,6 +189,10 @@ async def delete_word_derivation(word: str, meaning_id: int, derivation_id: int,
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Derivation - {derivation_id} not found")
     
     db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id, models.Derivation.meaning_id == meaning_id, models.Derivation.id == derivation_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    dhatus.remove_derivation(derivation_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("derivations", derivation_id, "DELETE", current_user.email, db_derivation.derivation)
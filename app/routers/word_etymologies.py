@@ -2,11 +2,12 @@ from fastapi import APIRouter, HTTPException, status, Depends
 from fastapi.responses import JSONResponse
 from app.database import get_db
 from sqlalchemy.orm import Session
-from app.utils.lang import isDevanagariWord
 from app.utils.converter import access_to_int
 from app import schemas, models
 from app.middleware.auth_middleware import get_current_db_manager
 from app.middleware.logger_middleware import log_database_operations
+from app.middleware import word_middleware
+from app.cache import response_cache
 from typing import List
 
 
@@ -17,7 +18,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/etymologies", response_model=List[schemas.EtymologyOut])
-def get_word_etymologies(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_etymologies(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves a list of etymologies for a given word and meaning ID from the database.
 
@@ -29,26 +30,16 @@ def get_word_etymologies(word: str, meaning_id: int, db: Session = Depends(get_d
     Returns:
     - A list of EtymologyOut objects representing the etymologies for the word and meaning ID
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
+    def load():
+        db_etymologies = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id).all()
 
-    if not db_meaning:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")
-    
-    db_etymologies = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id).all()
+        return [schemas.EtymologyOut.model_validate(row, from_attributes=True) for row in db_etymologies]
 
-    return db_etymologies
+    return response_cache.get_or_set(("etymologies", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/etymologies/{etymology_id}", response_model=schemas.EtymologyOut)
-def get_word_etymology(word: str, meaning_id: int, etymology_id: int, db: Session = Depends(get_db)):
+def get_word_etymology(word: str, meaning_id: int, etymology_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves a specific etymology for a given word, meaning ID, and etymology ID.
 
@@ -61,25 +52,15 @@ def get_word_etymology(word: str, meaning_id: int, etymology_id: int, db: Sessio
     Returns:
     - An EtymologyOut object representing the retrieved etymology
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
+    def load():
+        db_etymology = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id, models.Etymology.id == etymology_id).first()
 
-    if not db_meaning:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")
-    
-    db_etymology = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id, models.Etymology.id == etymology_id).first()
+        if not db_etymology:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Etymology - {etymology_id} not found")
 
-    if not db_etymology:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Etymology - {etymology_id} not found")
-    
-    return db_etymology
+        return schemas.EtymologyOut.model_validate(db_etymology, from_attributes=True)
+
+    return response_cache.get_or_set(("etymologies", db_word.id, meaning_id, etymology_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/{meaning_id}/etymologies")
@@ -100,13 +81,7 @@ async def add_word_etymology(word: str, meaning_id: int, etymology: schemas.Etym
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     etymology = models.Etymology(
         sanskrit_word_id = db_word.id,
@@ -115,9 +90,12 @@ async def add_word_etymology(word: str, meaning_id: int, etymology: schemas.Etym
     )
 
     db.add(etymology)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(etymology)
 
+    response_cache.invalidate_word(db_word.id)
+
     await log_database_operations("etymology", etymology.id, "CREATE", current_db_manager.email, etymology.etymology)
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Etymology added successfully"})
@@ -142,19 +120,7 @@ async def update_word_etymology(word: str, meaning_id: int, etymology_id: int, e
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
-
-    if not db_meaning:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_etymology = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id, models.Etymology.id == etymology_id).first()
 
@@ -163,9 +129,12 @@ async def update_word_etymology(word: str, meaning_id: int, etymology_id: int, e
     
     db_etymology.etymology = etymology.etymology
 
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_etymology)
 
+    response_cache.invalidate_word(db_word.id)
+
     await log_database_operations("etymology", db_etymology.id, "UPDATE", current_db_manager.email, db_etymology.etymology)
 
 
@@ -186,18 +155,14 @@ async def delete_word_etymologies(word: str, meaning_id: int, db: Session = Depe
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await log_database_operations("etymology", meaning_id, "DELETE_ALL", current_db_manager.email)
 
 
@@ -219,14 +184,7 @@ async def delete_word_etymology(word: str, meaning_id: int, etymology_id: int, d
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_etymology = db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id, models.Etymology.id == etymology_id).first()
 
@@ -234,6 +192,9 @@ async def delete_word_etymology(word: str, meaning_id: int, etymology_id: int, d
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Etymology - {etymology_id} not found")
     
     db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id, models.Etymology.meaning_id == meaning_id, models.Etymology.id == etymology_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await log_database_operations("etymology", etymology_id, "DELETE", current_db_manager.email, db_etymology.etymology)
\ No newline at end of file
@@ -4,8 +4,9 @@ from app.database import get_db
 from sqlalchemy.orm import Session
 from app import models, schemas
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.indexes import reverse
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 from typing import List
 
 
@@ -16,7 +17,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/examples", response_model=List[schemas.ExampleOut])
-def get_word_examples(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_examples(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Get examples of a word for a specific meaning ID.
     
@@ -28,21 +29,16 @@ def get_word_examples(word: str, meaning_id: int, db: Session = Depends(get_db))
     Returns:
     - A list of ExampleOut objects representing the examples of the word for the given meaning ID
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_examples = db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id, models.Example.meaning_id == meaning_id).all()
+    def load():
+        db_examples = db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id, models.Example.meaning_id == meaning_id).all()
+
+        return [schemas.ExampleOut.model_validate(row, from_attributes=True) for row in db_examples]
 
-    return db_examples
+    return response_cache.get_or_set(("examples", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/examples/{examples_id}", response_model=schemas.ExampleOut)
-def get_word_example(word: str, meaning_id: int, examples_id: int, db: Session = Depends(get_db)):
+def get_word_example(word: str, meaning_id: int, examples_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Get a specific example of a word for a given meaning ID.
 
@@ -55,20 +51,15 @@ def get_word_example(word: str, meaning_id: int, examples_id: int, db: Session =
     Returns:
     - An ExampleOut object representing the example of the word for the given meaning ID
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_example = db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id, models.Example.meaning_id == meaning_id, models.Example.id == examples_id).first()
+    def load():
+        db_example = db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id, models.Example.meaning_id == meaning_id, models.Example.id == examples_id).first()
 
-    if not db_example:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Example - {examples_id} not found")
-    
-    return db_example
+        if not db_example:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Example - {examples_id} not found")
+
+        return schemas.ExampleOut.model_validate(db_example, from_attributes=True)
+
+    return response_cache.get_or_set(("examples", db_word.id, meaning_id, examples_id), load, word_id=db_word.id)
     
 
 @router.post("/{word}/{meaning_id}/examples", status_code=status.HTTP_201_CREATED)
@@ -88,21 +79,19 @@ async def create_word_example(word: str, meaning_id: int, example: schemas.Examp
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     new_example = models.Example(**example.model_dump(), sanskrit_word_id=db_word.id, meaning_id=meaning_id)
 
     db.add(new_example)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_example)
 
+    reverse.add_document("examples", new_example.id, db_word.id, meaning_id, new_example.example_sentence)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("examples", new_example.id, "CREATE", current_user.email, f"{new_example.example_sentence} - {new_example.applicable_modern_context}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Example created successfully"})
@@ -112,14 +101,8 @@ async def create_word_example(word: str, meaning_id: int, example: schemas.Examp
 async def update_word_example(word: str, meaning_id: int, examples_id: int, example: schemas.Example, db: Session = Depends(get_db), current_user: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
 
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_example = db.query(models.Example).filter(models.Example.meaning_id == meaning_id, models.Example.id == examples_id).first()
 
@@ -128,9 +111,13 @@ async def update_word_example(word: str, meaning_id: int, examples_id: int, exam
     
     db_example.example_sentence = example.example_sentence
     db_example.applicable_modern_context = example.applicable_modern_context
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_example)
 
+    reverse.add_document("examples", examples_id, db_example.sanskrit_word_id, db_example.meaning_id, db_example.example_sentence)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("examples", examples_id, "UPDATE", current_user.email, f"{db_example.example_sentence} - {db_example.applicable_modern_context}")
 
 
@@ -138,14 +125,8 @@ async def update_word_example(word: str, meaning_id: int, examples_id: int, exam
 async def delete_word_example(word: str, meaning_id: int, examples_id: int, db: Session = Depends(get_db), current_user: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_example = db.query(models.Example).filter(models.Example.meaning_id == meaning_id, models.Example.id == examples_id).first()
 
@@ -153,25 +134,27 @@ async def delete_word_example(word: str, meaning_id: int, examples_id: int, db:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Example - {examples_id} not found")
     
     db.query(models.Example).filter(models.Example.meaning_id == meaning_id, models.Example.id == examples_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_document("examples", examples_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("examples", examples_id, "DELETE", current_user.email, db_example.example_sentence)
 
 
 @router.delete("/{word}/{meaning_id}/examples", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_word_examples(word: str, meaning_id, db: Session = Depends(get_db), current_user: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
+async def delete_word_examples(word: str, meaning_id: int, db: Session = Depends(get_db), current_user: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id, models.Example.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_documents(db_word.id, table="examples", meaning_id=meaning_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("examples", meaning_id, "DELETE_ALL", current_user.email)
\ No newline at end of file
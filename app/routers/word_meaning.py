@@ -2,11 +2,12 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 from app.database import get_db
 from sqlalchemy.orm import Session
-from app import models, schemas
+from app import counts, models, schemas
 from typing import List
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.indexes import dhatus, reverse, translation_lookup
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -16,7 +17,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/meanings", response_model=List[schemas.MeaningOut])
-def get_word_meanings(word: str, db: Session = Depends(get_db)):
+def get_word_meanings(word: str, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word)):
     """
     Retrieves the meanings of a given word. 
     
@@ -27,21 +28,16 @@ def get_word_meanings(word: str, db: Session = Depends(get_db)):
     Returns:
         - List[schemas.MeaningOut]: A list of meanings associated with the input word.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_meanings = db.query(models.Meaning).filter(models.Meaning.sanskrit_word_id == db_word.id).all()
+    def load():
+        db_meanings = db.query(models.Meaning).filter(models.Meaning.sanskrit_word_id == db_word.id).all()
 
-    return db_meanings
+        return [schemas.MeaningOut.model_validate(row, from_attributes=True) for row in db_meanings]
+
+    return response_cache.get_or_set(("meanings", db_word.id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/meanings/{meaning_id}", response_model=schemas.MeaningOut)
-def get_word_meaning(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_meaning(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves the meaning of a given word with a specific meaning ID.
 
@@ -53,20 +49,15 @@ def get_word_meaning(word: str, meaning_id: int, db: Session = Depends(get_db)):
     Returns:
         - schemas.MeaningOut: The meaning associated with the input word and meaning ID.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
+    def load():
+        db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
 
-    if not db_meaning:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")  
+        if not db_meaning:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")
+
+        return schemas.MeaningOut.model_validate(db_meaning, from_attributes=True)
 
-    return db_meaning
+    return response_cache.get_or_set(("meanings", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/meanings", status_code=status.HTTP_201_CREATED)
@@ -85,20 +76,19 @@ async def create_word_meaning(word: str, meaning: schemas.MeaningCreate, db: Ses
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
 
+    db_word = word_middleware.get_word(db, word)
+    
     new_meaning = models.Meaning(sanskrit_word_id = db_word.id, meaning = meaning.meaning)
     db.add(new_meaning)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_meaning)
 
+    reverse.add_document("meanings", new_meaning.id, db_word.id, new_meaning.id, new_meaning.meaning)
+    word_middleware.word_resolver.invalidate_word(db_word.id)
+    response_cache.invalidate_word(db_word.id, listing=True)
+
     await logger_middleware.log_database_operations("meanings", new_meaning.id, "CREATE", current_user.email, new_meaning.meaning)
     
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Meaning created successfully"})
@@ -121,19 +111,17 @@ async def update_word_meaning(word: str, meaning_id: int, meaning: schemas.Meani
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
 
+    db_word = word_middleware.get_word(db, word, meaning_id)
+    
     db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
     db_meaning.meaning = meaning.meaning
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.add_document("meanings", meaning_id, db_meaning.sanskrit_word_id, meaning_id, meaning.meaning)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("meanings", meaning_id, "UPDATE", current_user.email, meaning.meaning)
 
 
@@ -153,23 +141,26 @@ async def delete_word_meaning(word: str, meaning_id: int, db: Session = Depends(
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
 
+    db_word = word_middleware.get_word(db, word, meaning_id)
+    
     db_meaning = db.query(models.Meaning).filter(models.Meaning.id == meaning_id).first()
     if not db_meaning:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Meaning - {meaning_id} not found")  
 
     
+    counts.count_cascade(db, models.Meaning, [meaning_id])
     db.query(models.Meaning).filter(models.Meaning.id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    # The meaning's etymologies, translations, etc. were deleted with it by the ON DELETE CASCADE foreign keys.
+    reverse.remove_documents(db_word.id, meaning_id=meaning_id)
+    translation_lookup.remove_translations(db_word.id, meaning_id)
+    dhatus.remove_derivations(db_word.id, meaning_id)
+    word_middleware.word_resolver.invalidate_word(db_word.id)
+    response_cache.invalidate_word(db_word.id, listing=True)
+
     await logger_middleware.log_database_operations("meanings", meaning_id, "DELETE", current_user.email, db_meaning.meaning)
 
 
@@ -188,16 +179,20 @@ async def delete_word_meanings(word: str, db: Session = Depends(get_db), current
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
 
+    db_word = word_middleware.get_word(db, word)
+    
+    meaning_ids = [meaning_id for meaning_id, in db.query(models.Meaning.id).filter(models.Meaning.sanskrit_word_id == db_word.id)]
+    counts.count_cascade(db, models.Meaning, meaning_ids)
     db.query(models.Meaning).filter(models.Meaning.sanskrit_word_id == db_word.id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    # Every etymology, translation, etc. of the word hangs off one of its meanings, and went with them.
+    reverse.remove_documents(db_word.id)
+    translation_lookup.remove_translations(db_word.id)
+    dhatus.remove_derivations(db_word.id)
+    word_middleware.word_resolver.invalidate_word(db_word.id)
+    response_cache.invalidate_word(db_word.id, listing=True)
+
     await logger_middleware.log_database_operations("meanings", db_word.id, "DELETE_ALL", current_user.email)
\ No newline at end of file
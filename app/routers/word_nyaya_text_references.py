@@ -4,9 +4,10 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from app import models, schemas
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
+from app.indexes import reverse
 from app.database import get_db
-from app.middleware import auth_middleware, logger_middleware
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -16,7 +17,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/nyaya-text-references", response_model=List[schemas.NyayaTextReferenceOut])
-def get_word_nyaya_text_references(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_nyaya_text_references(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves Nyaya text references for a specific word and meaning ID from the database.
 
@@ -28,21 +29,16 @@ def get_word_nyaya_text_references(word: str, meaning_id: int, db: Session = Dep
     Returns:
         - A list of Nyaya text references associated with the word and meaning ID
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_nyaya_text_references = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id).all()
+    def load():
+        db_nyaya_text_references = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id).all()
+
+        return [schemas.NyayaTextReferenceOut.model_validate(row, from_attributes=True) for row in db_nyaya_text_references]
 
-    return db_nyaya_text_references
+    return response_cache.get_or_set(("reference_nyaya_texts", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/nyaya-text-references/{nyaya_text_id}", response_model=schemas.NyayaTextReferenceOut)
-def get_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_text_id: int, db: Session = Depends(get_db)):
+def get_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_text_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves a specific Nyaya text reference for a word, meaning ID, and Nyaya text ID from the database.
 
@@ -55,20 +51,15 @@ def get_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_text_id: int
     Returns:
         - The Nyaya text reference associated with the word, meaning ID, and Nyaya text ID
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_reference_nyaya_text = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id, models.ReferenceNyayaText.id == nyaya_text_id).first()
+    def load():
+        db_reference_nyaya_text = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id, models.ReferenceNyayaText.id == nyaya_text_id).first()
 
-    if not db_reference_nyaya_text:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Reference Nyaya Text - {nyaya_text_id} not found")  
+        if not db_reference_nyaya_text:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Reference Nyaya Text - {nyaya_text_id} not found")
 
-    return db_reference_nyaya_text
+        return schemas.NyayaTextReferenceOut.model_validate(db_reference_nyaya_text, from_attributes=True)
+
+    return response_cache.get_or_set(("reference_nyaya_texts", db_word.id, meaning_id, nyaya_text_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/{meaning_id}/nyaya-text-references", status_code=status.HTTP_201_CREATED)
@@ -87,20 +78,18 @@ async def create_word_reference_nyaya_text(word: str, meaning_id: int, reference
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     new_reference_nyaya_text = models.ReferenceNyayaText(**reference_nyaya_text.model_dump(), sanskrit_word_id = db_word.id, meaning_id = meaning_id)
     db.add(new_reference_nyaya_text)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_reference_nyaya_text)
 
+    reverse.add_document("reference_nyaya_texts", new_reference_nyaya_text.id, db_word.id, meaning_id, new_reference_nyaya_text.description)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("reference_nyaya_texts", new_reference_nyaya_text.id, "CREATE", current_db_manager.email, f"{new_reference_nyaya_text.source} - {new_reference_nyaya_text.description}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Reference Nyaya Text created successfully"})
@@ -124,14 +113,8 @@ async def update_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_tex
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_nyaya_text_reference = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id, models.ReferenceNyayaText.id == nyaya_text_id).first()
 
@@ -141,8 +124,12 @@ async def update_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_tex
     db_nyaya_text_reference.source = reference_nyaya_text.source
     db_nyaya_text_reference.description = reference_nyaya_text.description
     
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.add_document("reference_nyaya_texts", nyaya_text_id, db_nyaya_text_reference.sanskrit_word_id, db_nyaya_text_reference.meaning_id, reference_nyaya_text.description)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("reference_nyaya_texts", nyaya_text_id, "UPDATE", current_db_manager.email, f"{reference_nyaya_text.source} - {reference_nyaya_text.description}")
 
 
@@ -163,14 +150,8 @@ async def delete_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_tex
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_reference_nyaya_text = db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.meaning_id == meaning_id, models.ReferenceNyayaText.id == nyaya_text_id).first()
 
@@ -178,8 +159,12 @@ async def delete_word_reference_nyaya_text(word: str, meaning_id: int, nyaya_tex
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Reference Nyaya Text - {nyaya_text_id} not found")
     
     db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.meaning_id == meaning_id, models.ReferenceNyayaText.id == nyaya_text_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_document("reference_nyaya_texts", nyaya_text_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("reference_nyaya_texts", nyaya_text_id, "DELETE", current_db_manager.email, f"{db_reference_nyaya_text.source}")
 
 
@@ -199,17 +184,14 @@ async def delete_word_nyaya_text_references(word: str, meaning_id: int, db: Sess
     """
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
 
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id, models.ReferenceNyayaText.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_documents(db_word.id, table="reference_nyaya_texts", meaning_id=meaning_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("reference_nyaya_texts", meaning_id, "DELETE_ALL", current_db_manager.email)
\ No newline at end of file
@@ -5,8 +5,8 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from typing import List
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -16,7 +16,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/synonyms", response_model=List[schemas.SynonymOut])
-def get_word_synonyms(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_synonyms(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Get synonyms of a word based on the word and meaning_id.
     
@@ -28,21 +28,16 @@ def get_word_synonyms(word: str, meaning_id: int, db: Session = Depends(get_db))
     Returns:
         List[schemas.SynonymOut]: A list of synonym objects for the given word and meaning_id.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_synonyms = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id).all()
+    def load():
+        db_synonyms = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id).all()
 
-    return db_synonyms
+        return [schemas.SynonymOut.model_validate(row, from_attributes=True) for row in db_synonyms]
+
+    return response_cache.get_or_set(("synonyms", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/synonyms/{synonym_id}", response_model=schemas.SynonymOut)
-def get_word_synonym(word: str, meaning_id: int, synonym_id: int, db: Session = Depends(get_db)):
+def get_word_synonym(word: str, meaning_id: int, synonym_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieve a specific synonym for a given word and meaning_id.
 
@@ -55,20 +50,15 @@ def get_word_synonym(word: str, meaning_id: int, synonym_id: int, db: Session =
     Returns:
         schemas.SynonymOut: The synonym object for the given word, meaning_id, and synonym_id.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_synonym = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id, models.Synonym.id == synonym_id).first()
+    def load():
+        db_synonym = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id, models.Synonym.id == synonym_id).first()
 
-    if not db_synonym:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Synonym - {synonym_id} not found")
-    
-    return db_synonym
+        if not db_synonym:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Synonym - {synonym_id} not found")
+
+        return schemas.SynonymOut.model_validate(db_synonym, from_attributes=True)
+
+    return response_cache.get_or_set(("synonyms", db_word.id, meaning_id, synonym_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/{meaning_id}/synonyms", status_code=status.HTTP_201_CREATED)
@@ -88,21 +78,18 @@ async def create_word_synonym(word: str, meaning_id: int, synonym: schemas.Synon
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     new_synonym = models.Synonym(**synonym.model_dump(), sanskrit_word_id=db_word.id, meaning_id=meaning_id)
 
     db.add(new_synonym)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_synonym)
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("synonyms", new_synonym.id, "CREATE", current_user.email, new_synonym.synonym)
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Synonym created successfully"})
@@ -126,14 +113,8 @@ async def update_word_synonym(word: str, meaning_id: int, synonym_id: int, synon
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_synonym = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id, models.Synonym.id == synonym_id).first()
 
@@ -141,9 +122,12 @@ async def update_word_synonym(word: str, meaning_id: int, synonym_id: int, synon
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Synonym - {synonym_id} not found")
     
     db_synonym.synonym = synonym.synonym
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_synonym)
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("synonyms", db_synonym.id, "UPDATE", current_user.email, db_synonym.synonym)
 
 
@@ -161,14 +145,8 @@ async def delete_word_synonym(word: str, meaning_id: int, synonym_id: int, db: S
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_synonym = db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id, models.Synonym.id == synonym_id).first()
 
@@ -176,8 +154,11 @@ async def delete_word_synonym(word: str, meaning_id: int, synonym_id: int, db: S
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Synonym - {synonym_id} not found")
     
     db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id, models.Synonym.id == synonym_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("synonyms", db_synonym.id, "DELETE", current_user.email, db_synonym.synonym)
 
 
@@ -194,17 +175,13 @@ async def delete_word_synonyms(word: str, meaning_id: int, db: Session = Depends
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
 
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id, models.Synonym.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("synonyms", meaning_id, "DELETE_ALL", current_user.email)
\ No newline at end of file
@@ -5,8 +5,9 @@ from sqlalchemy.orm import Session
 from app import models, schemas
 from typing import List
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.indexes import reverse, translation_lookup
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -16,7 +17,7 @@ router = APIRouter(
 
 
 @router.get("/{word}/{meaning_id}/translations", response_model=List[schemas.TranslationOut])
-def get_word_translations(word: str, meaning_id: int, db: Session = Depends(get_db)):
+def get_word_translations(word: str, meaning_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves translations for a given word and meaning ID.
     
@@ -28,21 +29,16 @@ def get_word_translations(word: str, meaning_id: int, db: Session = Depends(get_
     Returns:
     - List[schemas.TranslationOut]: A list of translation objects for the given word and meaning ID.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    db_translations = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id).all()
+    def load():
+        db_translations = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id).all()
+
+        return [schemas.TranslationOut.model_validate(row, from_attributes=True) for row in db_translations]
 
-    return db_translations
+    return response_cache.get_or_set(("translations", db_word.id, meaning_id), load, word_id=db_word.id)
 
 
 @router.get("/{word}/{meaning_id}/translations/{translation_id}", response_model=schemas.TranslationOut)
-def get_word_translation(word: str, meaning_id: int, translation_id: int, db: Session = Depends(get_db)):
+def get_word_translation(word: str, meaning_id: int, translation_id: int, db: Session = Depends(get_db), db_word: word_middleware.ResolvedWord = Depends(word_middleware.resolve_word_meaning)):
     """
     Retrieves a specific translation for a given word, meaning ID, and translation ID.
 
@@ -55,20 +51,15 @@ def get_word_translation(word: str, meaning_id: int, translation_id: int, db: Se
     Returns:
     - schemas.TranslationOut: The translation object for the specified word, meaning ID, and translation ID.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")   
-    
-    db_translation = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id, models.Translation.id == translation_id).first()
+    def load():
+        db_translation = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id, models.Translation.id == translation_id).first()
 
-    if not db_translation:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Translation - {translation_id} not found")  
+        if not db_translation:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Translation - {translation_id} not found")
+
+        return schemas.TranslationOut.model_validate(db_translation, from_attributes=True)
 
-    return db_translation
+    return response_cache.get_or_set(("translations", db_word.id, meaning_id, translation_id), load, word_id=db_word.id)
 
 
 @router.post("/{word}/{meaning_id}/translations", status_code=status.HTTP_201_CREATED)
@@ -88,20 +79,19 @@ async def create_word_translation(word: str, meaning_id: int, translation: schem
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")   
-        
     new_translation = models.Translation(sanskrit_word_id = db_word.id, meaning_id = meaning_id, translation = translation.translation, language = translation.language)
     db.add(new_translation)
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(new_translation)
 
+    reverse.add_document("translations", new_translation.id, db_word.id, meaning_id, new_translation.translation)
+    translation_lookup.add_translation(new_translation.id, db_word.id, meaning_id, new_translation.language, new_translation.translation)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("translations", new_translation.id, "CREATE", current_user.email, f"{new_translation.language} - {new_translation.translation}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Translation created successfully"})
@@ -125,14 +115,8 @@ async def update_word_translation(word: str, meaning_id: int, translation_id: in
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_translation = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id, models.Translation.id == translation_id).first()
 
@@ -141,9 +125,14 @@ async def update_word_translation(word: str, meaning_id: int, translation_id: in
 
     db_translation.translation = translation.translation
     db_translation.language = translation.language
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
     db.refresh(db_translation)
 
+    reverse.add_document("translations", translation_id, db_translation.sanskrit_word_id, db_translation.meaning_id, db_translation.translation)
+    translation_lookup.add_translation(translation_id, db_translation.sanskrit_word_id, db_translation.meaning_id, db_translation.language, db_translation.translation)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("translations", translation_id, "UPDATE", current_user.email, f"{translation.language} - {translation.translation}")
 
 @router.delete("/{word}/{meaning_id}/translations/{translation_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -163,20 +152,19 @@ async def delete_word_translation(word: str, meaning_id: int, translation_id: in
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")   
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db_translation = db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id, models.Translation.id == translation_id).first()
     
     db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id, models.Translation.id == translation_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_document("translations", translation_id)
+    translation_lookup.remove_translation(translation_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("translations", translation_id, "DELETE", current_user.email, f"{db_translation.language} - {db_translation.translation}")
 
 
@@ -196,16 +184,15 @@ async def delete_word_translations(word: str, meaning_id: int, db: Session = Dep
     """
     if access_to_int(current_user.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
-    
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
-    
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")   
+
+    db_word = word_middleware.get_word(db, word, meaning_id)
     
     db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id, models.Translation.meaning_id == meaning_id).delete()
+    word_middleware.touch_word(db, db_word.id)
     db.commit()
 
+    reverse.remove_documents(db_word.id, table="translations", meaning_id=meaning_id)
+    translation_lookup.remove_translations(db_word.id, meaning_id=meaning_id)
+    response_cache.invalidate_word(db_word.id)
+
     await logger_middleware.log_database_operations("translations", meaning_id, "DELETE_ALL", current_user.email)
\ No newline at end of file
@@ -1,14 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import JSONResponse
+import json
+from datetime import UTC, datetime, time, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.config import settings
 from app.database import get_db
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
-from app import models, schemas
-from typing import List
+from app import counts, entries, models, schemas
+from typing import Dict, List, Optional
 from indic_transliteration import sanscript
 from indic_transliteration.sanscript import transliterate
 from app.utils.converter import access_to_int
-from app.utils.lang import isDevanagariWord
-from app.middleware import auth_middleware, logger_middleware
+from app.utils.lang import isDevanagariWord, normalizeWord, toCollationKey, toSearchKey
+from app.indexes import dhatus, headwords, reverse, sandhi, translation_lookup
+from app.middleware import auth_middleware, logger_middleware, word_middleware
+from app.cache import response_cache
 
 
 router = APIRouter(
@@ -28,39 +34,228 @@ def get_word_count(db: Session = Depends(get_db)):
     Returns:
         int: The total count of words in the database.
     """
-    return db.query(models.SanskritWord).count()
+    return response_cache.get_or_set(("total-count",), lambda: counts.get_counts(db)[models.SanskritWord.__tablename__])
+
+
+@router.get("/counts", response_model=Dict[str, int])
+def get_table_counts(db: Session = Depends(get_db)):
+    """
+    Retrieves the number of rows in each dictionary table: words, meanings and every child resource of a meaning.
+
+    The counts are maintained on every write (see `app/counts.py`), so this is a lookup rather than a `COUNT(*)` per table.
+
+    Parameters:
+        db (Session): The database session object.
+
+    Returns:
+        Dict[str, int]: The row counts by table name, e.g. {"sanskrit_words": 1, "meanings": 2, ...}.
+    """
+    return counts.get_counts(db)
+
+
+STREAM_BATCH_SIZE = 1000
+
+
+def _with_meaning_ids(db: Session, query, whole_table: bool = False) -> list[dict]:
+    # One query for the page of headwords and one for the meaning ids of all of them.
+    words = {
+        word_id: {"id": word_id, "sanskrit_word": sanskrit_word, "english_transliteration": english_transliteration, "meaning_ids": []}
+        for word_id, sanskrit_word, english_transliteration in query
+    }
+    if not words:
+        return []
+
+    meanings = db.query(models.Meaning.sanskrit_word_id, models.Meaning.id)
+    if not whole_table:
+        meanings = meanings.filter(models.Meaning.sanskrit_word_id.in_(words))
+    for word_id, meaning_id in meanings.order_by(models.Meaning.id):
+        if word_id in words:
+            words[word_id]["meaning_ids"].append(meaning_id)
+
+    return list(words.values())
+
+
+def _words_with_meaning_ids(db: Session, after: Optional[str] = None, limit: Optional[int] = None) -> list[dict]:
+    query = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration)
+    if after is not None:
+        query = query.filter(models.SanskritWord.sanskrit_word > after)
+    query = query.order_by(models.SanskritWord.sanskrit_word)
+    if limit is not None:
+        query = query.limit(limit)
+
+    return _with_meaning_ids(db, query, whole_table=after is None and limit is None)
+
+
+def _stream_words(db: Session, after: Optional[str]):
+    # Each batch is its own keyset page, so memory stays bounded by `STREAM_BATCH_SIZE` words.
+    try:
+        yield "["
+        first = True
+        while True:
+            words = _words_with_meaning_ids(db, after, STREAM_BATCH_SIZE)
+            for word in words:
+                yield ("" if first else ",") + json.dumps(word, ensure_ascii=False)
+                first = False
+            if len(words) < STREAM_BATCH_SIZE:
+                break
+            after = words[-1]["sanskrit_word"]
+        yield "]"
+    finally:
+        db.close()
 
 
 @router.get("/", response_model=List[schemas.WordOut])
-def get_words(db: Session = Depends(get_db)):
+def get_words(limit: Optional[int] = None, after: Optional[str] = None, stream: bool = False, db: Session = Depends(get_db)):
     """
     Retrieves a list of words from the database and returns them as a list of `schemas.WordOut` objects.
 
+    The words are ordered by `sanskrit_word` and their meaning ids are fetched with one query for the whole page, so a
+    call issues two queries however many words it returns. Pages are keyset-paginated: pass the `sanskrit_word` of the
+    last word of a page as `after` to get the next one.
+
     Parameters:
+        limit (int, optional): The maximum number of words to return, at most `settings.words_max_page_size`. Defaults to every word.
+        after (str, optional): Only return the words ordered after this `sanskrit_word`.
+        stream (bool, optional): Stream every word after `after` as one JSON array, fetched in batches, instead of building the whole list in memory. `limit` is ignored. Defaults to False.
         db (Session): The database session object.
 
     Returns:
         List[schemas.WordOut]: A list of `schemas.WordOut` objects representing the retrieved words.
     """
-    db_words = db.query(models.SanskritWord).order_by(models.SanskritWord.sanskrit_word).all()
+    if stream:
+        return StreamingResponse(_stream_words(db, normalizeWord(after) if after is not None else None), media_type="application/json")
+
+    if limit is not None:
+        limit = max(1, min(limit, settings.words_max_page_size))
+    if after is not None:
+        after = normalizeWord(after)
 
-    words = []
+    return response_cache.get_or_set(("words", limit, after), lambda: _words_with_meaning_ids(db, after, limit))
 
-    for db_word in db_words:
-        meaning_ids = db.query(models.Meaning.id).filter(models.Meaning.sanskrit_word_id == db_word.id).all()
-        words.append({
-            "id": db_word.id,
-            "sanskrit_word": db_word.sanskrit_word,
-            "english_transliteration": db_word.english_transliteration,
-            "meaning_ids": [x[0] for x in meaning_ids]
-        })
-    return words
+
+@router.get("/browse", response_model=List[schemas.WordOut])
+def browse_words(after: Optional[str] = None, limit: int = 100, db: Session = Depends(get_db)):
+    """
+    Retrieves a page of words in Sanskrit alphabetical (varṇamālā) order: अ आ इ ... औ, anusvara and visarga, then
+    क ख ग ... ह, rather than in the codepoint order of `GET /words/`.
+
+    The words are ordered by their `collation_key` (see `toCollationKey`), then spelling, which the
+    `(collation_key, sanskrit_word)` index holds in order, so a page, including one that starts at a letter such as
+    `after=क`, is a range scan of that index rather than a sort of the whole table. Pages are
+    keyset-paginated: pass the `sanskrit_word` of the last word of a page as `after` to get the next one.
+
+    Parameters:
+        after (str, optional): Only return the words ordered after this word or letter, in any supported scheme.
+            Defaults to starting at the first word.
+        limit (int, optional): The maximum number of words to return, at most `settings.words_max_page_size`. Defaults to 100.
+        db (Session): The database session object.
+
+    Returns:
+        List[schemas.WordOut]: The words, with the ids of their meanings.
+    """
+    limit = max(1, min(limit, settings.words_max_page_size))
+    if after is not None:
+        after = normalizeWord(after)
+
+    def load():
+        query = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration)
+        if after is not None:
+            # Words sharing a collation key (e.g. differing only in an avagraha) are ordered by their spelling.
+            collation_key = toCollationKey(after)
+            query = query.filter(or_(
+                models.SanskritWord.collation_key > collation_key,
+                and_(models.SanskritWord.collation_key == collation_key, models.SanskritWord.sanskrit_word > after),
+            ))
+        query = query.order_by(models.SanskritWord.collation_key, models.SanskritWord.sanskrit_word).limit(limit)
+
+        return _with_meaning_ids(db, query)
+
+    return response_cache.get_or_set(("browse", limit, after), load)
+
+
+def _cached_entry(db: Session, word_id: int, sanskrit_word: str, english_transliteration: Optional[str]) -> schemas.WordEntry:
+    def load():
+        return entries.load_entries(db, [(word_id, sanskrit_word, english_transliteration)])[word_id]
+
+    return response_cache.get_or_set(("entry", word_id), load, word_id=word_id)
+
+
+def _indexed_word(word_id: Optional[int]) -> tuple[int, str, Optional[str]]:
+    # A word picked from the headword index, which a concurrent delete may have removed since.
+    word = headwords.words.get(word_id) if word_id is not None else None
+    if word is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No words found")
+    return word_id, *word
+
+
+@router.get("/random", response_model=schemas.WordEntry)
+def get_random_word(response: Response, db: Session = Depends(get_db)):
+    """
+    Retrieves the full entry (as returned by `GET /words/{word}/entry`) of a word picked at random.
+
+    The word is picked from the in-memory array of headword ids, in constant time, rather than with `ORDER BY RAND()`
+    or a `COUNT` and `OFFSET` on `sanskrit_words`, and its entry is served from the response cache when it is there.
+
+    Parameters:
+        response (Response): The response, marked as not cacheable.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        schemas.WordEntry: The entry.
+
+    Raises:
+        HTTPException: If there are no words.
+    """
+    headwords.ensure_loaded(db)
+    word_id, sanskrit_word, english_transliteration = _indexed_word(headwords.random_word_id())
+
+    response.headers["Cache-Control"] = "no-store"
+    return _cached_entry(db, word_id, sanskrit_word, english_transliteration)
+
+
+@router.get("/of-the-day", response_model=schemas.WordEntry)
+def get_word_of_the_day(response: Response, db: Session = Depends(get_db)):
+    """
+    Retrieves the full entry (as returned by `GET /words/{word}/entry`) of the word of the day (UTC).
+
+    The word is a deterministic pick from the in-memory array of headword ids, kept for the whole day (see
+    `headwords.word_of_the_day_id`). Its entry is rendered once and served from the response cache until the word
+    is written, so serving it costs no query, and clients and proxies may cache the response until midnight UTC.
+
+    Parameters:
+        response (Response): The response, whose `Cache-Control` lasts until midnight UTC.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        schemas.WordEntry: The entry.
+
+    Raises:
+        HTTPException: If there are no words.
+    """
+    now = datetime.now(UTC)
+    today = now.date()
+
+    headwords.ensure_loaded(db)
+    word_id, sanskrit_word, english_transliteration = _indexed_word(headwords.word_of_the_day_id(today))
+    entry = _cached_entry(db, word_id, sanskrit_word, english_transliteration)
+
+    midnight = datetime.combine(today + timedelta(days=1), time(), tzinfo=UTC)
+    response.headers["Cache-Control"] = f"public, max-age={int((midnight - now).total_seconds())}"
+    return entry
+
+
+def _word_not_found(db: Session, word: str) -> JSONResponse:
+    headwords.ensure_loaded(db)
+    suggestions = [[sanskrit_word, english_transliteration] for sanskrit_word, english_transliteration in headwords.suggest(word, 5)]
+    return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": f"Word - {word} not found", "suggestions": suggestions})
 
 
 @router.get("/{word}", response_model=schemas.WordOut)
-def get_word(word: str, db: Session = Depends(get_db)):
+def get_word(word: str, request: Request, response: Response, db: Session = Depends(get_db)):
     """
     Retrieves information about a word from the database based on the provided word.
+
+    The word may be given in Devanagari, its stored transliteration, or any other scheme supported by `toSearchKey`.
     
     Parameters:
         word (str): The word to retrieve information for.
@@ -69,27 +264,146 @@ def get_word(word: str, db: Session = Depends(get_db)):
     Returns:
         dict: A dictionary containing information about the word, including its ID, Sanskrit word, English word, etymologies, derivations, translations, reference texts, synonyms, and antonyms.
     
-    Raises:
-        HTTPException: If the word is not found in the database.
+    Responds with 404 and a list of spelling suggestions if the word is not found in the database, and with 304 if the
+    request's `If-None-Match` or `If-Modified-Since` matches the word's revision.
     """
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
+    word = normalizeWord(word)
+    db_word = word_middleware.word_resolver.resolve(db, word)
 
     if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
+        return _word_not_found(db, word)
 
-    meaning_ids = db.query(models.Meaning.id).filter(models.Meaning.sanskrit_word_id == db_word.id).all()
+    word_middleware.check_revision(request, response, db, db_word.id)
 
     return {
         "id": db_word.id,
         "sanskrit_word": db_word.sanskrit_word,
         "english_transliteration": db_word.english_transliteration,
-        "meaning_ids": [x[0] for x in meaning_ids]
+        "meaning_ids": sorted(db_word.meaning_ids)
     }
 
 
+@router.get("/{word}/entry", response_model=schemas.WordEntry)
+def get_word_entry(word: str, request: Request, response: Response, db: Session = Depends(get_db)):
+    """
+    Retrieves the full dictionary entry of a word: the word, its meanings, and the etymologies, derivations,
+    translations, Nyaya text references, examples, synonyms and antonyms of every meaning.
+
+    The meanings and all their child rows are read with a single `UNION ALL` query over the child tables, so the whole
+    entry costs that query plus the lookup of the word, instead of one request (and word lookup) per resource.
+
+    Parameters:
+        word (str): The word, in Devanagari, its stored transliteration, or any other scheme supported by `toSearchKey`.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        schemas.WordEntry: The nested entry, with meanings and child rows in id order.
+
+    Responds with 404 and a list of spelling suggestions if the word is not found in the database, and with 304 if the
+    request's `If-None-Match` or `If-Modified-Since` matches the word's revision, without reading the child tables.
+    """
+    word = normalizeWord(word)
+    db_word = word_middleware.word_resolver.resolve(db, word)
+
+    if not db_word:
+        return _word_not_found(db, word)
+
+    word_middleware.check_revision(request, response, db, db_word.id)
+
+    return _cached_entry(db, db_word.id, db_word.sanskrit_word, db_word.english_transliteration)
+
+
+@router.get("/{word}/neighbors", response_model=schemas.WordNeighbors)
+def get_word_neighbors(word: str, n: int = 5, db: Session = Depends(get_db)):
+    """
+    Retrieves the headwords just before and just after a word in Sanskrit alphabetical (varṇamālā) order, the order
+    of `GET /words/browse`, e.g. for the previous/next links of a dictionary page.
+
+    Each side is one range query on the `(collation_key, sanskrit_word)` index, bounded by `n`, so the cost does not
+    depend on the size of the dictionary.
+
+    Parameters:
+        word (str): The word, in Devanagari, its stored transliteration, or any other scheme supported by `toSearchKey`.
+        n (int, optional): The number of headwords on each side, at most `settings.words_max_neighbors`. Defaults to 5.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        schemas.WordNeighbors: The headwords before and after the word, both in alphabetical order.
+
+    Responds with 404 and a list of spelling suggestions if the word is not found in the database.
+    """
+    word = normalizeWord(word)
+    db_word = word_middleware.word_resolver.resolve(db, word)
+
+    if not db_word:
+        return _word_not_found(db, word)
+
+    n = max(1, min(n, settings.words_max_neighbors))
+    collation_key = toCollationKey(db_word.sanskrit_word)
+
+    def load():
+        query = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration)
+        before = query.filter(or_(
+            models.SanskritWord.collation_key < collation_key,
+            and_(models.SanskritWord.collation_key == collation_key, models.SanskritWord.sanskrit_word < db_word.sanskrit_word),
+        )).order_by(models.SanskritWord.collation_key.desc(), models.SanskritWord.sanskrit_word.desc()).limit(n).all()
+        after = query.filter(or_(
+            models.SanskritWord.collation_key > collation_key,
+            and_(models.SanskritWord.collation_key == collation_key, models.SanskritWord.sanskrit_word > db_word.sanskrit_word),
+        )).order_by(models.SanskritWord.collation_key, models.SanskritWord.sanskrit_word).limit(n).all()
+
+        return schemas.WordNeighbors(
+            before=[schemas.WordSummary(id=row.id, sanskrit_word=row.sanskrit_word, english_transliteration=row.english_transliteration) for row in reversed(before)],
+            after=[schemas.WordSummary(id=row.id, sanskrit_word=row.sanskrit_word, english_transliteration=row.english_transliteration) for row in after],
+        )
+
+    # The neighbors change whenever a word is added, renamed or deleted, which invalidates the listing entries.
+    return response_cache.get_or_set(("neighbors", db_word.id, n), load)
+
+
+@router.post("/batch", response_model=Dict[str, schemas.WordEntry])
+def get_word_entries(batch: schemas.WordBatchIn, db: Session = Depends(get_db)):
+    """
+    Retrieves the full entries (as returned by `GET /words/{word}/entry`) of many words at once, e.g. for exports or
+    offline prefetching.
+
+    The words are resolved together with one query of `IN` predicates, matching each headword the way
+    `GET /words/{word}` does, and the meanings and child rows of all of them are read with one more query.
+
+    Parameters:
+        batch (schemas.WordBatchIn): The headwords, in Devanagari, their stored transliteration or any other scheme
+            supported by `toSearchKey`, and/or word ids.
+        db (Session, optional): The database session. Defaults to the result of the `get_db` function.
+
+    Returns:
+        Dict[str, schemas.WordEntry]: The entries keyed by Devanagari headword, in id order. Words that are not found
+            are left out.
+
+    Raises:
+        HTTPException: If more than `settings.words_batch_max_size` headwords and ids are sent.
+    """
+    if len(batch.words) + len(batch.ids) > settings.words_batch_max_size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {settings.words_batch_max_size} words can be fetched at once")
+
+    terms = {normalizeWord(term) for term in batch.words} - {""}
+    devanagari_terms = {term for term in terms if isDevanagariWord(term)}
+
+    if not terms and not batch.ids:
+        return {}
+
+    db_words = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration).filter(or_(
+        models.SanskritWord.id.in_(set(batch.ids)),
+        models.SanskritWord.sanskrit_word.in_(devanagari_terms),
+        models.SanskritWord.english_transliteration.in_(terms - devanagari_terms),
+        models.SanskritWord.search_key.in_({toSearchKey(term) for term in terms}),
+    )).order_by(models.SanskritWord.id).all()
+
+    if not db_words:
+        return {}
+
+    return {entry.sanskrit_word: entry for entry in entries.load_entries(db, [tuple(db_word) for db_word in db_words]).values()}
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_word(word: schemas.WordCreate, db: Session = Depends(get_db), current_db_manager: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
     """
@@ -109,6 +423,9 @@ async def create_word(word: schemas.WordCreate, db: Session = Depends(get_db), c
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
     
+    word.sanskrit_word = normalizeWord(word.sanskrit_word or "")
+    word.english_transliteration = normalizeWord(word.english_transliteration or "")
+
     if word.sanskrit_word == "" or not word.sanskrit_word:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"sanskrit_word cannot be empty")
     
@@ -126,11 +443,16 @@ async def create_word(word: schemas.WordCreate, db: Session = Depends(get_db), c
     if not word.english_transliteration or word.english_transliteration == "":
         word.english_transliteration = transliterate(word.sanskrit_word, sanscript.DEVANAGARI, sanscript.IAST)
 
-    new_word = models.SanskritWord(**word.model_dump())
+    new_word = models.SanskritWord(**word.model_dump(), search_key=toSearchKey(word.sanskrit_word), collation_key=toCollationKey(word.sanskrit_word))
     db.add(new_word)
     db.commit()
     db.refresh(new_word)
 
+    headwords.add_word(new_word.id, new_word.sanskrit_word, new_word.english_transliteration, new_word.search_key)
+    sandhi.add_word(new_word.id, new_word.sanskrit_word)
+    word_middleware.word_resolver.invalidate_word(new_word.id)
+    response_cache.invalidate_word(new_word.id, listing=True)
+
     await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=new_word.id, operation="CREATE", db_manager_email=current_db_manager.email, new_value=f"{new_word.sanskrit_word} - {new_word.english_transliteration}")
 
     return JSONResponse(status_code=status.HTTP_201_CREATED, content={"message": "Word added successfully"})
@@ -156,15 +478,12 @@ async def update_word(word: str, wordIn: schemas.WordUpdate, db: Session = Depen
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.READ_WRITE_MODIFY):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(wordIn.sanskrit_word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
+    db_word = word_middleware.get_word(db, word)
 
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {wordIn.sanskrit_word} not found")
+    wordIn.sanskrit_word = normalizeWord(wordIn.sanskrit_word or "") or db_word.sanskrit_word
+    wordIn.english_transliteration = normalizeWord(wordIn.english_transliteration or "")
     
-    if wordIn.sanskrit_word != word and db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == wordIn.sanskrit_word).first():
+    if wordIn.sanskrit_word != db_word.sanskrit_word and db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == wordIn.sanskrit_word).first():
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Word - {wordIn.sanskrit_word} already exists")
     
     if wordIn.english_transliteration != db_word.english_transliteration and db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == wordIn.english_transliteration).first():
@@ -173,18 +492,49 @@ async def update_word(word: str, wordIn: schemas.WordUpdate, db: Session = Depen
     if not wordIn.english_transliteration or wordIn.english_transliteration == "":
         wordIn.english_transliteration = transliterate(wordIn.sanskrit_word, sanscript.DEVANAGARI, sanscript.IAST)
     
-    db_word.sanskrit_word = wordIn.sanskrit_word
-    db_word.english_transliteration = wordIn.english_transliteration
+    search_key = toSearchKey(wordIn.sanskrit_word)
+    db.query(models.SanskritWord).filter(models.SanskritWord.id == db_word.id).update({
+        models.SanskritWord.sanskrit_word: wordIn.sanskrit_word,
+        models.SanskritWord.english_transliteration: wordIn.english_transliteration,
+        models.SanskritWord.search_key: search_key,
+        models.SanskritWord.collation_key: toCollationKey(wordIn.sanskrit_word),
+    }, synchronize_session=False)
+    word_middleware.touch_word(db, db_word.id)
     
     db.commit()
-    db.refresh(db_word)
+
+    headwords.update_word(db_word.id, wordIn.sanskrit_word, wordIn.english_transliteration, search_key)
+    sandhi.update_word(db_word.id, wordIn.sanskrit_word)
+    word_middleware.word_resolver.invalidate_word(db_word.id)
+    response_cache.invalidate_word(db_word.id, listing=True)
     
-    await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=db_word.id, operation="UPDATE", db_manager_email=current_db_manager.email, new_value=f"{db_word.sanskrit_word} - {db_word.english_transliteration}")
+    await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=db_word.id, operation="UPDATE", db_manager_email=current_db_manager.email, new_value=f"{wordIn.sanskrit_word} - {wordIn.english_transliteration}")
+
+def _delete_words(db: Session, word_ids: list[int]) -> None:
+    # One DELETE of the headwords; their meanings and child rows go with them through ON DELETE CASCADE, which the
+    # maintained counts and the in-memory indexes are told about here.
+    if not word_ids:
+        return
+
+    counts.count_cascade(db, models.SanskritWord, word_ids)
+    db.query(models.SanskritWord).filter(models.SanskritWord.id.in_(word_ids)).delete(synchronize_session=False)
+    db.commit()
+
+    for word_id in word_ids:
+        headwords.remove_word(word_id)
+        sandhi.remove_word(word_id)
+        word_middleware.word_resolver.invalidate_word(word_id)
+        reverse.remove_documents(word_id)
+        translation_lookup.remove_translations(word_id)
+        dhatus.remove_derivations(word_id)
+        response_cache.invalidate_word(word_id, listing=True)
+
 
 @router.delete("/{word}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_word(word: str, db: Session = Depends(get_db), current_db_manager: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
     """
     Delete a word from the database along with its associated meanings, etymologies, derivations, translations, reference Nyaya texts, examples, synonyms, antonyms. 
+    The associated rows are removed by the database through the `ON DELETE CASCADE` foreign keys.
     Parameters:
         - word: str
         - db: Session = Depends(get_db)
@@ -195,26 +545,52 @@ async def delete_word(word: str, db: Session = Depends(get_db), current_db_manag
     if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
 
-    if isDevanagariWord(word):
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word == word).first()
-    else:
-        db_word = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration == word).first()
+    db_word = word_middleware.get_word(db, word)
 
-    if not db_word:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Word - {word} not found")
-    
-    word_id = db_word.id
+    word = normalizeWord(word)
 
-    db.query(models.Etymology).filter(models.Etymology.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Derivation).filter(models.Derivation.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Translation).filter(models.Translation.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.ReferenceNyayaText).filter(models.ReferenceNyayaText.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Example).filter(models.Example.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Synonym).filter(models.Synonym.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Antonym).filter(models.Antonym.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.Meaning).filter(models.Meaning.sanskrit_word_id == db_word.id).delete(synchronize_session=False)
-    db.query(models.SanskritWord).filter(models.SanskritWord.id == db_word.id).delete(synchronize_session=False)
+    _delete_words(db, [db_word.id])
 
-    db.commit()
+    await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=db_word.id, operation="DELETE", db_manager_email=current_db_manager.email, new_value=word)
+
+
+@router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_words(batch: schemas.WordBulkDelete, db: Session = Depends(get_db), current_db_manager: schemas.DBManager = Depends(auth_middleware.get_current_db_manager)):
+    """
+    Deletes many words at once, e.g. to clean up after a bad import, along with everything attached to them.
+
+    The words are looked up with one query and deleted with one more in a single transaction; their meanings and
+    child rows are removed by the database through the `ON DELETE CASCADE` foreign keys. If any of the words does
+    not exist, nothing is deleted.
+
+    Parameters:
+        batch (schemas.WordBulkDelete): The headwords, in Devanagari or their stored transliteration.
+        db (Session): The database session.
+        current_db_manager (schemas.DBManager): The current user.
+
+    Raises:
+        HTTPException: If the user may not delete words, more than `settings.words_batch_max_size` words are sent,
+            or some of the words are not found.
+    """
+    if access_to_int(current_db_manager.access) < access_to_int(schemas.Access.ALL):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to perform requested action")
+
+    if len(batch.words) > settings.words_batch_max_size:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"At most {settings.words_batch_max_size} words can be deleted at once")
+
+    terms = {normalizeWord(term) for term in batch.words} - {""}
+    devanagari_terms = {term for term in terms if isDevanagariWord(term)}
+
+    db_words = db.query(models.SanskritWord.id, models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration).filter(or_(
+        models.SanskritWord.sanskrit_word.in_(devanagari_terms),
+        models.SanskritWord.english_transliteration.in_(terms - devanagari_terms),
+    )).all()
+
+    missing = terms - {sanskrit_word for _, sanskrit_word, _ in db_words} - {english_transliteration for _, _, english_transliteration in db_words}
+    if missing:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Words - {', '.join(sorted(missing))} not found")
+
+    _delete_words(db, [word_id for word_id, _, _ in db_words])
 
-    await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=word_id, operation="DELETE", db_manager_email=current_db_manager.email, new_value=word)
+    for word_id, sanskrit_word, _ in db_words:
+        await logger_middleware.log_database_operations(table_name="sanskrit_words", record_id=word_id, operation="DELETE", db_manager_email=current_db_manager.email, new_value=sanskrit_word)
@@ -48,6 +48,13 @@ class TranslationOut(Translation):
     meaning_id: int
 
 
+class TranslationLookupResult(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+    translations: List[TranslationOut]
+
+
 class NyayaTextReference(BaseModel):
     source: str
     description: Optional[str] = None
@@ -105,6 +112,43 @@ class WordOut(Word):
     id: int
 
 
+class MeaningEntry(MeaningOut):
+    etymologies: List[EtymologyOut] = []
+    derivations: List[DerivationOut] = []
+    translations: List[TranslationOut] = []
+    nyaya_text_references: List[NyayaTextReferenceOut] = []
+    examples: List[ExampleOut] = []
+    synonyms: List[SynonymOut] = []
+    antonyms: List[AntonymOut] = []
+
+
+class WordEntry(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+    meanings: List[MeaningEntry]
+
+
+class WordSummary(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+
+
+class WordNeighbors(BaseModel):
+    before: List[WordSummary]
+    after: List[WordSummary]
+
+
+class WordBatchIn(BaseModel):
+    words: List[str] = []
+    ids: List[int] = []
+
+
+class WordBulkDelete(BaseModel):
+    words: List[str]
+
+
 class WordCreate(BaseModel):
     sanskrit_word: str
     english_transliteration: Optional[str] = None
@@ -115,6 +159,75 @@ class WordUpdate(BaseModel):
     english_transliteration: Optional[str] = None
 
 
+class ReverseSearchMatch(BaseModel):
+    source: str
+    id: int
+    meaning_id: int
+
+
+class ReverseSearchResult(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+    score: float
+    matches: List[ReverseSearchMatch]
+
+
+class SearchPage(BaseModel):
+    results: List[List[Optional[str]]]
+    next_cursor: Optional[str] = None
+    total_hits: int
+    suggestions: List[List[Optional[str]]] = []
+
+
+class BatchSearchIn(BaseModel):
+    terms: List[str]
+    limit: int = 5
+
+
+class BatchSearchResult(BaseModel):
+    term: str
+    normalized_term: str
+    exact: bool
+    matches: List[WordOut]
+
+
+class AnnotateIn(BaseModel):
+    text: str
+
+
+class Annotation(BaseModel):
+    start: int
+    end: int
+    text: str
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+
+
+class RootOut(BaseModel):
+    root: str
+    word_count: int
+
+
+class RootWord(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+    derivation_ids: List[int]
+
+
+class SplitComponent(BaseModel):
+    id: int
+    sanskrit_word: str
+    english_transliteration: Optional[str] = None
+
+
+class SplitResult(BaseModel):
+    components: List[SplitComponent]
+    sandhi_count: int
+
+
 class Role(str, Enum):
     SUPERUSER = "SUPERUSER"
     ADMIN = "ADMIN"
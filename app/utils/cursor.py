@@ -0,0 +1,36 @@
+import base64
+import json
+
+
+def encodeCursor(position: tuple | list) -> str:
+    """
+    Encodes a keyset position (the sort key of the last row of a page) as an opaque, URL-safe cursor.
+
+    Parameters:
+        position (tuple | list): The JSON-serializable sort key.
+
+    Returns:
+        str: The cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(list(position), ensure_ascii=False).encode()).decode().rstrip("=")
+
+
+def decodeCursor(cursor: str) -> tuple | None:
+    """
+    Decodes a cursor produced by `encodeCursor`.
+
+    Parameters:
+        cursor (str): The cursor.
+
+    Returns:
+        tuple | None: The sort key, or None if the cursor is malformed.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        return None
+
+    if not isinstance(position, list):
+        return None
+
+    return tuple(position)
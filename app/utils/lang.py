@@ -1,3 +1,36 @@
+import re
+import unicodedata
+from indic_transliteration import detect, sanscript
+from indic_transliteration.sanscript import transliterate
+
+
+JOINERS = re.compile("[\u200c\u200d]")
+
+# An anusvara before a stop, which is written as the nasal of the stop's class: "संकल्प" is stored as "सङ्कल्प".
+CLASS_NASALS = {
+    **dict.fromkeys("\u0915\u0916\u0917\u0918\u0919", "\u0919"),
+    **dict.fromkeys("\u091a\u091b\u091c\u091d\u091e", "\u091e"),
+    **dict.fromkeys("\u091f\u0920\u0921\u0922\u0923", "\u0923"),
+    **dict.fromkeys("\u0924\u0925\u0926\u0927\u0928", "\u0928"),
+    **dict.fromkeys("\u092a\u092b\u092c\u092d\u092e", "\u092e"),
+}
+# Only the 25 stops: the range क-म also holds letters such as ऩ that belong to no class.
+ANUSVARA_BEFORE_STOP = re.compile("\u0902(?=[" + "".join(CLASS_NASALS) + "])")
+# The same rule on a folded search key, where every class nasal but "m" has become "n": "saṃkalpa" and "samkalpa" get
+# the key "sankalpa" of सङ्कल्प, and "m" before a labial stop is already its class nasal.
+KEY_NASAL_BEFORE_STOP = re.compile("m(?=[kgcjtd])")
+
+# The varṇamālā in SLP1: the vowels, anusvara and visarga, then the consonants class by class, and the Vedic ळ last.
+# Each letter collates as its two-digit position, so the keys sort the same under any database collation.
+VARNAMALA = "aAiIuUfFxXeEoOMHkKgGNcCjJYwWqQRtTdDnpPbBmyrlvSzshL"
+COLLATION_CODES = {
+    **{letter: f"{position + 10:02d}" for position, letter in enumerate(VARNAMALA)},
+    "~": f"{VARNAMALA.index('M') + 10:02d}",
+    "Z": f"{VARNAMALA.index('H') + 10:02d}",
+    "V": f"{VARNAMALA.index('H') + 10:02d}",
+}
+
+
 def isDevanagariWord(word: str) -> bool:
     devanagari_range = (0x0900, 0x097F)
     return all(ord(char) >= devanagari_range[0] and ord(char) <= devanagari_range[1] for char in word)
@@ -11,4 +44,174 @@ def isKannadaWord(word: str) -> bool:
 def isEnglishWord(word: str) -> bool:
     english_range = (0x0041, 0x005A)  # A-Z
     english_range += (0x0061, 0x007A)  # a-z
-    return all(ord(char) >= english_range[0] and ord(char) <= english_range[1] or ord(char) >= english_range[2] and ord(char) <= english_range[3] for char in word)
\ No newline at end of file
+    return all(ord(char) >= english_range[0] and ord(char) <= english_range[1] or ord(char) >= english_range[2] and ord(char) <= english_range[3] for char in word)
+
+
+def normalizeWord(word: str) -> str:
+    """
+    Brings a word to the one spelling it is stored under, so that exact lookups match however the word was typed.
+
+    Whitespace is collapsed and the word is composed to Unicode NFC. Devanagari zero-width joiners and non-joiners,
+    which only select glyph variants, are dropped, and an anusvara before a stop is written as the class nasal with
+    a virama ("संकल्प" becomes "सङ्कल्प"), the spelling most headwords already use.
+
+    Parameters:
+        word (str): The word to normalize, in any script.
+
+    Returns:
+        str: The normalized word.
+    """
+    word = unicodedata.normalize("NFC", " ".join(word.split()))
+    if not any("\u0900" <= char <= "\u097f" for char in word):
+        return word
+
+    word = JOINERS.sub("", word)
+    return ANUSVARA_BEFORE_STOP.sub(lambda match: CLASS_NASALS[word[match.end()]] + "\u094d", word)
+
+
+def normalizeText(text: str) -> tuple[str, list[tuple[int, int]]]:
+    """
+    Normalizes a passage the way `normalizeWord` normalizes a word, keeping track of where every character of the
+    result came from, so that a span found in the normalized passage can be mapped back to the original one.
+
+    Parameters:
+        text (str): The passage to normalize, in any script.
+
+    Returns:
+        tuple[str, list[tuple[int, int]]]: The normalized passage, and for each of its characters the (start, end)
+            offsets, `end` exclusive, of the original characters it was made from.
+    """
+    drop_joiners = any("\u0900" <= char <= "\u097f" for char in text)
+
+    # Whitespace runs collapse into one space and joiners are dropped, one original character at a time.
+    chars, origins = [], []
+    for i, char in enumerate(text):
+        if char.isspace():
+            if chars and chars[-1] != " ":
+                chars.append(" ")
+                origins.append((i, i + 1))
+        elif not (drop_joiners and JOINERS.match(char)):
+            chars.append(char)
+            origins.append((i, i + 1))
+    if chars and chars[-1] == " ":
+        chars.pop()
+        origins.pop()
+
+    # NFC only composes a character with the combining marks that follow it, so each run starting at a character of
+    # combining class 0 is composed on its own; a run that changes maps, as a whole, to the characters it came from.
+    runs = [i for i, char in enumerate(chars) if i == 0 or unicodedata.combining(char) == 0] + [len(chars)]
+    composed, composed_origins = [], []
+    for start, end in zip(runs, runs[1:]):
+        run = "".join(chars[start:end])
+        normalized = unicodedata.normalize("NFC", run)
+        composed.append(normalized)
+        if normalized == run:
+            composed_origins += origins[start:end]
+        else:
+            composed_origins += [(origins[start][0], origins[end - 1][1])] * len(normalized)
+
+    text = "".join(composed)
+    if not drop_joiners:
+        return text, composed_origins
+
+    # Both characters written for an anusvara before a stop come from the anusvara.
+    chars, origins = [], []
+    for i, char in enumerate(text):
+        if ANUSVARA_BEFORE_STOP.match(text, i):
+            chars += [CLASS_NASALS[text[i + 1]], "\u094d"]
+            origins += [composed_origins[i]] * 2
+        else:
+            chars.append(char)
+            origins.append(composed_origins[i])
+
+    return "".join(chars), origins
+
+
+def toSearchKey(word: str) -> str:
+    """
+    Converts a word typed in any supported scheme to its canonical search key.
+
+    The scheme (Devanagari, Kannada, IAST, Harvard-Kyoto, ITRANS, Velthuis, ...) is detected, the word is
+    transliterated to IAST and then folded to lower-case ASCII by dropping diacritics, so "न्याय", "ನ್ಯಾಯ",
+    "nyāya", "nyAya", "NYAYA" and "nyaya" all share the key "nyaya". A word typed all in capitals is lower-cased
+    first, as its capitals carry no Harvard-Kyoto or ITRANS meaning. An anusvara or "m" before a stop becomes the
+    stop's class nasal, as `normalizeWord` does for Devanagari, so "saṃkalpa" and "samkalpa" share the key
+    "sankalpa" of "सङ्कल्प".
+
+    Parameters:
+        word (str): The word to convert.
+
+    Returns:
+        str: The canonical search key.
+    """
+    word = normalizeWord(word)
+    if not word:
+        return ""
+    if word.isupper():
+        word = word.lower()
+
+    try:
+        iast = transliterate(word, detect.detect(word), sanscript.IAST)
+    except Exception:
+        iast = word
+
+    folded = unicodedata.normalize("NFD", iast)
+    return KEY_NASAL_BEFORE_STOP.sub("n", "".join(char for char in folded if not unicodedata.combining(char)).lower())
+
+
+def toDevanagari(word: str) -> str:
+    """
+    Converts a word typed in any supported scheme to Devanagari.
+
+    Parameters:
+        word (str): The word to convert, e.g. "kṛ", "kR" or "कृ".
+
+    Returns:
+        str: The word in Devanagari, or the word unchanged if its scheme cannot be detected.
+    """
+    word = " ".join(word.split())
+    if not word or isDevanagariWord(word):
+        return word
+
+    try:
+        return transliterate(word, detect.detect(word), sanscript.DEVANAGARI)
+    except Exception:
+        return word
+
+
+def toSlp1(word: str) -> str:
+    """
+    Converts a word typed in any supported scheme to SLP1, which spells every Sanskrit sound with one ASCII letter.
+
+    Parameters:
+        word (str): The word to convert, e.g. "देवालय", "devālaya" or "devAlaya".
+
+    Returns:
+        str: The word in SLP1 ("devAlaya"), or the word unchanged if its scheme cannot be detected.
+    """
+    word = "".join(word.split())
+    if not word:
+        return ""
+
+    try:
+        return transliterate(word, detect.detect(word), sanscript.SLP1)
+    except Exception:
+        return word
+
+
+def toCollationKey(word: str) -> str:
+    """
+    Converts a word to a key that sorts in varṇamālā order: the vowels, then anusvara and visarga, then the consonants
+    class by class (क ख ग घ ङ, च ... म), then the semivowels, sibilants and ह.
+
+    The word is spelled in SLP1, one letter per sound, and each letter is replaced with its two-digit position in
+    `VARNAMALA`, so a consonant followed by its inherent "a" ("कक") sorts before a conjunct ("क्क"). Anything that is
+    not a letter (avagraha, digits, punctuation) is left out.
+
+    Parameters:
+        word (str): The word, in Devanagari or any other supported scheme.
+
+    Returns:
+        str: The collation key, e.g. "2610" for "क".
+    """
+    return "".join(COLLATION_CODES[letter] for letter in toSlp1(normalizeWord(word)) if letter in COLLATION_CODES)
@@ -0,0 +1,196 @@
+"""
+Synthetic dictionary corpus for the benchmarks.
+
+The headwords, glosses, translations and texts are sampled from the sample data in `extras/*.csv`. New headwords are
+made by chaining aksharas (syllables) drawn from the real headwords and synonyms, so their lengths, scripts and
+character distribution look like the real dictionary's.
+"""
+import ast
+import csv
+import random
+import re
+from collections import Counter
+from itertools import accumulate
+from pathlib import Path
+from indic_transliteration import sanscript
+from indic_transliteration.sanscript import transliterate
+from sqlalchemy import func, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from app import counts, models
+from app.utils.lang import toCollationKey, toSearchKey
+
+
+EXTRAS = Path(__file__).resolve().parent.parent / "extras"
+
+BATCH_SIZE = 5000
+
+# A consonant cluster (consonants joined by viramas) with an optional vowel sign or final virama, or an independent
+# vowel, followed by an optional candrabindu, anusvara or visarga.
+AKSHARA_PATTERN = re.compile(
+    r"(?:(?:[\u0915-\u0939\u0958-\u095F]\u093C?\u094D)*[\u0915-\u0939\u0958-\u095F]\u093C?[\u093E-\u094D\u0962\u0963]?"
+    r"|[\u0904-\u0914\u0960\u0961])[\u0901-\u0903]?"
+)
+
+
+def _read(name: str) -> list[dict]:
+    with open(EXTRAS / name, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _texts(value: str) -> list[str]:
+    try:
+        texts = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        texts = [value]
+    return [" ".join(text.split()) for text in texts if text.strip()]
+
+
+class Shapes:
+    """
+    The sample data from `extras/`, reduced to what the generator draws from.
+    """
+
+    def __init__(self):
+        synonyms = _read("synonyms.csv")
+        etymologies = _read("etymology.csv")
+        derivations = _read("derivation.csv")
+
+        self.headwords = list(dict.fromkeys(row["word"].strip() for row in synonyms + etymologies + derivations if row["word"].strip()))
+        self.synonyms = list(dict.fromkeys(word for row in synonyms for word in row["synonyms"].split()))
+        self.glosses = list(dict.fromkeys(row["English"].strip() for row in synonyms if row["English"].strip()))
+        self.translations = {
+            language: list(dict.fromkeys(row[language].strip() for row in synonyms if row[language].strip()))
+            for language in ("English", "Kannada", "Hindi")
+        }
+        self.etymologies = [text for row in etymologies for text in _texts(row["etymology"])]
+        self.derivations = [text for row in derivations for text in _texts(row["derivation"])]
+
+        initials, aksharas, lengths = Counter(), Counter(), Counter()
+        for word in self.headwords + self.synonyms:
+            word_aksharas = AKSHARA_PATTERN.findall(word)
+            if not word_aksharas or "".join(word_aksharas) != word:
+                continue
+            initials[word_aksharas[0]] += 1
+            aksharas.update(word_aksharas[1:])
+            lengths[len(word_aksharas)] += 1
+
+        self.initials, self.initial_weights = zip(*initials.items())
+        self.aksharas, self.akshara_weights = zip(*aksharas.items())
+        self.lengths, self.length_weights = zip(*lengths.items())
+
+        # Cumulative weights, so that drawing an akshara is a binary search.
+        self.initial_weights = list(accumulate(self.initial_weights))
+        self.akshara_weights = list(accumulate(self.akshara_weights))
+        self.length_weights = list(accumulate(self.length_weights))
+
+    def headword(self, rng: random.Random) -> str:
+        length = rng.choices(self.lengths, cum_weights=self.length_weights)[0]
+        word = rng.choices(self.initials, cum_weights=self.initial_weights)[0]
+        if length > 1:
+            word += "".join(rng.choices(self.aksharas, cum_weights=self.akshara_weights, k=length - 1))
+        return word
+
+
+def generate_headwords(shapes: Shapes, count: int, rng: random.Random) -> list[str]:
+    """
+    Returns `count` distinct headwords: the real ones from `extras/` first, then synthetic ones.
+
+    Parameters:
+        shapes (Shapes): The sample data.
+        count (int): The number of headwords.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list[str]: The headwords in Devanagari.
+    """
+    headwords = dict.fromkeys(shapes.headwords[:count])
+    while len(headwords) < count:
+        headwords.setdefault(shapes.headword(rng))
+    return list(headwords)
+
+
+def populate(engine: Engine, count: int, seed: int = 0) -> None:
+    """
+    Recreates the dictionary tables on `engine` and fills them with `count` headwords and their child rows.
+
+    Every headword gets one to three meanings, and every meaning a sample of etymologies, derivations, translations,
+    synonyms, antonyms, examples and Nyaya text references. Rows are written with bulk inserts in batches of
+    `BATCH_SIZE` headwords, which bypass the session, so the maintained table counts are recomputed at the end.
+
+    Parameters:
+        engine (Engine): The database to populate.
+        count (int): The number of headwords.
+        seed (int, optional): The random seed, so that runs with the same arguments produce the same corpus. Defaults to 0.
+    """
+    rng = random.Random(seed)
+    shapes = Shapes()
+    headwords = generate_headwords(shapes, count, rng)
+
+    tables = [model.__table__ for model in (
+        models.SanskritWord, models.Meaning, models.Etymology, models.Derivation, models.Translation,
+        models.Example, models.ReferenceNyayaText, models.Synonym, models.Antonym,
+    )]
+    models.Base.metadata.drop_all(bind=engine, tables=tables)
+    models.Base.metadata.create_all(bind=engine, tables=tables + [models.TableCount.__table__])
+
+    meaning_id = 0
+
+    with engine.begin() as connection:
+        for batch_start in range(0, count, BATCH_SIZE):
+            rows = {table: [] for table in tables}
+
+            for word_id, word in enumerate(headwords[batch_start:batch_start + BATCH_SIZE], start=batch_start + 1):
+                rows[models.SanskritWord.__table__].append({
+                    "id": word_id,
+                    "sanskrit_word": word,
+                    "english_transliteration": transliterate(word, sanscript.DEVANAGARI, sanscript.IAST),
+                    "search_key": toSearchKey(word),
+                    "collation_key": toCollationKey(word),
+                })
+
+                for _ in range(rng.choices((1, 2, 3), (6, 3, 1))[0]):
+                    meaning_id += 1
+                    parent = {"sanskrit_word_id": word_id, "meaning_id": meaning_id}
+
+                    rows[models.Meaning.__table__].append({"id": meaning_id, "sanskrit_word_id": word_id, "meaning": rng.choice(shapes.glosses)})
+                    for _ in range(rng.choice((0, 1, 1, 2))):
+                        rows[models.Etymology.__table__].append({**parent, "etymology": rng.choice(shapes.etymologies)})
+                    for _ in range(rng.choice((0, 1, 1, 2, 3))):
+                        rows[models.Derivation.__table__].append({**parent, "derivation": rng.choice(shapes.derivations)})
+                    for language, translations in shapes.translations.items():
+                        rows[models.Translation.__table__].append({**parent, "language": language, "translation": rng.choice(translations)})
+                    for synonym in rng.sample(shapes.synonyms, rng.choice((0, 1, 2, 3))):
+                        rows[models.Synonym.__table__].append({**parent, "synonym": synonym})
+                    if rng.random() < 0.2:
+                        rows[models.Antonym.__table__].append({**parent, "antonym": rng.choice(shapes.synonyms)})
+                    if rng.random() < 0.5:
+                        rows[models.Example.__table__].append({**parent, "example_sentence": rng.choice(shapes.etymologies), "applicable_modern_context": rng.choice(shapes.glosses)})
+                    if rng.random() < 0.3:
+                        rows[models.ReferenceNyayaText.__table__].append({**parent, "source": rng.choice(shapes.headwords), "description": rng.choice(shapes.derivations)})
+
+            for table in tables:
+                if rows[table]:
+                    connection.execute(insert(table), rows[table])
+
+    with Session(engine) as db:
+        counts.recount(db)
+        db.commit()
+
+
+def is_populated(engine: Engine, count: int) -> bool:
+    """
+    Checks whether `engine` already holds a corpus of `count` headwords.
+
+    Parameters:
+        engine (Engine): The database to check.
+        count (int): The expected number of headwords.
+
+    Returns:
+        bool: True if the headword table exists and has exactly `count` rows.
+    """
+    with Session(engine) as db:
+        try:
+            return db.query(func.count(models.SanskritWord.id)).scalar() == count
+        except Exception:
+            return False
@@ -0,0 +1,192 @@
+"""
+Latency benchmark for the search endpoints and the `/words/{word}` resolver.
+
+Builds (or reuses) a synthetic corpus, starts the app in process and reports how long its startup took and how much
+memory its in-memory indexes hold, then replays typeahead, exact, short (one- and two-letter) and miss queries and
+reports p50/p95/p99 latency and the number of SQL statements per request. Every search scenario is also replayed
+against the `LIKE` scan that served `/search/{word}` before the in-memory indexes, for comparison.
+
+Usage:
+    python -m benchmarks.search_latency --words 200000 --requests 1000
+
+The corpus is written to `--database-url` (a SQLite file next to this script by default) and reused by later runs
+with the same `--words` and `--seed`.
+"""
+import argparse
+import gc
+import json
+import math
+import os
+import random
+import resource
+import string
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote
+
+
+DEFAULT_DATABASE_URL = f"sqlite:///{Path(__file__).resolve().parent / 'corpus.db'}"
+
+
+def percentile(samples: list[float], p: float) -> float:
+    """
+    Nearest-rank percentile of `samples`.
+
+    Parameters:
+        samples (list[float]): The samples, in any order.
+        p (float): The percentile, between 0 and 100.
+
+    Returns:
+        float: The smallest sample that is greater than or equal to `p` percent of the samples.
+    """
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(len(ordered) * p / 100) - 1)]
+
+
+def rss_mb() -> float:
+    """
+    Resident set size of this process, in MB.
+
+    Returns:
+        float: The current resident set size where `/proc` is available (Linux), otherwise the peak one.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--words", type=int, default=200_000, help="number of headwords in the corpus (default: 200000)")
+    parser.add_argument("--requests", type=int, default=1000, help="requests replayed per scenario (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the corpus and the queries (default: 0)")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL, help="database to build the corpus in")
+    parser.add_argument("--rebuild", action="store_true", help="rebuild the corpus even if it already exists")
+    parser.add_argument("--json", type=Path, help="also write the results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # The app binds its engine to MAIN_DATABASE_URL on import.
+    os.environ["MAIN_DATABASE_URL"] = args.database_url
+
+    from fastapi import Depends
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    from app import models
+    from app.cache import response_cache
+    from app.database import engine, get_db
+    from app.indexes import dhatus, headwords, reverse, sandhi, translation_lookup
+    from app.main import app
+    from app.middleware.word_middleware import word_resolver
+    from app.utils.lang import isDevanagariWord
+    from benchmarks.corpus import populate, is_populated
+
+    if args.rebuild or not is_populated(engine, args.words):
+        print(f"Building a corpus of {args.words} headwords in {args.database_url} ...", flush=True)
+        started = time.perf_counter()
+        populate(engine, args.words, args.seed)
+        print(f"  done in {time.perf_counter() - started:.1f} s", flush=True)
+
+    def like_search(word: str, limit: int = 5, mode: str = "substring", db: Session = Depends(get_db)):
+        # GET /search/{word} as it was before the in-memory indexes.
+        pattern = f"{word}%" if mode == "prefix" else f"%{word}%"
+        if isDevanagariWord(word):
+            matches = db.query(models.SanskritWord).filter(models.SanskritWord.sanskrit_word.like(pattern)).limit(limit).all()
+        else:
+            matches = db.query(models.SanskritWord).filter(models.SanskritWord.english_transliteration.ilike(pattern)).limit(limit).all()
+        return [[match.sanskrit_word, match.english_transliteration] for match in matches]
+
+    app.add_api_route("/benchmark/like/{word}", like_search, methods=["GET"])
+
+    statements = [0]
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(*_):
+        statements[0] += 1
+
+    rng = random.Random(args.seed)
+    with Session(engine) as db:
+        corpus = db.query(models.SanskritWord.sanskrit_word, models.SanskritWord.english_transliteration).all()
+
+    sample = rng.sample(corpus, min(args.requests, len(corpus)))
+    exact = [sanskrit_word if i % 2 else english_transliteration for i, (sanskrit_word, english_transliteration) in enumerate(sample)]
+    typeahead = [english_transliteration[:rng.randint(1, 4)] for _, english_transliteration in sample]
+    # One- and two-letter queries match a large part of the dictionary.
+    short = [(sanskrit_word if i % 2 else english_transliteration)[:rng.randint(1, 2)] for i, (sanskrit_word, english_transliteration) in enumerate(sample)]
+    misses = ["".join(rng.choices(string.ascii_lowercase[:8] + "xz", k=rng.randint(5, 9))) + "qx" for _ in sample]
+
+    scenarios = [
+        ("typeahead", "LIKE prefix", "/benchmark/like/{}?mode=prefix&limit=10", typeahead),
+        ("typeahead", "/search/prefix", "/search/prefix/{}", typeahead),
+        ("search exact", "LIKE substring", "/benchmark/like/{}", exact),
+        ("search exact", "/search", "/search/{}", exact),
+        ("search short", "LIKE substring", "/benchmark/like/{}", short),
+        ("search short", "/search", "/search/{}", short),
+        ("search miss", "LIKE substring", "/benchmark/like/{}", misses),
+        ("search miss", "/search", "/search/{}", misses),
+        ("resolve exact", "/words", "/words/{}", exact),
+        ("resolve miss", "/words", "/words/{}", misses),
+    ]
+
+    # Startup, as a worker pays it: the lifespan handler builds every in-memory index from the database.
+    for index in (headwords, reverse, translation_lookup, dhatus, sandhi):
+        index.reset()
+    gc.collect()
+    rss_before = rss_mb()
+    started = time.perf_counter()
+    with TestClient(app) as client:
+        startup_seconds = time.perf_counter() - started
+        gc.collect()
+        index_memory_mb = rss_mb() - rss_before
+        print(f"Startup took {startup_seconds:.1f} s; the indexes hold {index_memory_mb:.0f} MB ({rss_mb():.0f} MB resident)", flush=True)
+
+        results = []
+
+        print()
+        print(f"{'scenario':<14} {'engine':<16} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries/req':>12}")
+        for scenario, engine_name, path, queries in scenarios:
+            response_cache.clear()
+            word_resolver.clear()
+            latencies = []
+            statements[0] = 0
+
+            for query in queries:
+                started = time.perf_counter()
+                response = client.get(path.format(quote(query)))
+                latencies.append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 500:
+                    raise RuntimeError(f"{path.format(query)} failed with {response.status_code}")
+
+            result = {
+                "scenario": scenario,
+                "engine": engine_name,
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "queries_per_request": statements[0] / len(queries),
+            }
+            results.append(result)
+            print(f"{scenario:<14} {engine_name:<16} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} {result['p99_ms']:>9.2f} {result['queries_per_request']:>12.2f}", flush=True)
+
+    if args.json:
+        args.json.write_text(json.dumps({
+            "words": args.words,
+            "requests": args.requests,
+            "seed": args.seed,
+            "startup_seconds": startup_seconds,
+            "index_memory_mb": index_memory_mb,
+            "results": results,
+        }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,9 @@ from app.database import get_db, Base
 from app.oauth2 import create_access_token
 from app import models
 from app.utils import encrypt
+from app.indexes import dhatus, headwords, reverse, sandhi, translation_lookup
+from app.cache import response_cache
+from app.middleware.word_middleware import word_resolver
 
 
 SQLALCHEMY_DATABASE_URL = settings.test_database_url
@@ -22,6 +25,13 @@ TestingSessionLocal = sessionmaker(
 def session():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    headwords.reset()
+    reverse.reset()
+    translation_lookup.reset()
+    dhatus.reset()
+    sandhi.reset()
+    response_cache.clear()
+    word_resolver.clear()
     
     db = TestingSessionLocal()
     try:
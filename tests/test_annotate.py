@@ -0,0 +1,97 @@
+import pytest
+from fastapi import Response
+
+
+@pytest.fixture
+def sample_words_input():
+    return [
+        {"sanskrit_word": "स्वर्ग", "english_transliteration": "svarga"},
+        {"sanskrit_word": "स्वर्", "english_transliteration": "svar"},
+        {"sanskrit_word": "नाक", "english_transliteration": "nāka"},
+        {"sanskrit_word": "लोक", "english_transliteration": "loka"},
+    ]
+
+
+def test_annotate(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    text = "स्वर्गलोकः नाके स्वर्गः"
+    response: Response = client.post("/annotate", json={"text": text})
+    assert response.status_code == 200
+    assert [(annotation["start"], annotation["end"], annotation["sanskrit_word"]) for annotation in response.json()] == [
+        (0, 6, "स्वर्ग"),
+        (6, 9, "लोक"),
+        (16, 22, "स्वर्ग"),
+    ]
+    assert all(text[annotation["start"]:annotation["end"]] == annotation["text"] for annotation in response.json())
+    assert response.json()[1]["english_transliteration"] == "loka"
+
+
+def test_annotate_normalized(authorized_client, test_users, client):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in [{"sanskrit_word": "सङ्कल्प", "english_transliteration": "saṅkalpa"}, {"sanskrit_word": "न्याय", "english_transliteration": "nyāya"}]:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    # The anusvara is matched as the class nasal, and the joiner is skipped; the offsets still point into `text`.
+    text = "संकल्पः  न्\u200dयायः"
+    response: Response = client.post("/annotate", json={"text": text})
+    assert response.status_code == 200
+    assert [(annotation["start"], annotation["end"], annotation["text"], annotation["sanskrit_word"]) for annotation in response.json()] == [
+        (0, 6, "संकल्प", "सङ्कल्प"),
+        (9, 15, "न्\u200dयाय", "न्याय"),
+    ]
+
+
+def test_annotate_after_writes(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.post("/annotate", json={"text": "नाकलोक"})
+    assert [annotation["sanskrit_word"] for annotation in response.json()] == ["नाक", "लोक"]
+
+    response: Response = authorized_admin.delete("/words/loka")
+    assert response.status_code == 204
+
+    response: Response = authorized_admin.post("/words", json={"sanskrit_word": "नाकलोक", "english_transliteration": "nākaloka"})
+    assert response.status_code == 201
+
+    response: Response = client.post("/annotate", json={"text": "नाकलोक"})
+    assert [annotation["sanskrit_word"] for annotation in response.json()] == ["नाकलोक"]
+
+    response: Response = authorized_admin.delete("/words/nākaloka")
+    assert response.status_code == 204
+
+    response: Response = client.post("/annotate", json={"text": "नाकलोक"})
+    assert [annotation["sanskrit_word"] for annotation in response.json()] == ["नाक"]
+
+
+def test_annotate_no_match(client):
+    response: Response = client.post("/annotate", json={"text": "न्यायः"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_annotate_after_adding_prefix_headword(authorized_client, test_users, client):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for sanskrit_word in ["गमन", "आगमन"]:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word})
+        assert response.status_code == 201
+
+    assert client.post("/annotate", json={"text": "आगमः"}).json() == []
+
+    # "गम" ends on a node that "गमन" already created; scanning through "आगम" only reaches it by an output link.
+    response: Response = authorized_admin.post("/words", json={"sanskrit_word": "गम"})
+    assert response.status_code == 201
+
+    response: Response = client.post("/annotate", json={"text": "आगमः"})
+    assert [(annotation["start"], annotation["end"], annotation["sanskrit_word"]) for annotation in response.json()] == [(1, 3, "गम")]
@@ -0,0 +1,58 @@
+import json
+import pytest
+from fastapi import Response
+from app.routers import export
+
+
+@pytest.fixture
+def sample_dictionary(authorized_client, test_users):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for sanskrit_word, meanings in [("स्वर्ग", 2), ("अग्नि", 1), ("नाक", 0)]:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word})
+        assert response.status_code == 201
+        for _ in range(meanings):
+            response: Response = authorized_admin.post(f"/words/{sanskrit_word}/meanings", json={"meaning": "test"})
+            assert response.status_code == 201
+
+    children = [
+        ("स्वर्ग", 2, "synonyms", {"synonym": "नाक"}),
+        ("स्वर्ग", 2, "antonyms", {"antonym": "नरक"}),
+        ("स्वर्ग", 1, "translations", {"language": "English", "translation": "heaven"}),
+        ("अग्नि", 3, "etymologies", {"etymology": "अङ्गति ऊर्ध्वं गच्छति"}),
+        ("अग्नि", 3, "examples", {"example_sentence": "अग्निः दहति", "applicable_modern_context": "fire burns"}),
+    ]
+    for sanskrit_word, meaning_id, path, payload in children:
+        response: Response = authorized_admin.post(f"/words/{sanskrit_word}/{meaning_id}/{path}", json=payload)
+        assert response.status_code == 201
+
+    return authorized_admin
+
+
+@pytest.mark.parametrize("batch_size", [1, 3, 1000])
+def test_export_words(client, sample_dictionary, monkeypatch, batch_size):
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", batch_size)
+
+    response: Response = client.get("/export/words.ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    lines = response.text.splitlines()
+    assert [json.loads(line) for line in lines] == [client.get(f"/words/{word}/entry").json() for word in ["स्वर्ग", "अग्नि", "नाक"]]
+
+
+def test_export_words_skips_orphans(client, sample_dictionary):
+    authorized_admin = sample_dictionary
+
+    response: Response = authorized_admin.delete("/words/स्वर्ग/meanings/2")
+    assert response.status_code == 204
+
+    exported = [json.loads(line) for line in client.get("/export/words.ndjson").text.splitlines()]
+    assert [meaning["id"] for meaning in exported[0]["meanings"]] == [1]
+    assert [entry["sanskrit_word"] for entry in exported] == ["स्वर्ग", "अग्नि", "नाक"]
+
+
+def test_export_words_empty(client):
+    response: Response = client.get("/export/words.ndjson")
+    assert response.status_code == 200
+    assert response.text == ""
@@ -0,0 +1,137 @@
+import pytest
+from fastapi import Response
+from app.indexes.dhatus import extract_roots, strip_anubandhas
+
+
+@pytest.mark.parametrize("text, expected_roots", [
+    ("स्वृ शब्दोपतापयोः इत्यस्माद्धातोः `अन्येश्यो।़पि दृश्यन्ते   3 2 75  इति", ["स्वृ"]),
+    ("`लाञ्छ लक्षणे  इति धातोः  ल्युट् च   3 3 115  इत्यनेन सूत्रेण ल्युट्", ["लाञ्छ"]),
+    ("मन्द उपपदपूर्वक  अक कुटिलायां गतौ  इति धातोः  सुप्यजातौ णिनिः ताच्छाल्ये", ["अक"]),
+    ("सन्तन्यते इत्यर्थे सम् उपसर्गपूर्वक तन् धातोः `हलश्च   3 3 122  इत्यनेन", ["तन्"]),
+    ("`पुर  उपपदपूर्वक अरीणां पुरो दारयतीति दृधातोः हेतुमति च  3 1 26  इत्यनेन", ["दृ"]),
+    ("आ उपसर्ग पूर्वक शृ हिंसायामिति धातोः  नन्दिग्राहिपचादिभ्योल्युणिन्यचः", ["शृ"]),
+    (" इदितो नुम् धातोः   7 1 58  इत्यनेन सूत्रेण इकारस्य नुम् प्रत्यये आगमे", []),
+    ("सुपूर्वक `राजृदीप्तौ  इति धातोः", []),
+    ("बहुव्रीहि  समासत्वात् `पद्मालया  इति रूपं सिध्यति ।", []),
+    ("उद् उपसर्ग पूर्वक `अन्चु गति पूजनयोः इति धातोः ऋत्विग्दधृक्क्षग्दिगुष्णि", ["अन्चु"]),
+    ("`कल गतिसंख्याचोष्ठासु इति धातो `अनध्यादयश्च उ.4 112 इति सूत्रेण", ["कल"]),
+    ("`अपि इति उपसर्गात् डु धाञ् धारणे इति धातोः ल्युट् च 3 3 115", ["डुधाञ्"]),
+    ("आ समन्ताद् अशू व्याप्तौ इति धातोः नन्दिग्राहिपचादिभ्योल्युणिन्यचः", ["अशू"]),
+    ("`शिघिव्याप्तौ इति धातोः अथवा शिघि आग्राणे इति धातोः `शीघ्रादयश्च", ["शिघि"]),
+    ("ह्रादो।़स्त्यस्या इति विग्रहे, ह्राद् धातोः `अतइनिठनौ 5 2 115 इत्यनेन", ["ह्राद्"]),
+])
+def test_extract_roots(text, expected_roots):
+    assert extract_roots(text) == expected_roots
+
+
+@pytest.mark.parametrize("root, expected_root", [
+    ("डुदाञ्", "दा"),
+    ("शीङ्", "शी"),
+    ("गम्लृ", "गम्"),
+    ("भिदिर्", "भिद्"),
+    ("दिवु", "दिव्"),
+    ("काशृ", "काश्"),
+    ("ञिभी", "भी"),
+    ("स्वृ", "स्वृ"),
+    ("द्रु", "द्रु"),
+    ("भू", "भू"),
+])
+def test_strip_anubandhas(root, expected_root):
+    assert strip_anubandhas(root) == expected_root
+
+
+@pytest.fixture
+def sample_derived_words(authorized_client, test_users):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    words = [
+        ("स्वर्", "svar", "स्वृ शब्दोपतापयोः इत्यस्माद्धातोः `अन्येश्यो।़पि दृश्यन्ते   3 2 75  इति"),
+        ("स्वर्ग", "svarga", "सु उपसर्गपूर्वक `गम्लृ गतौ  इति धातोः  अन्येष्वपि दृश्यते"),
+        ("स्वरित", "svarita", "`स्वृ  शब्दे इति धातोः क्त प्रत्यये"),
+        ("नाक", "nāka", "`अक कुटिलायां गतौ  इति धातोः"),
+        ("धन", "dhana", "धन उपपदपूर्वक `डुदाञ् दाने इति धातोः आतो।़नुपसर्गे कः 3 2 3 इत्यनेन"),
+    ]
+
+    for meaning_id, (sanskrit_word, english_transliteration, derivation) in enumerate(words, start=1):
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word, "english_transliteration": english_transliteration})
+        assert response.status_code == 201
+
+        response: Response = authorized_admin.post(f"/words/{sanskrit_word}/meanings", json={"meaning": "test"})
+        assert response.status_code == 201
+
+        response: Response = authorized_admin.post(f"/words/{sanskrit_word}/{meaning_id}/derivations", json={"derivation": derivation})
+        assert response.status_code == 201
+
+    return authorized_admin
+
+
+@pytest.mark.parametrize("dhatu", ["स्वृ", "svṛ", "svR"])
+def test_get_root_words(client, sample_derived_words, dhatu):
+    response: Response = client.get(f"/roots/{dhatu}/words")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 1, "sanskrit_word": "स्वर्", "english_transliteration": "svar", "derivation_ids": [1]},
+        {"id": 3, "sanskrit_word": "स्वरित", "english_transliteration": "svarita", "derivation_ids": [3]},
+    ]
+
+
+@pytest.mark.parametrize("dhatu", ["डुदाञ्", "दा", "dA"])
+def test_get_root_words_anubandhas(client, sample_derived_words, dhatu):
+    response: Response = client.get(f"/roots/{dhatu}/words")
+    assert response.status_code == 200
+    assert response.json() == [{"id": 5, "sanskrit_word": "धन", "english_transliteration": "dhana", "derivation_ids": [5]}]
+
+
+def test_get_root_words_not_found(client, sample_derived_words):
+    response: Response = client.get("/roots/भू/words")
+    assert response.status_code == 404
+
+
+def test_get_roots(client, sample_derived_words):
+    response: Response = client.get("/roots")
+    assert response.status_code == 200
+    assert response.json() == [
+        {"root": "अक", "word_count": 1},
+        {"root": "गम्", "word_count": 1},
+        {"root": "गम्लृ", "word_count": 1},
+        {"root": "डुदाञ्", "word_count": 1},
+        {"root": "दा", "word_count": 1},
+        {"root": "स्वृ", "word_count": 2},
+    ]
+
+    response: Response = client.get("/roots", params={"prefix": "स्व"})
+    assert response.json() == [{"root": "स्वृ", "word_count": 2}]
+
+    response: Response = client.get("/roots", params={"prefix": "gam"})
+    assert response.json() == [{"root": "गम्", "word_count": 1}, {"root": "गम्लृ", "word_count": 1}]
+
+    response: Response = client.get("/roots", params={"limit": 1})
+    assert response.json() == [{"root": "अक", "word_count": 1}]
+
+    response: Response = client.get("/roots", params={"limit": -1})
+    assert response.json() == [{"root": "अक", "word_count": 1}]
+
+
+def test_roots_after_writes(client, sample_derived_words):
+    authorized_admin = sample_derived_words
+
+    response: Response = authorized_admin.put("/words/svar/1/derivations/1", json={"derivation": "`भू सत्तायाम्  इति धातोः"})
+    assert response.status_code == 204
+
+    response: Response = client.get("/roots/स्वृ/words")
+    assert [word["sanskrit_word"] for word in response.json()] == ["स्वरित"]
+
+    response: Response = client.get("/roots/भू/words")
+    assert [word["sanskrit_word"] for word in response.json()] == ["स्वर्"]
+
+    response: Response = authorized_admin.delete("/words/svarita/3/derivations/3")
+    assert response.status_code == 204
+
+    response: Response = client.get("/roots/स्वृ/words")
+    assert response.status_code == 404
+
+    response: Response = authorized_admin.delete("/words/nāka")
+    assert response.status_code == 204
+
+    response: Response = client.get("/roots")
+    assert [root["root"] for root in response.json()] == ["गम्", "गम्लृ", "डुदाञ्", "दा", "भू"]
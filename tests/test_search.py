@@ -0,0 +1,365 @@
+import pytest
+from fastapi import Response
+from app.config import settings
+
+
+@pytest.fixture
+def sample_words_input():
+    return [
+        {"sanskrit_word": "स्वर्ग", "english_transliteration": "svarga"},
+        {"sanskrit_word": "स्वर्", "english_transliteration": "svar"},
+        {"sanskrit_word": "नाक", "english_transliteration": "nāka"},
+    ]
+
+
+@pytest.mark.parametrize("query, expected_output", [
+    ("स्वर्", [["स्वर्", "svar"], ["स्वर्ग", "svarga"]]),
+    ("र्ग", [["स्वर्ग", "svarga"]]),
+    ("SVAR", [["स्वर्", "svar"], ["स्वर्ग", "svarga"]]),
+    ("āk", [["नाक", "nāka"]]),
+    ("a", [["नाक", "nāka"], ["स्वर्", "svar"], ["स्वर्ग", "svarga"]]),
+    ("svarga", [["स्वर्ग", "svarga"]]),
+])
+def test_search(authorized_client, test_users, client, sample_words_input, query, expected_output):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.get(f"/search/{query}")
+    assert response.status_code == 200
+    assert response.json()["results"] == expected_output
+    assert response.json()["total_hits"] == len(expected_output)
+
+
+def test_search_limit(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.get("/search/a", params={"limit": 2})
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 2
+
+
+def test_search_pages(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    results = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response: Response = client.get("/search/a", params=params)
+        assert response.status_code == 200
+        assert response.json()["total_hits"] == 3
+        results += response.json()["results"]
+        cursor = response.json()["next_cursor"]
+
+    assert results == [["नाक", "nāka"], ["स्वर्", "svar"], ["स्वर्ग", "svarga"]]
+    assert cursor is None
+
+
+def test_search_short_query_after_writes(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input + [{"sanskrit_word": "अग्नि", "english_transliteration": "agni"}]:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = authorized_admin.put("/words/svar", json={"sanskrit_word": "लोक", "english_transliteration": "loka"})
+    assert response.status_code == 204
+    response: Response = authorized_admin.delete("/words/nāka")
+    assert response.status_code == 204
+
+    results = []
+    cursor = None
+    for _ in range(3):
+        params = {"limit": 1}
+        if cursor:
+            params["cursor"] = cursor
+        response: Response = client.get("/search/a", params=params)
+        assert response.json()["total_hits"] == 3
+        results += response.json()["results"]
+        cursor = response.json()["next_cursor"]
+
+    assert results == [["अग्नि", "agni"], ["लोक", "loka"], ["स्वर्ग", "svarga"]]
+    assert cursor is None
+
+
+def test_search_page_size_capped(authorized_client, test_users, client, monkeypatch, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    monkeypatch.setattr(settings, "search_max_page_size", 2)
+
+    response: Response = client.get("/search/a", params={"limit": 1000})
+    assert len(response.json()["results"]) == 2
+    assert response.json()["next_cursor"] is not None
+
+
+def test_search_invalid_cursor(client):
+    response: Response = client.get("/search/svarga", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_search_not_found(client):
+    response: Response = client.get("/search/svarga")
+    assert response.status_code == 200
+    assert response.json() == {"results": [], "next_cursor": None, "total_hits": 0, "suggestions": []}
+
+
+def test_search_after_update_and_delete(authorized_client, test_users, client, sample_word_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    response: Response = authorized_admin.post("/words", json=sample_word_input)
+    assert response.status_code == 201
+
+    response: Response = client.get("/search/svarga")
+    assert response.status_code == 200
+
+    response: Response = authorized_admin.put(f"/words/{sample_word_input['sanskrit_word']}", json={
+        "sanskrit_word": "स्वर्ग",
+        "english_transliteration": "svarg",
+    })
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/svarga")
+    assert response.status_code == 200
+    assert response.json()["results"] == [["स्वर्ग", "svarg"]]
+
+    response: Response = client.get("/search/svarg")
+    assert response.status_code == 200
+    assert response.json()["results"] == [["स्वर्ग", "svarg"]]
+
+    response: Response = authorized_admin.delete(f"/words/{sample_word_input['sanskrit_word']}")
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/svarg")
+    assert response.status_code == 200
+    assert response.json()["results"] == []
+
+
+@pytest.mark.parametrize("query, expected_output", [
+    ("स्व", [["स्वर्", "svar"], ["स्वर्ग", "svarga"]]),
+    ("svarg", [["स्वर्ग", "svarga"]]),
+    ("NĀ", [["नाक", "nāka"]]),
+    ("nAk", [["नाक", "nāka"]]),
+    ("ನಾ", [["नाक", "nāka"]]),
+    ("x", []),
+])
+def test_search_prefix(authorized_client, test_users, client, sample_words_input, query, expected_output):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.get(f"/search/prefix/{query}")
+    assert response.status_code == 200
+    assert response.json() == expected_output
+
+
+def test_search_prefix_limit_capped(authorized_client, test_users, client, monkeypatch, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    monkeypatch.setattr(settings, "search_max_page_size", 1)
+
+    response: Response = client.get("/search/prefix/स्व", params={"limit": 1000})
+    assert response.json() == [["स्वर्", "svar"]]
+
+    response: Response = client.get("/search/prefix/स्व", params={"limit": -1})
+    assert response.json() == [["स्वर्", "svar"]]
+
+
+def test_search_prefix_after_rename(authorized_client, test_users, client, sample_word_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    response: Response = authorized_admin.post("/words", json=sample_word_input)
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.put(f"/words/{sample_word_input['sanskrit_word']}", json={
+        "sanskrit_word": "स्वर्गः",
+        "english_transliteration": "svargaḥ",
+    })
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/prefix/स्वर्ग")
+    assert response.json() == [["स्वर्गः", "svargaḥ"]]
+
+    response: Response = authorized_admin.delete("/words/स्वर्गः")
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/prefix/स्वर्ग")
+    assert response.json() == []
+
+
+@pytest.mark.parametrize("query, expected_output", [
+    ("svagra", [["स्वर्ग", "svarga"], ["स्वर्", "svar"]]),
+    ("nakka", [["नाक", "nāka"]]),
+    ("नक", [["नाक", "nāka"]]),
+    ("svr", [["स्वर्", "svar"]]),
+    ("xyzxyz", []),
+])
+def test_search_fuzzy(authorized_client, test_users, client, sample_words_input, query, expected_output):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.get(f"/search/fuzzy/{query}")
+    assert response.status_code == 200
+    assert response.json() == expected_output
+
+
+def test_search_fuzzy_limits_capped(authorized_client, test_users, client, monkeypatch, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    monkeypatch.setattr(settings, "search_max_page_size", 1)
+
+    response: Response = client.get("/search/fuzzy/svagra", params={"limit": 1000})
+    assert response.json() == [["स्वर्ग", "svarga"]]
+
+    response: Response = client.get("/search/fuzzy/svagra", params={"limit": 5, "max_distance": 10})
+    assert response.status_code == 200
+    assert response.json() == [["स्वर्ग", "svarga"]]
+
+    response: Response = client.get("/search/fuzzy/svarga", params={"max_distance": -3})
+    assert response.json() == [["स्वर्ग", "svarga"]]
+
+
+def test_search_not_found_suggestions(authorized_client, test_users, client, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = client.get("/search/svrga")
+    assert response.status_code == 200
+    assert response.json()["results"] == []
+    assert response.json()["suggestions"][0] == ["स्वर्ग", "svarga"]
+
+
+@pytest.fixture
+def sample_glossed_words(authorized_client, test_users, sample_words_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in sample_words_input:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/svarga/meanings", json={"meaning": "heaven, the abode of the gods"})
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/svarga/1/translations", json={"language": "English", "translation": "Paradise"})
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/nāka/meanings", json={"meaning": "the sky, heavens"})
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/nāka/2/examples", json={"example_sentence": "The gods dwell in the heavens."})
+    assert response.status_code == 201
+
+    return authorized_admin
+
+
+def test_search_reverse(client, sample_glossed_words):
+    response: Response = client.get("/search/reverse", params={"q": "heavens"})
+    assert response.status_code == 200
+
+    results = response.json()
+    assert [result["sanskrit_word"] for result in results] == ["नाक", "स्वर्ग"]
+    assert {(match["source"], match["id"]) for match in results[0]["matches"]} == {("meanings", 2), ("examples", 1)}
+
+    response: Response = client.get("/search/reverse", params={"q": "paradise"})
+    assert [result["sanskrit_word"] for result in response.json()] == ["स्वर्ग"]
+
+    response: Response = client.get("/search/reverse", params={"q": "inference"})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_reverse_limit_capped(client, sample_glossed_words, monkeypatch):
+    monkeypatch.setattr(settings, "search_max_page_size", 1)
+
+    response: Response = client.get("/search/reverse", params={"q": "heavens", "limit": 1000})
+    assert [result["sanskrit_word"] for result in response.json()] == ["नाक"]
+
+    response: Response = client.get("/search/reverse", params={"q": "heavens", "limit": -1})
+    assert [result["sanskrit_word"] for result in response.json()] == ["नाक"]
+
+
+def test_search_reverse_after_writes(client, sample_glossed_words):
+    authorized_admin = sample_glossed_words
+
+    response: Response = authorized_admin.put("/words/svarga/1/translations/1", json={"language": "English", "translation": "Heaven"})
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/reverse", params={"q": "paradise"})
+    assert response.json() == []
+
+    response: Response = authorized_admin.delete("/words/nāka/2/examples/1")
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/reverse", params={"q": "gods"})
+    assert [result["sanskrit_word"] for result in response.json()] == ["स्वर्ग"]
+
+    response: Response = authorized_admin.delete("/words/svarga")
+    assert response.status_code == 204
+
+    response: Response = client.get("/search/reverse", params={"q": "heaven"})
+    assert [result["sanskrit_word"] for result in response.json()] == ["नाक"]
+
+
+def test_search_batch(client, sample_glossed_words):
+    response: Response = client.post("/search/batch", json={"terms": [" नाक ", "svargA", "svar", "र्\u200dग", "xyz", ""]})
+    assert response.status_code == 200
+    assert [(result["term"], result["normalized_term"], result["exact"]) for result in response.json()] == [
+        (" नाक ", "नाक", True), ("svargA", "svargA", True), ("svar", "svar", True), ("र्\u200dग", "र्ग", False),
+        ("xyz", "xyz", False), ("", "", False),
+    ]
+
+    matches = [result["matches"] for result in response.json()]
+    assert matches[0] == [{"id": 3, "sanskrit_word": "नाक", "english_transliteration": "nāka", "meaning_ids": [2]}]
+    assert matches[1] == [{"id": 1, "sanskrit_word": "स्वर्ग", "english_transliteration": "svarga", "meaning_ids": [1]}]
+    assert [match["sanskrit_word"] for match in matches[2]] == ["स्वर्"]
+    assert [match["sanskrit_word"] for match in matches[3]] == ["स्वर्ग"]
+    assert matches[4] == []
+    assert matches[5] == []
+
+
+@pytest.mark.parametrize("limit, expected_count", [(1000, 2), (-1, 1), (0, 1)])
+def test_search_batch_limit_capped(client, sample_glossed_words, monkeypatch, limit, expected_count):
+    monkeypatch.setattr(settings, "search_max_page_size", 2)
+
+    response: Response = client.post("/search/batch", json={"terms": ["a"], "limit": limit})
+    assert response.status_code == 200
+    assert len(response.json()[0]["matches"]) == expected_count
+
+
+def test_search_batch_too_many_terms(client, monkeypatch):
+    monkeypatch.setattr(settings, "search_batch_max_terms", 2)
+
+    response: Response = client.post("/search/batch", json={"terms": ["a", "b", "c"]})
+    assert response.status_code == 400
@@ -0,0 +1,92 @@
+import pytest
+from fastapi import Response
+
+
+@pytest.fixture
+def sample_lexicon(authorized_client, test_users):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    words = [
+        ("देव", "deva"),
+        ("आलय", "ālaya"),
+        ("स्वर्ग", "svarga"),
+        ("लोक", "loka"),
+        ("मनस्", "manas"),
+        ("रथ", "ratha"),
+        ("सूर्य", "sūrya"),
+        ("उदय", "udaya"),
+        ("तत्", "tat"),
+        ("ज्ञान", "jñāna"),
+    ]
+
+    for sanskrit_word, english_transliteration in words:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word, "english_transliteration": english_transliteration})
+        assert response.status_code == 201
+
+    return authorized_admin
+
+
+@pytest.mark.parametrize("text, expected_words, expected_sandhi_count", [
+    ("देवालयः", ["देव", "आलय"], 1),
+    ("devālaya", ["देव", "आलय"], 1),
+    ("स्वर्गलोकः", ["स्वर्ग", "लोक"], 0),
+    ("मनोरथ", ["मनस्", "रथ"], 1),
+    ("सूर्योदय", ["सूर्य", "उदय"], 1),
+    ("तज्ज्ञानम्", None, None),
+    ("तज्ज्ञान", ["तत्", "ज्ञान"], 1),
+    ("देवदेवः", ["देव", "देव"], 0),
+])
+def test_split(client, sample_lexicon, text, expected_words, expected_sandhi_count):
+    response: Response = client.get(f"/split/{text}")
+    assert response.status_code == 200
+
+    if expected_words is None:
+        assert response.json() == []
+        return
+
+    best = response.json()[0]
+    assert [component["sanskrit_word"] for component in best["components"]] == expected_words
+    assert best["sandhi_count"] == expected_sandhi_count
+
+
+def test_split_prefers_headword(client, sample_lexicon):
+    authorized_admin = sample_lexicon
+
+    response: Response = authorized_admin.post("/words", json={"sanskrit_word": "देवालय", "english_transliteration": "devālaya"})
+    assert response.status_code == 201
+
+    response: Response = client.get("/split/देवालय")
+    assert response.json() == [
+        {"components": [{"id": 11, "sanskrit_word": "देवालय", "english_transliteration": "devālaya"}], "sandhi_count": 0},
+        {"components": [
+            {"id": 1, "sanskrit_word": "देव", "english_transliteration": "deva"},
+            {"id": 2, "sanskrit_word": "आलय", "english_transliteration": "ālaya"},
+        ], "sandhi_count": 1},
+    ]
+
+    response: Response = client.get("/split/देवालय", params={"limit": 1})
+    assert len(response.json()) == 1
+
+
+def test_split_after_writes(client, sample_lexicon):
+    authorized_admin = sample_lexicon
+
+    response: Response = authorized_admin.put("/words/रथ", json={"sanskrit_word": "अरथ", "english_transliteration": "aratha"})
+    assert response.status_code == 204
+
+    response: Response = client.get("/split/मनोरथ")
+    assert response.json() == []
+
+    response: Response = client.get("/split/देवारथ")
+    assert [component["sanskrit_word"] for component in response.json()[0]["components"]] == ["देव", "अरथ"]
+
+    response: Response = authorized_admin.delete("/words/देव")
+    assert response.status_code == 204
+
+    response: Response = client.get("/split/देवालय")
+    assert response.json() == []
+
+
+def test_split_too_long(client, sample_lexicon):
+    response: Response = client.get(f"/split/{'देव' * 30}")
+    assert response.status_code == 400
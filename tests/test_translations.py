@@ -0,0 +1,94 @@
+import pytest
+from fastapi import Response
+from app.config import settings
+
+
+@pytest.fixture
+def sample_translated_words(authorized_client, test_users):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for word in [
+        {"sanskrit_word": "स्वर्ग", "english_transliteration": "svarga"},
+        {"sanskrit_word": "नाक", "english_transliteration": "nāka"},
+    ]:
+        response: Response = authorized_admin.post("/words", json=word)
+        assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/svarga/meanings", json={"meaning": "heaven"})
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/nāka/meanings", json={"meaning": "sky"})
+    assert response.status_code == 201
+
+    for word, meaning_id, translation in [
+        ("svarga", 1, {"language": "Kannada", "translation": "ಸ್ವರ್ಗಲೋಕ"}),
+        ("svarga", 1, {"language": "Hindi", "translation": "स्वर्गलोक "}),
+        ("svarga", 1, {"language": "English", "translation": "Paradise"}),
+        ("nāka", 2, {"language": "Kannada", "translation": "ಸ್ವರ್ಗ"}),
+        ("nāka", 2, {"language": "English", "translation": "Sky"}),
+    ]:
+        response: Response = authorized_admin.post(f"/words/{word}/{meaning_id}/translations", json=translation)
+        assert response.status_code == 201
+
+    return authorized_admin
+
+
+@pytest.mark.parametrize("lang, query, expected_words", [
+    ("kn", "ಸ್ವರ್ಗ", ["नाक", "स्वर्ग"]),
+    ("Kannada", "ಸ್ವರ್ಗಲೋ", ["स्वर्ग"]),
+    ("hi", "स्वर्गलोक", ["स्वर्ग"]),
+    ("en", "paradise.", ["स्वर्ग"]),
+    ("english", "S", ["नाक"]),
+    ("hi", "ಸ್ವರ್ಗ", []),
+    ("ta", "sky", []),
+])
+def test_lookup_translations(client, sample_translated_words, lang, query, expected_words):
+    response: Response = client.get("/translations/lookup", params={"lang": lang, "q": query})
+    assert response.status_code == 200
+    assert [result["sanskrit_word"] for result in response.json()] == expected_words
+
+
+def test_lookup_translations_output(client, sample_translated_words):
+    response: Response = client.get("/translations/lookup", params={"lang": "en", "q": "paradise"})
+    assert response.status_code == 200
+    assert response.json() == [{
+        "id": 1,
+        "sanskrit_word": "स्वर्ग",
+        "english_transliteration": "svarga",
+        "translations": [{"id": 3, "sanskrit_word_id": 1, "meaning_id": 1, "language": "English", "translation": "Paradise"}],
+    }]
+
+
+def test_lookup_translations_limit_capped(client, sample_translated_words, monkeypatch):
+    monkeypatch.setattr(settings, "search_max_page_size", 1)
+
+    response: Response = client.get("/translations/lookup", params={"lang": "kn", "q": "ಸ್ವರ್ಗ", "limit": 1000})
+    assert [result["sanskrit_word"] for result in response.json()] == ["नाक"]
+
+    response: Response = client.get("/translations/lookup", params={"lang": "kn", "q": "ಸ್ವರ್ಗ", "limit": -1})
+    assert [result["sanskrit_word"] for result in response.json()] == ["नाक"]
+
+
+def test_lookup_translations_after_writes(client, sample_translated_words):
+    authorized_admin = sample_translated_words
+
+    response: Response = authorized_admin.put("/words/svarga/1/translations/3", json={"language": "English", "translation": "Heaven"})
+    assert response.status_code == 204
+
+    response: Response = client.get("/translations/lookup", params={"lang": "en", "q": "paradise"})
+    assert response.json() == []
+
+    response: Response = client.get("/translations/lookup", params={"lang": "en", "q": "heaven"})
+    assert [result["sanskrit_word"] for result in response.json()] == ["स्वर्ग"]
+
+    response: Response = authorized_admin.delete("/words/nāka/2/translations")
+    assert response.status_code == 204
+
+    response: Response = client.get("/translations/lookup", params={"lang": "kn", "q": "ಸ್ವರ್ಗ"})
+    assert [result["sanskrit_word"] for result in response.json()] == ["स्वर्ग"]
+
+    response: Response = authorized_admin.delete("/words/svarga")
+    assert response.status_code == 204
+
+    response: Response = client.get("/translations/lookup", params={"lang": "kn", "q": "ಸ್ವರ್ಗ"})
+    assert response.json() == []
@@ -1,5 +1,6 @@
 import pytest
 from fastapi import Response
+from app import models
 
 
 @pytest.mark.parametrize("user_role, expected_status_code", [
@@ -134,4 +135,37 @@ def test_delete_meanings(authorized_client, test_users, user_role, expected_stat
     if response.status_code == 204:
         response: Response = authorized_user.get("/words/svarga/meanings")
         assert response.status_code == 200
-        assert len(response.json()) == 0
\ No newline at end of file
+        assert len(response.json()) == 0
+
+def test_delete_meaning_cascades(authorized_client, test_users, client, session, sample_word_input, sample_meaning_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    response: Response = authorized_admin.post("/words", json=sample_word_input)
+    assert response.status_code == 201
+
+    for _ in range(2):
+        response: Response = authorized_admin.post("/words/svarga/meanings", json=sample_meaning_input)
+        assert response.status_code == 201
+    for meaning_id in (1, 2):
+        response: Response = authorized_admin.post(f"/words/svarga/{meaning_id}/translations", json={"language": "English", "translation": "heaven"})
+        assert response.status_code == 201
+    response: Response = authorized_admin.post("/words/svarga/1/synonyms", json={"synonym": "नाक"})
+    assert response.status_code == 201
+    assert client.get("/words/counts").json()["translations"] == 2
+
+    response: Response = authorized_admin.delete("/words/svarga/meanings/1")
+    assert response.status_code == 204
+
+    assert session.query(models.Synonym).count() == 0
+    assert session.query(models.Translation.meaning_id).all() == [(2,)]
+    counts = client.get("/words/counts").json()
+    assert (counts["meanings"], counts["translations"], counts["synonyms"]) == (1, 1, 0)
+    response: Response = client.get("/translations/lookup", params={"lang": "english", "q": "heaven"})
+    assert [translation["meaning_id"] for result in response.json() for translation in result["translations"]] == [2]
+
+    response: Response = authorized_admin.delete("/words/svarga/meanings")
+    assert response.status_code == 204
+
+    assert session.query(models.Translation).count() == 0
+    counts = client.get("/words/counts").json()
+    assert (counts["meanings"], counts["translations"]) == (0, 0)
@@ -82,6 +82,32 @@ def test_get_synonym(authorized_client, test_users, client, sample_word_input, s
     assert response.json() == sample_synonym_output
 
 
+def test_get_synonyms_after_write(authorized_client, test_users, client, sample_word_input, sample_meaning_input, sample_synonym_input):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    response: Response = authorized_admin.post("/words", json=sample_word_input)
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/svarga/meanings", json=sample_meaning_input)
+    assert response.status_code == 201
+
+    response: Response = authorized_admin.post("/words/svarga/1/synonyms", json=sample_synonym_input)
+    assert response.status_code == 201
+
+    assert client.get("/words/svarga/1/synonyms/1").json()["synonym"] == "त्रिदिव"
+
+    response: Response = authorized_admin.put("/words/svarga/1/synonyms/1", json={"synonym": "सुरलोक"})
+    assert response.status_code == 204
+
+    assert client.get("/words/svarga/1/synonyms/1").json()["synonym"] == "सुरलोक"
+    assert [synonym["synonym"] for synonym in client.get("/words/svarga/1/synonyms").json()] == ["सुरलोक"]
+
+    response: Response = authorized_admin.delete("/words/svarga/1/synonyms/1")
+    assert response.status_code == 204
+
+    assert client.get("/words/svarga/1/synonyms/1").status_code == 404
+    assert client.get("/words/svarga/1/synonyms").json() == []
+
 
 @pytest.mark.parametrize("user_role, expected_status_code", [
     ("superuser", 204),
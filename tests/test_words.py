@@ -1,5 +1,9 @@
 import pytest
 from fastapi import Response
+from sqlalchemy import event
+from app import models
+from app.config import settings
+from app.routers import words
 
 
 @pytest.fixture
@@ -48,6 +52,25 @@ def test_get_words_total_count(authorized_client, test_users, client, sample_inp
     assert response.json() == 1
 
 
+def test_get_words_cache_invalidated_on_write(authorized_client, test_users, client, sample_input_data):
+    authorized_editor = authorized_client(test_users["editor_all"])
+
+    assert client.get("/words/total-count").json() == 0
+    assert client.get("/words").json() == []
+
+    response: Response = authorized_editor.post("/words", json=sample_input_data)
+    assert response.status_code == 201
+
+    assert client.get("/words/total-count").json() == 1
+    assert [word["english_transliteration"] for word in client.get("/words").json()] == ["svarga"]
+
+    response: Response = authorized_editor.post(f"/words/{sample_input_data['sanskrit_word']}/meanings", json={"meaning": "heaven"})
+    assert response.status_code == 201
+
+    assert client.get(f"/words/{sample_input_data['sanskrit_word']}").json()["meaning_ids"] == [1]
+    assert client.get("/words").json()[0]["meaning_ids"] == [1]
+
+
 def test_get_word(authorized_client, test_users, client, sample_input_data, sample_output_data):
     authorized_editor = authorized_client(test_users["editor_all"])
     response: Response = authorized_editor.post("/words", json=sample_input_data)
@@ -60,6 +83,424 @@ def test_get_word(authorized_client, test_users, client, sample_input_data, samp
     assert response.json() == sample_output_data
 
 
+@pytest.fixture
+def sample_words_with_meanings(authorized_client, test_users):
+    authorized_admin = authorized_client(test_users["admin"])
+
+    for sanskrit_word, meanings in [("स्वर्ग", 2), ("अग्नि", 1), ("नाक", 0), ("मनस्", 1)]:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word})
+        assert response.status_code == 201
+        for _ in range(meanings):
+            response: Response = authorized_admin.post(f"/words/{sanskrit_word}/meanings", json={"meaning": "test"})
+            assert response.status_code == 201
+
+    return authorized_admin
+
+
+def test_get_words_single_meaning_query(client, session, sample_words_with_meanings):
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.get("/words")
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert [(word["sanskrit_word"], word["meaning_ids"]) for word in response.json()] == [
+        ("अग्नि", [3]), ("नाक", []), ("मनस्", [4]), ("स्वर्ग", [1, 2]),
+    ]
+    assert len(statements) == 2
+
+
+def test_get_words_paginated(client, sample_words_with_meanings):
+    response: Response = client.get("/words", params={"limit": 2})
+    assert response.status_code == 200
+    assert [word["sanskrit_word"] for word in response.json()] == ["अग्नि", "नाक"]
+
+    response: Response = client.get("/words", params={"limit": 2, "after": "नाक"})
+    assert [(word["sanskrit_word"], word["meaning_ids"]) for word in response.json()] == [("मनस्", [4]), ("स्वर्ग", [1, 2])]
+
+    response: Response = client.get("/words", params={"limit": 2, "after": "स्वर्ग"})
+    assert response.json() == []
+
+
+def test_get_words_stream(client, sample_words_with_meanings, monkeypatch):
+    monkeypatch.setattr(words, "STREAM_BATCH_SIZE", 3)
+
+    response: Response = client.get("/words", params={"stream": True})
+    assert response.status_code == 200
+    assert response.json() == client.get("/words").json()
+
+    response: Response = client.get("/words", params={"stream": True, "after": "मनस्"})
+    assert [word["sanskrit_word"] for word in response.json()] == ["स्वर्ग"]
+
+
+def test_browse_words(client, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    for sanskrit_word in ["कक", "क्क", "आकाश", "अंश"]:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word})
+        assert response.status_code == 201
+
+    response: Response = client.get("/words/browse", params={"limit": 3})
+    assert response.status_code == 200
+    assert [(word["sanskrit_word"], word["meaning_ids"]) for word in response.json()] == [("अंश", []), ("अग्नि", [3]), ("आकाश", [])]
+
+    response: Response = client.get("/words/browse", params={"after": "आकाश"})
+    assert [word["sanskrit_word"] for word in response.json()] == ["कक", "क्क", "नाक", "मनस्", "स्वर्ग"]
+
+    response: Response = client.get("/words/browse", params={"after": "क", "limit": 2})
+    assert [word["sanskrit_word"] for word in response.json()] == ["कक", "क्क"]
+
+    response: Response = authorized_admin.put("/words/नाक", json={"sanskrit_word": "अनाक"})
+    assert response.status_code == 204
+    response: Response = client.get("/words/browse", params={"limit": 3})
+    assert [word["sanskrit_word"] for word in response.json()] == ["अंश", "अग्नि", "अनाक"]
+
+
+def test_get_word_entry(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    children = [
+        ("etymologies", {"etymology": "स्वः गच्छति"}),
+        ("derivations", {"derivation": "गम्लृ गतौ इति धातोः"}),
+        ("translations", {"language": "English", "translation": "heaven"}),
+        ("nyaya-text-references", {"source": "न्यायसूत्र", "description": "1.1.1"}),
+        ("examples", {"example_sentence": "स्वर्गं गच्छति", "applicable_modern_context": "goes to heaven"}),
+        ("synonyms", {"synonym": "नाक"}),
+        ("antonyms", {"antonym": "नरक"}),
+    ]
+    for path, payload in children:
+        response: Response = authorized_admin.post(f"/words/स्वर्ग/2/{path}", json=payload)
+        assert response.status_code == 201
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.get("/words/स्वर्ग/entry")
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    # The word itself is already resolved (and cached) by the writes above; its revision is read for the validators.
+    assert response.status_code == 200
+    assert len(statements) == 2
+
+    entry = response.json()
+    assert (entry["id"], entry["sanskrit_word"], entry["english_transliteration"]) == (1, "स्वर्ग", "svarga")
+    assert [meaning["id"] for meaning in entry["meanings"]] == [1, 2]
+    assert all(meaning[section] == [] for meaning in entry["meanings"][:1] for section in ("etymologies", "antonyms"))
+
+    meaning = entry["meanings"][1]
+    assert meaning["meaning"] == "test"
+    assert meaning["etymologies"] == [{"id": 1, "sanskrit_word_id": 1, "meaning_id": 2, "etymology": "स्वः गच्छति"}]
+    assert meaning["translations"] == [{"id": 1, "sanskrit_word_id": 1, "meaning_id": 2, "language": "English", "translation": "heaven"}]
+    assert meaning["nyaya_text_references"] == [{"id": 1, "sanskrit_word_id": 1, "meaning_id": 2, "source": "न्यायसूत्र", "description": "1.1.1"}]
+    assert meaning["examples"][0]["applicable_modern_context"] == "goes to heaven"
+    assert [row["synonym"] for row in meaning["synonyms"]] == ["नाक"]
+    assert [row["antonym"] for row in meaning["antonyms"]] == ["नरक"]
+
+    response: Response = authorized_admin.delete("/words/स्वर्ग/2/synonyms/1")
+    assert response.status_code == 204
+    assert client.get("/words/svarga/entry").json()["meanings"][1]["synonyms"] == []
+
+
+def test_get_word_conditional(client, session, sample_words_with_meanings):
+    response: Response = client.get("/words/svarga/entry")
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+    assert etag == '"1-3"'
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.get("/words/svarga/entry", headers={"If-None-Match": etag})
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 0
+
+    response: Response = client.get("/words/svarga/entry", headers={"If-None-Match": '"1-2", W/' + etag})
+    assert response.status_code == 304
+    response: Response = client.get("/words/svarga/entry", headers={"If-None-Match": '"1-2"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    response: Response = client.get("/words/svarga", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("path", ["/words/svarga", "/words/svarga/meanings", "/words/svarga/2/synonyms", "/words/svarga/entry"])
+def test_get_word_conditional_after_write(client, sample_words_with_meanings, path):
+    authorized_admin = sample_words_with_meanings
+
+    etag = client.get(path).headers["ETag"]
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    response: Response = authorized_admin.post("/words/svarga/2/synonyms", json={"synonym": "नाक"})
+    assert response.status_code == 201
+
+    response: Response = client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_get_word_entry_not_found(client, sample_words_with_meanings):
+    response: Response = client.get("/words/svagra/entry")
+    assert response.status_code == 404
+    assert response.json()["suggestions"] == [["स्वर्ग", "svarga"]]
+
+
+def test_get_word_entries_batch(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    response: Response = authorized_admin.post("/words/मनस्/4/synonyms", json={"synonym": "चित्त"})
+    assert response.status_code == 201
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.post("/words/batch", json={"words": ["स्वर्ग", "manas", "agnI", "नरक"], "ids": [3, 1]})
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert len(statements) == 2
+
+    entries = response.json()
+    assert list(entries) == ["स्वर्ग", "अग्नि", "नाक", "मनस्"]
+    assert [meaning["id"] for meaning in entries["स्वर्ग"]["meanings"]] == [1, 2]
+    assert entries["नाक"]["meanings"] == []
+    assert entries["मनस्"]["meanings"][0]["synonyms"] == [{"id": 1, "sanskrit_word_id": 4, "meaning_id": 4, "synonym": "चित्त"}]
+    assert entries["मनस्"] == client.get("/words/मनस्/entry").json()
+
+
+def test_get_word_entries_batch_limits(client, sample_words_with_meanings, monkeypatch):
+    response: Response = client.post("/words/batch", json={})
+    assert response.status_code == 200
+    assert response.json() == {}
+
+    monkeypatch.setattr(settings, "words_batch_max_size", 2)
+    response: Response = client.post("/words/batch", json={"words": ["स्वर्ग", "नाक"], "ids": [1]})
+    assert response.status_code == 400
+
+
+def test_get_table_counts(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    response: Response = authorized_admin.post("/words/svarga/1/synonyms", json={"synonym": "नाक"})
+    assert response.status_code == 201
+
+    response: Response = client.get("/words/counts")
+    assert response.status_code == 200
+    assert response.json() == {
+        "sanskrit_words": 4, "meanings": 4, "etymologies": 0, "derivations": 0, "translations": 0,
+        "reference_nyaya_texts": 0, "examples": 0, "synonyms": 1, "antonyms": 0,
+    }
+
+    response: Response = authorized_admin.delete("/words/अग्नि/meanings/3")
+    assert response.status_code == 204
+    response: Response = authorized_admin.delete("/words/स्वर्ग")
+    assert response.status_code == 204
+
+    counts = client.get("/words/counts").json()
+    assert (counts["sanskrit_words"], counts["meanings"], counts["synonyms"]) == (3, 1, 0)
+
+
+def test_get_words_total_count_maintained(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    statements = []
+
+    def count_statement(_, __, statement, *___):
+        statements.append(statement)
+
+    def read(url):
+        del statements[:]
+        event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+        try:
+            return client.get(url).json()
+        finally:
+            event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    # The counts are seeded when the table is created and adjusted by every write, so reads neither compute nor store them.
+    assert read("/words/counts")["sanskrit_words"] == 4
+    assert all(statement.lstrip().upper().startswith("SELECT") for statement in statements)
+    assert not any("count(" in statement.lower() for statement in statements)
+
+    response: Response = authorized_admin.post("/words", json={"sanskrit_word": "लोक"})
+    assert response.status_code == 201
+
+    assert read("/words/total-count") == 5
+    assert not any("count(" in statement.lower() for statement in statements)
+
+
+def test_word_resolver_cached(client, session, sample_words_with_meanings):
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    assert client.get("/words/svarga/meanings/2").status_code == 200
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.get("/words/svarga")
+        assert response.json()["meaning_ids"] == [1, 2]
+        assert client.get("/words/svarga/2/synonyms").status_code == 200
+        assert client.get("/words/svarga/meanings/2").status_code == 200
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    # Only the synonyms themselves are queried; the word and its meaning are resolved from the cache.
+    assert len(statements) == 1
+
+
+def test_word_resolver_checks_meaning(client, sample_words_with_meanings):
+    response: Response = client.get("/words/svarga/3/synonyms")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Meaning - 3 not found"
+
+    response: Response = sample_words_with_meanings.post("/words/svarga/3/synonyms", json={"synonym": "नाक"})
+    assert response.status_code == 404
+
+
+def test_word_resolver_invalidated_on_write(client, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    assert client.get("/words/nāka/meanings").json() == []
+
+    response: Response = authorized_admin.post("/words/nāka/meanings", json={"meaning": "heaven"})
+    assert response.status_code == 201
+    assert client.get("/words/nāka/5/synonyms").status_code == 200
+
+    response: Response = authorized_admin.put("/words/nāka", json={"sanskrit_word": "नाकम्"})
+    assert response.status_code == 204
+    assert client.get("/words/नाक/meanings").status_code == 404
+    assert client.get("/words/नाकम्").json()["meaning_ids"] == [5]
+
+    response: Response = authorized_admin.delete("/words/नाकम्/meanings/5")
+    assert response.status_code == 204
+    assert client.get("/words/नाकम्/5/synonyms").status_code == 404
+
+    response: Response = authorized_admin.delete("/words/नाकम्")
+    assert response.status_code == 204
+    assert client.get("/words/नाकम्/meanings").status_code == 404
+
+
+@pytest.mark.parametrize("word", ["svarga", "svargA", "ಸ್ವರ್ಗ"])
+def test_get_word_any_scheme(authorized_client, test_users, client, word):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "स्वर्ग", "english_transliteration": "svarg"})
+    assert response.status_code == 201
+
+    response: Response = client.get(f"/words/{word}")
+    assert response.status_code == 200
+    assert response.json()["sanskrit_word"] == "स्वर्ग"
+
+
+@pytest.mark.parametrize("word", ["svarga", "svargA", "ಸ್ವರ್ಗ"])
+def test_get_word_children_any_scheme(authorized_client, test_users, client, word):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "स्वर्ग", "english_transliteration": "svarg"})
+    assert response.status_code == 201
+
+    response: Response = authorized_editor.post(f"/words/{word}/meanings", json={"meaning": "heaven"})
+    assert response.status_code == 201
+
+    for path in ["meanings", "1/etymologies", "1/derivations", "1/translations", "1/nyaya-text-references", "1/examples", "1/synonyms", "1/antonyms"]:
+        response: Response = client.get(f"/words/{word}/{path}")
+        assert response.status_code == 200, path
+
+    # A word created later whose transliteration is the segment takes it over from the search key match.
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "स्वर्गः", "english_transliteration": word})
+    assert response.status_code == 201
+    assert client.get(f"/words/{word}/meanings").json() == []
+
+
+@pytest.mark.parametrize("word", ["सङ्कल्प", "संकल्प", "स\u200dङ्कल्प", "saṃkalpa", "sam\u0323kalpa"])
+def test_get_word_normalized(authorized_client, test_users, client, word):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "संकल्प", "english_transliteration": "sam\u0323kalpa"})
+    assert response.status_code == 201
+
+    response: Response = client.get(f"/words/{word}")
+    assert response.status_code == 200
+    assert response.json()["sanskrit_word"] == "सङ्कल्प"
+    assert response.json()["english_transliteration"] == "saṃkalpa"
+
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": word if word.startswith("स") else "सङ्कल्प"})
+    assert response.status_code == 409
+
+
+@pytest.mark.parametrize("word", ["saṃkalpa", "saMkalpa", "samkalpa", "SAMKALPA"])
+def test_get_word_transliterated_anusvara(authorized_client, test_users, client, word):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "सङ्कल्प", "english_transliteration": "saṅkalpa"})
+    assert response.status_code == 201
+
+    response: Response = client.get(f"/words/{word}")
+    assert response.status_code == 200
+    assert response.json()["sanskrit_word"] == "सङ्कल्प"
+
+    response: Response = client.get(f"/search/{word}")
+    assert response.json()["results"] == [["सङ्कल्प", "saṅkalpa"]]
+
+    response: Response = client.post("/search/batch", json={"terms": [word]})
+    assert response.json()[0]["exact"] is True
+    assert [match["sanskrit_word"] for match in response.json()[0]["matches"]] == ["सङ्कल्प"]
+
+
+def test_get_word_upper_case(authorized_client, test_users, client):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "न्याय", "english_transliteration": "nyāya"})
+    assert response.status_code == 201
+
+    response: Response = client.get("/words/NYAYA")
+    assert response.status_code == 200
+    assert response.json()["sanskrit_word"] == "न्याय"
+
+
+def test_get_word_anusvara_before_unclassed_letter(authorized_client, test_users, client):
+    authorized_editor = authorized_client(test_users["editor_all"])
+
+    # ऩ lies in the range of the stops but has no class nasal, so the anusvara before it is kept.
+    response: Response = client.get("/words/कंऩ")
+    assert response.status_code == 404
+
+    response: Response = authorized_editor.post("/words", json={"sanskrit_word": "कंऩ", "english_transliteration": "kaṃna"})
+    assert response.status_code == 201
+
+    response: Response = client.get("/words/कंऩ")
+    assert response.status_code == 200
+    assert response.json()["sanskrit_word"] == "कंऩ"
+
+
+def test_get_word_not_found_suggestions(authorized_client, test_users, client, sample_input_data):
+    authorized_editor = authorized_client(test_users["editor_all"])
+    response: Response = authorized_editor.post("/words", json=sample_input_data)
+    assert response.status_code == 201
+
+    response: Response = client.get("/words/svagra")
+    assert response.status_code == 404
+    assert response.json()["suggestions"] == [["स्वर्ग", "svarga"]]
+
+
 @pytest.mark.parametrize("user_role, expected_status_code", [
     ("superuser", 204),
     ("admin", 204),
@@ -104,4 +545,126 @@ def test_delete_word(authorized_client, user_role, test_users, sample_input_data
 
     if expected_status_code == 204:
         response: Response = authorized_user.get(f"/words/{sample_input_data['sanskrit_word']}")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+def test_delete_words(authorized_client, test_users, client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    response: Response = authorized_admin.post("/words/svarga/2/synonyms", json={"synonym": "नाक"})
+    assert response.status_code == 201
+    assert client.get("/words/counts").json()["synonyms"] == 1
+
+    response: Response = authorized_client(test_users["editor_read_write_modify"]).request("DELETE", "/words/", json={"words": ["स्वर्ग"]})
+    assert response.status_code == 403
+
+    response: Response = authorized_admin.request("DELETE", "/words/", json={"words": ["स्वर्ग", "agni", "नरक"]})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Words - नरक not found"
+    assert client.get("/words/total-count").json() == 4
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = authorized_admin.request("DELETE", "/words/", json={"words": ["स्वर्ग", "agni"]})
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert response.status_code == 204
+    # The user and word lookups, the count of the cascaded rows, one DELETE for both words and their rows, and the
+    # updates of the maintained counts of the three tables that changed.
+    assert len(statements) == 8
+    assert [word["sanskrit_word"] for word in client.get("/words").json()] == ["नाक", "मनस्"]
+    assert session.query(models.Meaning.id).all() == [(4,)]
+    assert session.query(models.Synonym).count() == 0
+    counts = client.get("/words/counts").json()
+    assert (counts["sanskrit_words"], counts["meanings"], counts["synonyms"]) == (2, 1, 0)
+    assert client.get("/words/svarga/2/synonyms").status_code == 404
+
+
+def test_get_random_word(client, session, sample_words_with_meanings):
+    entries = {client.get("/words/random").json()["sanskrit_word"] for _ in range(50)}
+    assert entries == {"स्वर्ग", "अग्नि", "नाक", "मनस्"}
+
+    response: Response = client.get("/words/random")
+    assert response.headers["Cache-Control"] == "no-store"
+    assert response.json() == client.get(f"/words/{response.json()['sanskrit_word']}/entry").json()
+
+    response: Response = sample_words_with_meanings.request("DELETE", "/words/", json={"words": ["स्वर्ग", "अग्नि", "नाक"]})
+    assert response.status_code == 204
+    assert {client.get("/words/random").json()["sanskrit_word"] for _ in range(10)} == {"मनस्"}
+
+
+def test_get_random_word_empty(client):
+    assert client.get("/words/random").status_code == 404
+    assert client.get("/words/of-the-day").status_code == 404
+
+
+def test_get_word_of_the_day(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    response: Response = client.get("/words/of-the-day")
+    assert response.status_code == 200
+    assert 0 < int(response.headers["Cache-Control"].removeprefix("public, max-age=")) <= 24 * 60 * 60
+    word = response.json()["sanskrit_word"]
+    assert response.json() == client.get(f"/words/{word}/entry").json()
+
+    response: Response = authorized_admin.post("/words", json={"sanskrit_word": "लोक"})
+    assert response.status_code == 201
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        assert client.get("/words/of-the-day").json()["sanskrit_word"] == word
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+    assert len(statements) == 0
+
+    response: Response = authorized_admin.post(f"/words/{word}/meanings", json={"meaning": "renamed"})
+    assert response.status_code == 201
+    assert client.get("/words/of-the-day").json()["meanings"][-1]["meaning"] == "renamed"
+
+
+def test_get_word_neighbors(client, session, sample_words_with_meanings):
+    authorized_admin = sample_words_with_meanings
+
+    for sanskrit_word in ["कक", "क्क", "आकाश", "अंश"]:
+        response: Response = authorized_admin.post("/words", json={"sanskrit_word": sanskrit_word})
+        assert response.status_code == 201
+
+    statements = []
+
+    def count_statement(*_):
+        statements.append(None)
+
+    event.listen(session.get_bind(), "before_cursor_execute", count_statement)
+    try:
+        response: Response = client.get("/words/कक/neighbors", params={"n": 2})
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", count_statement)
+
+    assert response.status_code == 200
+    assert [word["sanskrit_word"] for word in response.json()["before"]] == ["अग्नि", "आकाश"]
+    assert [word["sanskrit_word"] for word in response.json()["after"]] == ["क्क", "नाक"]
+    # The lookup of the word, then one bounded range query on each side.
+    assert len(statements) == 3
+
+    response: Response = client.get("/words/अंश/neighbors")
+    assert response.json()["before"] == []
+    assert [word["sanskrit_word"] for word in response.json()["after"]] == ["अग्नि", "आकाश", "कक", "क्क", "नाक"]
+
+    response: Response = authorized_admin.delete("/words/क्क")
+    assert response.status_code == 204
+    response: Response = client.get("/words/kaka/neighbors", params={"n": 1})
+    assert response.json()["after"] == [{"id": 3, "sanskrit_word": "नाक", "english_transliteration": "nāka"}]
+
+    response: Response = client.get("/words/svagra/neighbors")
+    assert response.status_code == 404
+    assert response.json()["suggestions"] == [["स्वर्ग", "svarga"]]